@@ -0,0 +1,212 @@
+import bisect
+import itertools
+import time
+
+
+def linear(t):
+    return t
+
+
+def ease_in(t):
+    return t * t
+
+
+def ease_out(t):
+    return 1 - (1 - t) * (1 - t)
+
+
+def ease_in_out(t):
+    return 3 * t * t - 2 * t * t * t
+
+
+class Timeline:
+    # A cancellable set of keyframe events and tweens laid out on a local clock
+    # (seconds). The scheduler advances it in fixed timesteps.
+    def __init__(self, name=None):
+        self.name = name
+        self.elapsed = 0.0
+        self.duration = 0.0
+        self.finished = False
+        self.cancelled = False
+        self._events = []
+        self._next_event = 0
+        self._tweens = []
+        self._tracks = []
+        self._order = itertools.count()
+        self._finish_callbacks = []
+        self._cancel_callbacks = []
+
+    def at(self, t, callback):
+        bisect.insort(self._events, (t, next(self._order), callback))
+        self.duration = max(self.duration, t)
+        return self
+
+    def every(self, start, interval, count, callback):
+        for i in range(count):
+            self.at(start + i * interval, lambda i=i: callback(i))
+        return self
+
+    def tween(self, start, duration, update, easing=linear):
+        self._tweens.append([start, duration, update, easing, False])
+        self.duration = max(self.duration, start + duration)
+        return self
+
+    def during(self, start, duration, update):
+        # update(dt) is called once per fixed step while the track is active.
+        self._tracks.append((start, duration, update))
+        self.duration = max(self.duration, start + duration)
+        return self
+
+    def on_finish(self, callback):
+        self._finish_callbacks.append(callback)
+        return self
+
+    def on_cancel(self, callback):
+        self._cancel_callbacks.append(callback)
+        return self
+
+    @property
+    def done(self):
+        return self.finished or self.cancelled
+
+    def cancel(self):
+        if self.done:
+            return
+        self.cancelled = True
+        for callback in self._cancel_callbacks:
+            callback()
+
+    def advance(self, dt):
+        if self.done:
+            return
+        self.elapsed += dt
+        while self._next_event < len(self._events) and self._events[self._next_event][0] <= self.elapsed:
+            callback = self._events[self._next_event][2]
+            self._next_event += 1
+            callback()
+            if self.cancelled:
+                return
+        for tween in self._tweens:
+            start, duration, update, easing, complete = tween
+            if complete or self.elapsed < start:
+                continue
+            progress = 1.0 if duration <= 0 else min(1.0, (self.elapsed - start) / duration)
+            update(easing(progress))
+            if progress >= 1.0:
+                tween[4] = True
+            if self.cancelled:
+                return
+        for start, duration, update in self._tracks:
+            if start <= self.elapsed and self.elapsed - dt < start + duration:
+                update(dt)
+                if self.cancelled:
+                    return
+        if self.elapsed >= self.duration and self._next_event >= len(self._events):
+            self.finished = True
+            for callback in self._finish_callbacks:
+                callback()
+
+
+class FrameScheduler:
+    # Drives every animation from the Tk main loop with root.after: real time is
+    # accumulated and consumed in fixed `timestep` slices, frames are capped at
+    # `fps`, and catch-up steps stop once a frame exceeds `frame_budget` seconds.
+    def __init__(self, root, fps=60, timestep=None, frame_budget=None, max_catchup=5):
+        self.root = root
+        self.fps = fps
+        self.timestep = timestep or 1.0 / fps
+        self.frame_budget = frame_budget or 0.8 / fps
+        self.max_catchup = max_catchup
+        self.timelines = []
+        self.frame_callbacks = []
+        self._after_id = None
+        self._ticking = False
+        self._last = None
+        self._accumulator = 0.0
+        self.stats = {
+            "frames": 0,
+            "steps": 0,
+            "dropped_steps": 0,
+            "over_budget": 0,
+            "last_frame_ms": 0.0,
+        }
+
+    def set_fps(self, fps):
+        self.fps = fps
+
+    def play(self, timeline):
+        self.timelines.append(timeline)
+        self._ensure_running()
+        return timeline
+
+    def is_playing(self, name):
+        return any(t.name == name and not t.done for t in self.timelines)
+
+    def cancel(self, name):
+        for timeline in list(self.timelines):
+            if timeline is name or timeline.name == name:
+                timeline.cancel()
+        self.timelines = [t for t in self.timelines if not t.done]
+
+    def cancel_all(self):
+        for timeline in list(self.timelines):
+            timeline.cancel()
+        self.timelines = []
+
+    def add_frame_callback(self, callback):
+        self.frame_callbacks.append(callback)
+        self._ensure_running()
+
+    def remove_frame_callback(self, callback):
+        if callback in self.frame_callbacks:
+            self.frame_callbacks.remove(callback)
+
+    def stop(self):
+        self.cancel_all()
+        self.frame_callbacks = []
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _ensure_running(self):
+        if self._after_id is None and not self._ticking:
+            self._last = time.perf_counter()
+            self._accumulator = 0.0
+            self._after_id = self.root.after(int(1000 / self.fps), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self._ticking = True
+        try:
+            self._run_frame()
+        finally:
+            self._ticking = False
+        if self.timelines or self.frame_callbacks:
+            delay = max(1, int((1.0 / self.fps - self.stats["last_frame_ms"] / 1000) * 1000))
+            self._after_id = self.root.after(delay, self._tick)
+
+    def _run_frame(self):
+        frame_start = time.perf_counter()
+        self._accumulator = min(self._accumulator + frame_start - self._last,
+                                self.timestep * self.max_catchup)
+        self._last = frame_start
+
+        while self._accumulator >= self.timestep:
+            self._accumulator -= self.timestep
+            self.stats["steps"] += 1
+            for timeline in list(self.timelines):
+                timeline.advance(self.timestep)
+            self.timelines = [t for t in self.timelines if not t.done]
+            if time.perf_counter() - frame_start > self.frame_budget:
+                dropped = int(self._accumulator / self.timestep)
+                self.stats["dropped_steps"] += dropped
+                self.stats["over_budget"] += 1
+                self._accumulator -= dropped * self.timestep
+                break
+
+        for callback in list(self.frame_callbacks):
+            callback()
+
+        elapsed = time.perf_counter() - frame_start
+        self.stats["frames"] += 1
+        self.stats["last_frame_ms"] = elapsed * 1000
@@ -0,0 +1,117 @@
+"""Simulate many explorer sessions hitting the progress table at once.
+
+    python benchmarks/db_load_test.py --sessions 40 --ops 200
+    python benchmarks/db_load_test.py --mode per-call   # old connect-per-query behaviour
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+
+
+class PerCallPool:
+    # Mimics the original get_db_connection() usage: connect, query, close.
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+        self.stats = {"lock_wait": 0.0, "max_lock_wait": 0.0, "retries": 0, "busy_errors": 0}
+        self._lock = threading.Lock()
+
+    def run(self, work, write=False):
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            started = time.perf_counter()
+            result = work(conn)
+            if write:
+                conn.commit()
+                waited = time.perf_counter() - started
+                with self._lock:
+                    self.stats["lock_wait"] += waited
+                    self.stats["max_lock_wait"] = max(self.stats["max_lock_wait"], waited)
+            return result
+        finally:
+            conn.close()
+
+    def close(self):
+        self.closed = True
+
+
+def session(pool, user_id, ops, write_ratio, latencies, errors):
+    rng = random.Random(user_id)
+    progress = [0, 0, 0]
+    try:
+        database.load_progress(user_id, pool=pool)
+        for _ in range(ops):
+            started = time.perf_counter()
+            if rng.random() < write_ratio:
+                progress[rng.randrange(3)] += 1
+                database.save_progress(user_id, *progress, pool=pool)
+            else:
+                database.load_progress(user_id, pool=pool)
+            latencies.append(time.perf_counter() - started)
+    except sqlite3.Error as e:
+        errors.append(repr(e))
+
+
+def run(args):
+    path = args.db or os.path.join(tempfile.mkdtemp(prefix="nasa_load_"), "load.db")
+    if args.mode == "pool":
+        pool = database.ConnectionPool(path, size=args.pool_size)
+    else:
+        pool = PerCallPool(path)
+
+    setup = database.ConnectionPool(path, size=1)
+    database.create_tables(pool=setup)
+    user_ids = [database.create_user(f"load_user_{i}_{time.time_ns()}", "pw", pool=setup)
+                for i in range(args.sessions)]
+    setup.close()
+
+    latencies = []
+    errors = []
+    threads = [threading.Thread(target=session, args=(pool, uid, args.ops, args.write_ratio, latencies, errors))
+               for uid in user_ids]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    pool.close()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"mode:            {args.mode}")
+    print(f"database:        {path}")
+    print(f"sessions:        {args.sessions} x {args.ops} ops (write ratio {args.write_ratio:.0%})")
+    print(f"completed ops:   {total} in {elapsed:.2f}s")
+    print(f"throughput:      {total / elapsed:.0f} ops/s")
+    if total:
+        print(f"latency p50/p99: {latencies[total // 2] * 1000:.2f} / {latencies[int(total * 0.99)] * 1000:.2f} ms")
+    print(f"lock wait:       {pool.stats['lock_wait']:.3f}s total, {pool.stats['max_lock_wait'] * 1000:.1f} ms max")
+    print(f"busy retries:    {pool.stats['retries']} ({pool.stats['busy_errors']} busy errors)")
+    if errors:
+        print(f"failed sessions: {len(errors)} (first: {errors[0]})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=40)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--write-ratio", type=float, default=0.5)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--mode", choices=["pool", "per-call"], default="pool")
+    parser.add_argument("--db", help="database file to use (default: fresh temporary file)")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
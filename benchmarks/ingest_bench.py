@@ -0,0 +1,198 @@
+"""Fetch NASA-style feeds from a local stand-in server: cold, revalidated, partly changed and offline.
+
+    python benchmarks/ingest_bench.py --feeds 60 --latency 40 --workers 1 4 8
+
+The server answers conditional GETs with 304 when the ETag or Last-Modified
+still match and adds `--latency` ms to every response, like a distant API. For
+each worker count the feed client fetches every feed into an empty cache, then
+revalidates them all, then again after a third of them changed, then reads the
+cache with --offline. Last, the server is stopped and an online client falls
+back to the cache. The baseline fetches each feed with a bare requests.get() and
+no cache. Reported per pass: wall time, feeds per second, how each feed was
+served, bytes downloaded and the TCP connections the server saw.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import database
+import ingest
+from content import ContentCatalog
+
+
+class FeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, feeds, latency):
+        super().__init__(("127.0.0.1", 0), FeedHandler)
+        self.latency = latency
+        self.documents = {}
+        self.connections = 0
+        self.lock = threading.Lock()
+        for path, payload in feeds.items():
+            self.publish(path, payload)
+
+    def publish(self, path, payload):
+        body = json.dumps(payload).encode()
+        with self.lock:
+            version = self.documents.get(path, (None, None, 0))[2] + 1
+            self.documents[path] = (body, f'"{path}-{version}"', version)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/feeds/"
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse shows up
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        document = self.server.documents.get(self.path.removeprefix("/feeds/"))
+        if document is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body, etag, version = document
+        modified = formatdate(1_700_000_000 + version * 60, usegmt=True)
+        if self.headers.get("If-None-Match") == etag or (
+                "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since") == modified):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def planets(n, version=1):
+    names = ["Mercury", "Venus", "Earth", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune"]
+    return {"planets": [{"name": names[i % 8], "facts": [f"Fact {j} (v{version}, feed {n})" for j in range(40)]}
+                        for i in range(8)]}
+
+
+def make_feeds(count):
+    # The three real feeds, plus planet-shaped extras so there is enough to fetch in parallel.
+    feeds = {
+        "spacecraft.json": {"spacecraft": [{"id": "shuttle", "name": "Space Shuttle", "facts": ["Flew 135 missions"]},
+                                           {"id": "voyager", "name": "Voyager Probe", "facts": ["Still talking"]}]},
+        "planets.json": planets(0),
+        "launches.json": {"launches": [{"name": f"Launch {i}", "date": f"20{10 + i % 20}-01-01",
+                                        "summary": "Crewed flight"} for i in range(200)]},
+    }
+    for i in range(count - 3):
+        ingest.FEEDS[f"extra-{i}"] = (f"extra-{i}.json", ingest.planet_entries)
+        feeds[f"extra-{i}.json"] = planets(i + 1)
+    return feeds
+
+
+def timed(server, fetch):
+    connections = server.connections
+    started = time.perf_counter()
+    results = fetch()
+    return results, time.perf_counter() - started, server.connections - connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=40.0, help="ms added to every response")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    feeds = make_feeds(args.feeds)
+    server = FeedServer(feeds, args.latency / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    workdir = tempfile.mkdtemp()
+    pool = database.ConnectionPool(os.path.join(workdir, "bench.db"))
+    database.create_tables(pool)
+    catalog = ContentCatalog(pool=pool)
+    print(f"{len(feeds)} feeds, {sum(len(d[0]) for d in server.documents.values()) / 1e3:.0f} kB, "
+          f"{args.latency:g} ms latency\n")
+    print(f"{'pass':<28} {'ms':>7} {'feeds/s':>8} {'down':>5} {'304':>5} {'cache':>6} {'kB':>6} {'conns':>6}")
+
+    def report(name, elapsed, connections, stats):
+        print(f"{name:<28} {elapsed * 1000:>7.0f} {len(feeds) / elapsed:>8.1f} {stats.get('downloaded', 0):>5} "
+              f"{stats.get('not_modified', 0):>5} {stats.get('cache', 0):>6} {stats.get('bytes', 0) / 1e3:>6.0f} "
+              f"{connections:>6}")
+
+    def baseline():
+        size = 0
+        for path in feeds:
+            response = requests.get(server.url + path, timeout=5)
+            response.json()
+            size += len(response.content)
+        return size
+
+    size, elapsed, connections = timed(server, baseline)
+    report("requests.get, no cache", elapsed, connections, {"downloaded": len(feeds), "bytes": size})
+
+    try:
+        for workers in args.workers:
+            cache = os.path.join(workdir, f"cache-{workers}")
+            for path in list(feeds)[::3]:
+                server.publish(path, feeds[path])  # reset the versions a previous round changed
+            client = ingest.FeedClient(server.url, cache, workers=workers)
+            passes = [("cold", None), ("revalidate", None), ("a third changed", list(feeds)[1::3])]
+            for name, changed in passes:
+                for path in changed or []:
+                    server.publish(path, feeds[path] | {"changed": True})
+                before = dict(client.stats)
+                results, elapsed, connections = timed(server, client.fetch_all)
+                stats = {key: client.stats[key] - before[key] for key in client.stats}
+                report(f"{workers} workers, {name}", elapsed, connections, stats)
+            client.close()
+
+            offline = ingest.FeedClient(None, cache, workers=workers)
+            cached, elapsed, connections = timed(server, offline.fetch_all)
+            report(f"{workers} workers, offline", elapsed, connections, offline.stats)
+            assert all(cached[name][0] == results[name][0] for name in results), "offline copy differs"
+            offline.close()
+        server.shutdown()
+        server.server_close()
+        down = ingest.FeedClient(server.url, cache, workers=workers)
+        cached, elapsed, connections = timed(server, down.fetch_all)
+        report(f"{workers} workers, server down", elapsed, connections, down.stats)
+        down.close()
+        entries = ingest.content_entries(cached, catalog)
+        print(f"\nserved from the cache with the server down: {sum(source == 'cache' for _, source in cached.values())}"
+              f"/{len(cached)} feeds ({down.stats['errors']} failed requests), {len(entries)} content entries")
+        catalog.update(entries)
+        reopened = ContentCatalog(pool=pool)  # the startup seed must not roll the feed rows back
+        latest = {(e["kind"], e["key"]): e["body"] for e in entries}
+        assert all(reopened.get(*key)["body"] == body for key, body in latest.items()), "feed rows reseeded"
+    finally:
+        server.shutdown()
+        server.server_close()
+        pool.close()
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
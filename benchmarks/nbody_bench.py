@@ -0,0 +1,83 @@
+"""Measure belt simulation throughput in worker processes and what it costs the UI thread.
+
+    python benchmarks/nbody_bench.py --bodies 5500 20000 100000 --workers 1 2 4
+
+For each body count, one leapfrog step is first timed in-process: this is what
+every frame would cost the Tk thread if physics ran there. Then the workers run
+while this process plays the UI at 60 frames per second, advancing the target
+time at --warp days per second and reading each frame from shared memory. It
+reports integration steps per second across all workers, how far the simulation
+lags the target, and the per-frame read time the UI pays.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PLANETS = [
+    {"name": "Mercury", "color": "gray", "size": 15, "distance": 50},
+    {"name": "Venus", "color": "orange", "size": 20, "distance": 80},
+    {"name": "Earth", "color": "blue", "size": 22, "distance": 120},
+    {"name": "Mars", "color": "red", "size": 19, "distance": 170},
+    {"name": "Jupiter", "color": "sandybrown", "size": 35, "distance": 240},
+    {"name": "Saturn", "color": "gold", "size": 30, "distance": 300},
+    {"name": "Uranus", "color": "lightblue", "size": 25, "distance": 350},
+    {"name": "Neptune", "color": "royalblue", "size": 24, "distance": 400},
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bodies", type=int, nargs="+", default=[5500, 20000, 100000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--warp", type=float, default=365.0, help="simulated days per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    import numpy as np
+    from nbody import MAX_STEP, BeltIntegrator, BeltSimulation
+    from orbits import DAYS_PER_YEAR
+    from solar_view import SolarSystem
+
+    print(f"{os.cpu_count()} CPUs; {args.warp:g} days/s needs "
+          f"{args.warp / DAYS_PER_YEAR / MAX_STEP:.0f} steps/s to keep up")
+    print(f"{'bodies':>7} {'workers':>7} {'in-process step ms':>19} {'steps/s':>8} {'lag days':>9} "
+          f"{'frames':>7} {'read us p50':>12} {'read us max':>12}")
+    for count in args.bodies:
+        system = SolarSystem(PLANETS, belt_counts=(count * 8 // 11, count - count * 8 // 11))
+        planets = [p["name"] for p in PLANETS]
+        position = system.belt_au[:, None] * np.column_stack((np.cos(system.belt_phase), -np.sin(system.belt_phase)))
+        velocity = position[:, ::-1] * (1, -1) * system.belt_omega[:, None]
+        integrator = BeltIntegrator(position, velocity, 0.0, planets, system.log_au, system.planet_world)
+        started = time.perf_counter()
+        integrator.advance(20 * MAX_STEP)
+        step_ms = (time.perf_counter() - started) / integrator.steps * 1000
+
+        for workers in args.workers:
+            simulation = BeltSimulation(system, 0.0, workers)
+            while simulation.read() is None:
+                time.sleep(0.01)
+            years, reads, frames = 0.0, [], set()
+            started = time.perf_counter()
+            deadline = started + args.seconds
+            while time.perf_counter() < deadline:
+                tick = time.perf_counter()
+                years += args.warp / DAYS_PER_YEAR / 60
+                simulation.set_target(years)
+                simulation.read()
+                reads.append(time.perf_counter() - tick)
+                frames.add(simulation.frame_number)
+                time.sleep(max(0.0, tick + 1 / 60 - time.perf_counter()))
+            elapsed = time.perf_counter() - started
+            steps = simulation.years / MAX_STEP  # lower bound: steps shorten when the target is close
+            reads = sorted(r * 1e6 for r in reads)
+            print(f"{count:>7} {workers:>7} {step_ms:>19.2f} {steps / elapsed:>8.0f} "
+                  f"{(years - simulation.years) * DAYS_PER_YEAR:>9.1f} {len(frames):>7} "
+                  f"{reads[len(reads) // 2]:>12.0f} {reads[-1]:>12.0f}")
+            simulation.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Measure batched quiz-attempt writes and leaderboard reads at scale.
+
+    python benchmarks/quiz_attempts_bench.py --users 2000 --attempts 200000
+
+Attempts are written in batches through the trigger-maintained aggregates, then the
+leaderboard and per-question report are read from the aggregate tables and, for
+comparison, recomputed with GROUP BY over the raw attempts. First checks that quiz
+progress saved before attempts were recorded survives the migration.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+
+RAW_LEADERBOARD = """
+    SELECT users.username, a.user_id, COUNT(*) AS attempts, SUM(a.correct) AS correct
+    FROM quiz_attempts a JOIN users ON users.id = a.user_id
+    GROUP BY a.user_id ORDER BY correct DESC, attempts, a.user_id LIMIT ?
+"""
+RAW_QUESTION_STATS = """
+    SELECT question, COUNT(*), SUM(correct), AVG(latency_ms) FROM quiz_attempts GROUP BY question
+"""
+
+
+def check_legacy_progress(directory):
+    # A database with the original schema and a user who finished the quiz back
+    # when that just stored quiz_progress = 5 (and no attempt rows).
+    path = os.path.join(directory, "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE, password TEXT)")
+    conn.execute("CREATE TABLE progress (user_id INTEGER, explore_progress INTEGER DEFAULT 0, "
+                 "solar_progress INTEGER DEFAULT 0, quiz_progress INTEGER DEFAULT 0, "
+                 "FOREIGN KEY (user_id) REFERENCES users (id))")
+    conn.execute("INSERT INTO users (username, password) VALUES ('veteran', 'pw')")
+    conn.execute("INSERT INTO progress VALUES (1, 2, 3, 5)")
+    conn.commit()
+    conn.close()
+
+    pool = database.ConnectionPool(path)
+    database.create_tables(pool)
+    assert database.quiz_progress(1, 5, pool=pool) == 5, "saved quiz progress lost in migration"
+    database.record_attempts([(1, "thrust", 1, 1, 900, 0.0), (1, "red-planet", 0, 0, 900, 1.0)], pool=pool)
+    assert database.quiz_progress(1, 5, pool=pool) == 5, "new attempts lowered saved quiz progress"
+    newcomer = database.create_user("newcomer", "pw", pool=pool)
+    assert database.quiz_progress(newcomer, 5, pool=pool) == 0
+    database.record_attempts([(newcomer, f"q{i}", 0, int(i != 3), 900, float(i)) for i in range(8)], pool=pool)
+    assert database.quiz_progress(newcomer, 5, pool=pool) == 5, "quiz progress not capped"
+    pool.close()
+    print("legacy quiz progress kept through migration: ok")
+
+
+def best_of(repeat, work):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        work()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--attempts", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    directory = tempfile.mkdtemp(prefix="quiz_bench_")
+    check_legacy_progress(directory)
+    pool = database.ConnectionPool(os.path.join(directory, "quiz.db"))
+    database.create_tables(pool)
+    database.import_users(((f"student{i}", "pw") for i in range(args.users)), pool=pool)
+    skill = [rng.random() for _ in range(args.users)]
+    now = time.time()
+    attempts = [(user + 1, f"q{question}", rng.randrange(4), int(rng.random() < skill[user]),
+                 rng.randint(800, 9000), now + i)
+                for i, (user, question) in enumerate((rng.randrange(args.users), rng.randrange(args.questions))
+                                                     for _ in range(args.attempts))]
+
+    started = time.perf_counter()
+    for i in range(0, len(attempts), args.batch_size):
+        database.record_attempts(attempts[i:i + args.batch_size], pool=pool)
+    elapsed = time.perf_counter() - started
+    print(f"{args.attempts} attempts by {args.users} users in batches of {args.batch_size}: "
+          f"{elapsed:.2f}s ({args.attempts / elapsed:,.0f} attempts/s, aggregates included)")
+
+    single = attempts[:500]
+    started = time.perf_counter()
+    for attempt in single:
+        database.record_attempts([attempt], pool=pool)
+    per_attempt = (time.perf_counter() - started) / len(single)
+    print(f"one transaction per attempt: {per_attempt * 1e6:.0f} us/attempt "
+          f"({1 / per_attempt:,.0f} attempts/s)")
+
+    aggregate = best_of(5, lambda: database.leaderboard(10, pool=pool))
+    raw = best_of(5, lambda: pool.run(lambda conn: conn.execute(RAW_LEADERBOARD, (10,)).fetchall()))
+    print()
+    print(f"{'read':<22} {'aggregates ms':>14} {'raw GROUP BY ms':>16}")
+    print(f"{'top-10 leaderboard':<22} {aggregate * 1000:>14.2f} {raw * 1000:>16.2f}")
+    aggregate = best_of(5, lambda: database.question_stats(pool=pool))
+    raw = best_of(5, lambda: pool.run(lambda conn: conn.execute(RAW_QUESTION_STATS).fetchall()))
+    print(f"{'per-question stats':<22} {aggregate * 1000:>14.2f} {raw * 1000:>16.2f}")
+    user_score = best_of(5, lambda: database.quiz_score(1, pool=pool))
+    print(f"{'one student total':<22} {user_score * 1000:>14.2f}")
+
+    top = database.leaderboard(1, pool=pool)[0]
+    check = pool.run(lambda conn: conn.execute(RAW_LEADERBOARD, (1,)).fetchone())
+    assert (top["user_id"], top["correct"], top["attempts"]) == (check["user_id"], check["correct"], check["attempts"])
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Time adaptive question selection on large question banks and check that it adapts.
+
+    python benchmarks/quiz_bench.py --questions 1000 10000 100000
+
+For each bank size: time indexing the bank, then time next_question() + record()
+for a simulated student. Compares this with a selector that scores every question
+on every pick. Also reports which difficulties the student is given once the
+ability estimates settle, for a weak and a strong simulated student.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quiz import AdaptiveQuiz, QuestionBank, expected
+
+TOPICS = ["physics", "planets", "history", "spacecraft", "astronauts", "stars"]
+
+
+def make_bank(count, rng):
+    return [{"key": f"q{i}", "topic": rng.choice(TOPICS), "difficulty": rng.randint(1, 3),
+             "title": f"Question {i}", "options": ["a", "b", "c", "d"], "answer": rng.randrange(4)}
+            for i in range(count)]
+
+
+def scan_pick(questions, ability, seen):
+    # Baseline: score every unseen question by how close it is to the student's level.
+    best, best_score = None, math.inf
+    for question in questions:
+        if question["key"] in seen:
+            continue
+        score = abs(question["difficulty"] - ability[question["topic"]])
+        if score < best_score:
+            best, best_score = question, score
+    return best
+
+
+def simulate(quiz, true_skill, rng, answers):
+    levels = Counter()
+    correct = 0
+    for i in range(answers):
+        question = quiz.next_question()
+        right = rng.random() < expected(true_skill, question["difficulty"])
+        quiz.record(question, right)
+        if i >= answers // 2:
+            levels[question["difficulty"]] += 1
+            correct += right
+    return levels, correct / (answers - answers // 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--answers", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'questions':>10} {'index ms':>9} {'pick us':>8} {'scan pick us':>13}")
+    for count in args.questions:
+        questions = make_bank(count, rng)
+        started = time.perf_counter()
+        bank = QuestionBank(questions)
+        index_ms = (time.perf_counter() - started) * 1000
+        quiz = AdaptiveQuiz(bank, rng=random.Random(args.seed))
+        started = time.perf_counter()
+        simulate(quiz, 2.0, rng, args.answers)
+        pick = (time.perf_counter() - started) / args.answers
+        scans = max(10, min(args.answers, count // 2, 2000000 // count))
+        seen = set()
+        started = time.perf_counter()
+        for _ in range(scans):
+            seen.add(scan_pick(questions, quiz.ability, seen)["key"])
+        scan = (time.perf_counter() - started) / scans
+        print(f"{count:>10} {index_ms:>9.1f} {pick * 1e6:>8.1f} {scan * 1e6:>13.1f}")
+
+    bank = QuestionBank(make_bank(args.questions[0], rng))
+    print(f"\nsecond half of {args.answers} answers on a {len(bank)}-question bank")
+    print(f"{'student':<8} {'easy':>6} {'medium':>7} {'hard':>6} {'accuracy':>9}")
+    for name, skill in (("weak", 0.5), ("strong", 3.5)):
+        levels, accuracy = simulate(AdaptiveQuiz(bank, rng=random.Random(args.seed)), skill, rng, args.answers)
+        total = sum(levels.values())
+        print(f"{name:<8} {levels[1] / total:>6.0%} {levels[2] / total:>7.0%} {levels[3] / total:>6.0%} {accuracy:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
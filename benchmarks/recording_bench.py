@@ -0,0 +1,105 @@
+"""Write a long synthetic launch recording, then time opening, seeking and replaying it.
+
+    python benchmarks/recording_bench.py --frames 20000 200000 --particles 600
+
+For each length: write throughput and bytes per frame, then open time and per-frame
+read cost through the memory-mapped reader for sequential replay at 0.25x, 1x and 16x
+and for random seeks. The open and read cost should not grow with the recording's
+length. The baseline reads the whole file into memory and parses every frame up front.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from recording import ASCENT, FRAME, PARTICLE, RecordingReader, RecordingWriter, ReplayClock, pack_particles
+
+
+class FakeExhaust:
+    def __init__(self, capacity, rng):
+        self.rng = rng
+        self.pos = rng.uniform(0, 1000, (capacity, 2))
+        self.size = rng.uniform(2, 8, capacity)
+        self.age = rng.uniform(0, 1, capacity)
+        self.life = np.ones(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+
+def write(path, frames, particles, seed):
+    rng = np.random.default_rng(seed)
+    exhaust = FakeExhaust(particles, rng)
+    writer = RecordingWriter(path, 1 / 60, {"ship": "shuttle", "mission": "Earth Orbit", "seed": seed,
+                                            "width": 1000, "height": 700})
+    started = time.perf_counter()
+    for i in range(frames):
+        exhaust.alive[:] = False
+        exhaust.alive[:particles - i % (particles // 2)] = True
+        exhaust.pos += 0.5
+        writer.write(ASCENT, 1, i % 240, i % 400, pack_particles(exhaust))
+    writer.close()
+    return time.perf_counter() - started
+
+
+def load_everything(path):
+    # Baseline: read the file and split every frame out before playing.
+    with open(path, "rb") as f:
+        data = f.read()
+    reader = RecordingReader(path)
+    frames = []
+    for at in reader.index.tolist():
+        frame = np.frombuffer(data, dtype=FRAME, count=1, offset=at)[0]
+        frames.append((frame, np.frombuffer(data, dtype=PARTICLE, count=int(frame["particles"]),
+                                            offset=at + FRAME.itemsize).copy()))
+    reader.close()
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, nargs="+", default=[20000, 200000])
+    parser.add_argument("--particles", type=int, default=600, help="most live particles in a frame")
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.frames:
+            path = os.path.join(directory, f"bench-{count}.nsxr")
+            elapsed = write(path, count, args.particles, args.seed)
+            size = os.path.getsize(path)
+            print(f"{count} frames: {size / 1e6:.1f} MB ({size / count:.0f} B/frame), "
+                  f"written at {count / elapsed:,.0f} frames/s")
+
+            started = time.perf_counter()
+            reader = RecordingReader(path)
+            print(f"  {'open (mmap)':<18} {(time.perf_counter() - started) * 1000:>8.2f} ms")
+            for speed in (0.25, 1.0, 16.0):
+                clock = ReplayClock(reader, speed)
+                clock.seek(reader.duration / 3)
+                started = time.perf_counter()
+                for _ in range(args.reads):
+                    frame, particles = reader.frame(clock.advance(1 / 60))
+                    particles["x"] / 4  # what the replay does with them
+                print(f"  {f'replay {speed:g}x':<18} {(time.perf_counter() - started) / args.reads * 1e6:>8.1f} us/frame")
+            rng = random.Random(args.seed)
+            started = time.perf_counter()
+            for _ in range(args.reads):
+                reader.frame(rng.randrange(len(reader)))
+            print(f"  {'random seek':<18} {(time.perf_counter() - started) / args.reads * 1e6:>8.1f} us/frame")
+            reader.close()
+
+            started = time.perf_counter()
+            frames = load_everything(path)
+            print(f"  {'load everything':<18} {(time.perf_counter() - started) * 1000:>8.0f} ms before the first frame "
+                  f"({sum(p.nbytes for _, p in frames) / 1e6:.0f} MB held)")
+            del frames
+
+
+if __name__ == "__main__":
+    main()
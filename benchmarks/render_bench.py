@@ -0,0 +1,299 @@
+"""Time the explorer's rendering paths without a display and report item counts.
+
+    python benchmarks/render_bench.py --repeat 20 --json render.json
+    python benchmarks/render_bench.py --compare render.json   # exit status 1 on regressions
+
+Runs against the tkinter stand-in in headless.py by default; --backend tk drives
+real Tk instead (under Xvfb on CI, e.g. `xvfb-run python benchmarks/render_bench.py --backend tk`).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+FRAME = 1 / 60
+
+
+class Driver:
+    def __init__(self, backend):
+        self.backend = backend
+        if backend == "headless":
+            import headless
+            self.tk = headless.install()
+        else:
+            import tkinter
+            self.tk = tkinter
+
+    def resize(self, app, width, height):
+        if self.backend == "headless":
+            app.canvas.resize(width, height)
+        else:
+            # The canvas fills the stretchy grid row, so resizing the window resizes it.
+            extra_w = app.root.winfo_width() - app.canvas.winfo_width()
+            extra_h = app.root.winfo_height() - app.canvas.winfo_height()
+            app.root.geometry(f"{width + extra_w}x{height + extra_h}")
+            app.root.update()
+
+    def settle(self, app):
+        app.root.update_idletasks()
+
+
+def count_widgets(widget):
+    return sum(1 + count_widgets(child) for child in widget.winfo_children())
+
+
+def summarize(name, times, items, widgets, first, **extra):
+    times_ms = sorted(t * 1000 for t in times)
+    result = {
+        "runs": len(times_ms),
+        "first_ms": first * 1000,
+        "mean_ms": statistics.fmean(times_ms),
+        "p50_ms": times_ms[len(times_ms) // 2],
+        "p95_ms": times_ms[min(len(times_ms) - 1, int(len(times_ms) * 0.95))],
+        "max_ms": times_ms[-1],
+        "items": items[-1],
+        "items_growth": items[-1] - items[0],
+        "widgets": widgets[-1],
+        "widgets_growth": widgets[-1] - widgets[0],
+    }
+    result.update(extra)
+    return name, result
+
+
+def run_case(driver, app, name, body, repeat, canvas=None, setup=None):
+    # One untimed cold run first (cache fills, craft builds), then `repeat` timed runs.
+    canvas = canvas or app.canvas
+    times, items, widgets = [], [], []
+    first = None
+    for run in range(repeat + 1):
+        if setup:
+            setup(run)
+        started = time.perf_counter()
+        body(run)
+        driver.settle(app)
+        elapsed = time.perf_counter() - started
+        if first is None:
+            first = elapsed
+            continue
+        times.append(elapsed)
+        items.append(len(canvas.find_all()))
+        widgets.append(count_widgets(app.root))
+    return summarize(name, times, items, widgets, first)
+
+
+def bench_launch(driver, app, repeat):
+    frames = []
+
+    def setup(run):
+        app.scheduler.cancel_all()
+        app.draw_spaceship()
+
+    def body(run):
+        timeline = app.launch_animation()
+        count = 0
+        while not timeline.done:
+            timeline.advance(FRAME)
+            app.exhaust.render()
+            count += 1
+        app.scheduler.cancel_all()
+        frames.append(count)
+
+    name, result = run_case(driver, app, "launch_animation", body, repeat, setup=setup)
+    result["frames"] = frames[-1]
+    result["frame_ms"] = result["mean_ms"] / max(1, frames[-1])
+    return name, result
+
+
+def bench_resize_storm(driver, app, mode, repeat, events, seed):
+    from main import RESIZE_DEBOUNCE_MS
+    rng = random.Random(seed)
+    sizes = [(980, 480), (1240, 620)]
+    relayouts = [0]
+    relayout = app.relayout
+
+    def counted():
+        relayouts[0] += 1
+        relayout()
+
+    app.relayout = counted
+    if mode == "solar":
+        app.show_solar_system()
+        app.scheduler.cancel("solar")
+    else:
+        app.scheduler.cancel_all()
+        app.draw_spaceship()
+    times, items, widgets = [], [], []
+    dispatch = []
+    for run in range(repeat):
+        final = sizes[run % 2]
+        started = time.perf_counter()
+        for _ in range(events - 1):
+            driver.resize(app, final[0] + rng.randint(-200, 200), final[1] + rng.randint(-120, 120))
+        driver.resize(app, *final)
+        dispatched = time.perf_counter() - started
+        # The debounce wait is idle time, not rendering work, so it stays out of the figures.
+        time.sleep(RESIZE_DEBOUNCE_MS / 1000 + 0.02)
+        started = time.perf_counter()
+        app.root.update()
+        driver.settle(app)
+        times.append(dispatched + time.perf_counter() - started)
+        dispatch.append(dispatched)
+        items.append(len(app.canvas.find_all()))
+        widgets.append(count_widgets(app.root))
+    app.relayout = relayout
+    return summarize(f"resize_storm[{mode}]", times, items, widgets, times[0],
+                     events=events, relayouts=relayouts[0],
+                     dispatch_ms=statistics.fmean(dispatch) * 1000)
+
+
+def bench_mode_switch(driver, app, repeat):
+    def body(run):
+        app.show_solar_system()
+        app.show_timeline()
+        app.show_training()
+        app.enter_mode("explore")
+        app.draw_spaceship()
+
+    app.leaks.reset()
+    name, result = run_case(driver, app, "mode_switch", body, repeat)
+    result["leaks"] = sorted(f"{label} {metric}" for label, metric in app.leaks.leaks())
+    return name, result
+
+
+def check_particle_pool():
+    # A full pool recycles only as many live particles as the free slots fall short by.
+    from particles import ParticleSystem
+    import numpy as np
+    pool = ParticleSystem(None, capacity=100, rng=np.random.default_rng(1))
+    pool.emit(40, 0, 0, life=(0.1, 0.2))
+    pool.emit(60, 0, 0)
+    pool.update(0.4)  # the short-lived 40 expire; their slots are free again
+    pool.emit(60, 0, 0)
+    assert pool.stats["emitted"] == 160 and pool.stats["recycled"] == 20, pool.stats
+    assert pool.live_count == 100 and int((pool.age == 0).sum()) == 60
+
+
+def run(args):
+    check_particle_pool()
+    driver = Driver(args.backend)
+    import database
+    import main
+
+    workdir = tempfile.mkdtemp(prefix="render_bench_")
+    database.DB_PATH = os.path.join(workdir, "bench.db")
+    database.create_tables()
+    user_id = database.create_user("bench", "bench")
+
+    root = driver.tk.Tk()
+    app = main.NASASpaceshipExplorer(root, user_id)
+    driver.resize(app, 980, 480)
+    time.sleep(main.RESIZE_DEBOUNCE_MS / 1000 + 0.02)
+    root.update()
+    repeat = args.repeat
+    ships = len(app.spacecraft)
+
+    def draw(run):
+        app.current_ship = run % ships
+        app.draw_spaceship()
+
+    cases = [
+        run_case(driver, app, "update_progress_bar", lambda run: app.update_progress_bar(), repeat,
+                 canvas=app.progress_bar),
+        run_case(driver, app, "create_stars", lambda run: app.create_stars(), repeat),
+        run_case(driver, app, "draw_spaceship", draw, repeat),
+        bench_launch(driver, app, max(1, repeat // 4)),
+        run_case(driver, app, "show_solar_system", lambda run: app.show_solar_system(), repeat),
+        run_case(driver, app, "show_timeline", lambda run: app.show_timeline(), repeat),
+        bench_mode_switch(driver, app, repeat),
+        bench_resize_storm(driver, app, "explore", max(1, repeat // 4), args.storm_events, args.seed),
+        bench_resize_storm(driver, app, "solar", max(1, repeat // 4), args.storm_events, args.seed),
+    ]
+    app.on_close()
+    return {
+        "backend": args.backend,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": dict(cases),
+    }
+
+
+def print_report(report):
+    print(f"backend={report['backend']} repeat={report['repeat']} python={report['python']}")
+    print(f"{'case':<22} {'first ms':>9} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} "
+          f"{'items':>7} {'+items':>7} {'widgets':>8} {'+widgets':>9}")
+    for name, case in report["cases"].items():
+        print(f"{name:<22} {case['first_ms']:>9.2f} {case['mean_ms']:>9.2f} {case['p95_ms']:>9.2f} "
+              f"{case['max_ms']:>9.2f} {case['items']:>7} {case['items_growth']:>7} "
+              f"{case['widgets']:>8} {case['widgets_growth']:>9}")
+    launch = report["cases"].get("launch_animation")
+    if launch:
+        print(f"launch: {launch['frames']} frames, {launch['frame_ms']:.3f} ms/frame")
+    for name, case in report["cases"].items():
+        for leak in case.get("leaks", []):
+            print(f"{name}: LEAK? {leak}")
+        if "relayouts" in case:
+            print(f"{name}: {case['events']} events/storm -> {case['relayouts']} relayouts "
+                  f"over {case['runs']} storms, dispatch {case['dispatch_ms']:.2f} ms")
+
+
+def compare(report, baseline, tolerance, floor_ms):
+    # A case regresses if it got slower beyond the tolerance (ignoring sub-floor noise)
+    # or if it leaves more canvas items or widgets behind than the baseline did.
+    regressions = []
+    print()
+    print(f"{'case':<22} {'base ms':>9} {'now ms':>9} {'change':>8} {'items':>11} {'widgets':>11}")
+    for name, case in report["cases"].items():
+        old = baseline["cases"].get(name)
+        if old is None:
+            continue
+        change = case["mean_ms"] / old["mean_ms"] - 1 if old["mean_ms"] else 0.0
+        slower = change > tolerance and case["mean_ms"] - old["mean_ms"] > floor_ms
+        more_items = case["items"] > old["items"] or case["items_growth"] > old["items_growth"]
+        more_widgets = case["widgets"] > old["widgets"] or case["widgets_growth"] > old["widgets_growth"]
+        new_leaks = set(case.get("leaks", [])) - set(old.get("leaks", []))
+        flag = " <-- regression" if slower or more_items or more_widgets or new_leaks else ""
+        print(f"{name:<22} {old['mean_ms']:>9.2f} {case['mean_ms']:>9.2f} {change:>+8.0%} "
+              f"{old['items']:>5}->{case['items']:<5} {old['widgets']:>5}->{case['widgets']:<5}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["headless", "tk"], default="headless")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--storm-events", type=int, default=60, help="<Configure> events per resize storm")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--compare", help="baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    parser.add_argument("--floor-ms", type=float, default=0.5, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.floor_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Time bulk roster imports and per-user progress lookups at classroom scale.
+
+    python benchmarks/roster_import_bench.py --users 10000 --batch-sizes 1 100 1000 5000
+
+Imports a generated CSV roster with each batch size, then compares progress
+lookups/updates on the legacy schema (no key on progress.user_id) against the
+current one, and times migrating a legacy database.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from roster import read_roster
+
+LEGACY_PROGRESS = '''
+    CREATE TABLE progress (
+        user_id INTEGER,
+        explore_progress INTEGER DEFAULT 0,
+        solar_progress INTEGER DEFAULT 0,
+        quiz_progress INTEGER DEFAULT 0,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+'''
+
+
+def roster_csv(count):
+    lines = ["username,password,class"]
+    lines.extend(f"student{i:06d},pw{i},{i % 30}" for i in range(count))
+    return "\n".join(lines) + "\n"
+
+
+def fresh_pool(workdir, name):
+    path = os.path.join(workdir, name)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return database.ConnectionPool(path)
+
+
+def time_import(workdir, text, batch_size):
+    pool = fresh_pool(workdir, f"import_{batch_size}.db")
+    database.create_tables(pool)
+    problems = []
+    started = time.perf_counter()
+    totals = database.import_users(read_roster(io.StringIO(text), problems), batch_size=batch_size, pool=pool)
+    elapsed = time.perf_counter() - started
+    pool.close()
+    return totals, elapsed
+
+
+def legacy_pool(workdir, count):
+    pool = fresh_pool(workdir, "legacy.db")
+
+    def work(conn):
+        conn.execute(database.CREATE_USERS)
+        conn.execute(LEGACY_PROGRESS)
+        conn.executemany(database.INSERT_USER, ((f"student{i:06d}", f"pw{i}") for i in range(count)))
+        conn.execute("INSERT INTO progress (user_id) SELECT id FROM users")
+    pool.run(work, write=True)
+    return pool
+
+
+def time_lookups(pool, count, ops, rng):
+    ids = [rng.randint(1, count) for _ in range(ops)]
+    started = time.perf_counter()
+    for user_id in ids:
+        database.load_progress(user_id, pool=pool)
+    load = (time.perf_counter() - started) / ops
+    started = time.perf_counter()
+    for user_id in ids:
+        database.save_progress(user_id, 1, 2, 3, pool=pool)
+    save = (time.perf_counter() - started) / ops
+    started = time.perf_counter()
+    for user_id in ids:
+        database.find_user(f"student{user_id - 1:06d}", f"pw{user_id - 1}", pool=pool)
+    find = (time.perf_counter() - started) / ops
+    return load, save, find
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 1000, 5000])
+    parser.add_argument("--ops", type=int, default=500, help="lookups/updates per schema")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="roster_bench_")
+    text = roster_csv(args.users)
+    print(f"Importing {args.users} users from CSV")
+    print(f"{'batch':>7} {'transactions':>13} {'seconds':>9} {'users/s':>10}")
+    for batch_size in args.batch_sizes:
+        totals, elapsed = time_import(workdir, text, batch_size)
+        assert totals["created"] == args.users, totals
+        print(f"{batch_size:>7} {totals['batches']:>13} {elapsed:>9.2f} {args.users / elapsed:>10,.0f}")
+
+    # Re-importing the same roster only skips; this is the cost of a duplicate check.
+    pool = fresh_pool(workdir, "reimport.db")
+    database.create_tables(pool)
+    database.import_users(read_roster(io.StringIO(text), []), pool=pool)
+    started = time.perf_counter()
+    totals = database.import_users(read_roster(io.StringIO(text), []), pool=pool)
+    print(f"re-import: {totals['skipped']} skipped in {time.perf_counter() - started:.2f}s")
+
+    rng = random.Random(args.seed)
+    print()
+    print(f"Progress access with {args.users} users ({args.ops} random users each)")
+    print(f"{'schema':<8} {'load us':>9} {'save us':>9} {'find_user us':>13}")
+    legacy = legacy_pool(workdir, args.users)
+    for name, target in (("legacy", legacy), ("current", pool)):
+        load, save, find = time_lookups(target, args.users, args.ops, rng)
+        print(f"{name:<8} {load * 1e6:>9.1f} {save * 1e6:>9.1f} {find * 1e6:>13.1f}")
+
+    started = time.perf_counter()
+    applied = database.migrate(legacy)
+    elapsed = time.perf_counter() - started
+    rows = legacy.run(lambda conn: conn.execute("SELECT COUNT(*) FROM progress").fetchone()[0])
+    print(f"\nmigrating the legacy database ({', '.join(applied)}): {elapsed * 1000:.0f} ms, {rows} progress rows")
+    legacy.close()
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Time solar system frames with thousands of belt bodies, culling and aggregation on.
+
+    python benchmarks/solar_bench.py --bodies 5500 20000 100000
+    xvfb-run python benchmarks/solar_bench.py --backend tk
+
+For each body count: frame time with the whole system in view (dense belts become
+aggregate sprites), zoomed into the asteroid belt (culled, individual dots) and
+while panning, plus click hit-test time. The baseline gives every body its own oval
+and moves all of them each frame.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PLANETS = [
+    {"name": "Mercury", "color": "gray", "size": 15, "distance": 50},
+    {"name": "Venus", "color": "orange", "size": 20, "distance": 80},
+    {"name": "Earth", "color": "blue", "size": 22, "distance": 120},
+    {"name": "Mars", "color": "red", "size": 19, "distance": 170},
+    {"name": "Jupiter", "color": "sandybrown", "size": 35, "distance": 240},
+    {"name": "Saturn", "color": "gold", "size": 30, "distance": 300},
+    {"name": "Uranus", "color": "lightblue", "size": 25, "distance": 350},
+    {"name": "Neptune", "color": "royalblue", "size": 24, "distance": 400},
+]
+
+
+class NoScheduler:
+    def add_frame_callback(self, callback):
+        pass
+
+    def remove_frame_callback(self, callback):
+        pass
+
+
+def frames(view, count, step):
+    times = []
+    for i in range(count):
+        step(i)
+        started = time.perf_counter()
+        view.render()
+        view.canvas.update_idletasks()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def report(name, times, extra=""):
+    ms = sorted(t * 1000 for t in times)
+    print(f"  {name:<16} p50 {ms[len(ms) // 2]:>7.2f} ms  p95 {ms[int(len(ms) * 0.95)]:>7.2f} ms{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bodies", type=int, nargs="+", default=[5500, 20000, 100000],
+                        help="belt bodies (split 8:3 between the asteroid and Kuiper belts)")
+    parser.add_argument("--backend", choices=["headless", "tk"], default="headless")
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    if args.backend == "headless":
+        import headless
+        tk = headless.install()
+    else:
+        import tkinter as tk
+    from solar_view import SolarSystem, SolarView
+
+    root = tk.Tk()
+    for count in args.bodies:
+        system = SolarSystem(PLANETS, belt_counts=(count * 8 // 11, count - count * 8 // 11))
+        canvas = tk.Canvas(root, width=1000, height=700)
+        canvas.pack()
+        if args.backend == "headless":
+            canvas.resize(1000, 700)
+        root.update()
+        view = SolarView(canvas, system, NoScheduler())
+        years = [0.0]
+
+        def tick(i):
+            years[0] += 20 / 365.25 / 60
+            view.set_time(years[0])
+
+        print(f"{count} belt bodies + {len(system.bodies)} planets, dwarf planets and moons")
+        report("whole system", frames(view, args.frames, tick),
+                f"  ({view.stats['aggregates']} aggregates for {view.stats['visible_belt']} bodies)")
+        mars = system.bodies[3]
+        x, y = view.to_screen(system.major_positions(years[0])[3])
+        for _ in range(10):
+            view.zoom(x, y, 1.25)
+        report("zoomed on belt", frames(view, args.frames, tick),
+               f"  ({view.stats['dots']} dots, {view.stats['aggregates']} aggregates)")
+
+        def pan(i):
+            tick(i)
+            view.cam += 4 / view.scale
+        report("panning", frames(view, args.frames, pan))
+        started = time.perf_counter()
+        for i in range(200):
+            view.hit_test((i * 37) % 1000, (i * 53) % 700)
+        print(f"  {'hit test':<16} {(time.perf_counter() - started) / 200 * 1e6:.0f} us")
+        print(f"  {'canvas items':<16} {len(canvas.find_all())}  ({mars['name']} view)")
+        view.close()
+        canvas.destroy()
+
+        # Baseline: one oval per body, all moved every frame.
+        canvas = tk.Canvas(root, width=1000, height=700)
+        canvas.pack()
+        items = [canvas.create_oval(0, 0, 0, 0, fill="gray") for _ in range(len(system.belt_au))]
+        times = []
+        for i in range(min(args.frames, 10)):
+            positions = (system.belt_positions(i / 60) * 1.2 + (500, 350)).tolist()
+            started = time.perf_counter()
+            for item, (x, y) in zip(items, positions):
+                canvas.coords(item, x - 1, y - 1, x + 1, y + 1)
+            canvas.update_idletasks()
+            times.append(time.perf_counter() - started)
+        report("draw-all", times, f"  ({len(items)} items)")
+        canvas.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure cold start (import, database, UI build, first paint) in fresh processes.
+
+    python benchmarks/startup_bench.py --runs 10
+    python benchmarks/startup_bench.py --runs 10 --eager    # also import pygame/NumPy up front, for comparison
+    python benchmarks/startup_bench.py --log startup.jsonl  # append each run, as main.py --startup-log does
+
+Each run starts a new interpreter, so module caches and imports are cold every time
+(the OS file cache is not). Login is skipped: the app is built straight after the
+database step, which is what the "login" phase excludes in a real session.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import sys
+sys.path.insert(0, {root!r})
+import startup
+import json
+import sqlite3
+if {backend!r} == "headless":
+    import headless
+    tk = headless.install()
+import main
+if {eager!r}:
+    import pygame, particles, trajectory, mission_paths, orbits, solar_view
+    pygame.mixer.init()
+    startup.mark("eager imports")
+import database
+database.DB_PATH = {db!r}
+database.create_tables()
+startup.mark("database")
+try:
+    user_id = database.create_user("startup", "startup")
+except sqlite3.IntegrityError:
+    user_id = database.find_user("startup", "startup")["id"]
+startup.mark("login", exclude=True)
+root = main.tk.Tk()
+app = main.NASASpaceshipExplorer(root, user_id)
+while not startup.PROFILER.finished:
+    root.update()
+record = startup.PROFILER.record()
+app.on_close()
+print(json.dumps(record))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--backend", choices=["headless", "tk"], default="headless")
+    parser.add_argument("--eager", action="store_true", help="import pygame and NumPy modules before the UI")
+    parser.add_argument("--log", help="append every run's record to this JSON-lines file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="startup_bench_")
+    env = dict(os.environ, SDL_AUDIODRIVER=os.environ.get("SDL_AUDIODRIVER", "dummy"))
+    code = CHILD.format(root=ROOT, backend=args.backend, eager=args.eager,
+                        db=os.path.join(workdir, "startup.db"))
+    records = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, "-c", code], cwd=workdir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        records.append(json.loads(output.strip().splitlines()[-1]))
+    if args.log:
+        with open(args.log, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    phases = list(records[0]["phases"])
+    print(f"{args.runs} cold starts, backend={args.backend}{', eager imports' if args.eager else ''}")
+    print(f"{'phase':<16} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for phase in phases + ["total"]:
+        values = [r["total_ms"] if phase == "total" else r["phases"][phase] for r in records]
+        note = "  (not counted)" if phase in records[0]["excluded"] else ""
+        print(f"{phase:<16} {statistics.median(values):>10.1f} {min(values):>8.1f} {max(values):>8.1f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Measure the cost of session telemetry on the UI thread and of flushing and reporting it.
+
+    python benchmarks/telemetry_bench.py --events 200000
+
+Times EventBus.emit() against a bare function call (the floor for any hook on the
+Tk thread), then bulk flushes to SQLite and to JSONL files and times a one-day
+report from each. Also shows what a commit per event would cost instead.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import telemetry
+
+KINDS = [("ship", ["apollo", "shuttle", "falcon", "sls", "orion"]),
+         ("planet", ["Mercury", "Venus", "Earth", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune"]),
+         ("tooltip", ["Launch", "Solar System", "Quiz", "Training", "Timeline"]),
+         ("mission", ["apollo-11", "voyager-1", "hubble", "artemis-1"]),
+         ("launch", ["apollo", "shuttle"])]
+
+
+def fresh_pool(workdir, name):
+    path = os.path.join(workdir, name)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    pool = database.ConnectionPool(path)
+    database.create_tables(pool)
+    return pool
+
+
+def workload(count, rng):
+    return [(kind, rng.choice(subjects)) for kind, subjects in (rng.choice(KINDS) for _ in range(count))]
+
+
+def time_emit(events, bus):
+    def noop(kind, subject=None, detail=None):
+        pass
+
+    started = time.perf_counter()
+    for kind, subject in events:
+        noop(kind, subject)
+    floor = (time.perf_counter() - started) / len(events)
+    started = time.perf_counter()
+    for kind, subject in events:
+        bus.emit(kind, subject)
+    cost = (time.perf_counter() - started) / len(events)
+    return floor, cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--per-event", type=int, default=2000, help="events to commit one at a time for comparison")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="telemetry_bench_")
+    events = workload(args.events, random.Random(args.seed))
+    day = time.strftime("%Y-%m-%d")
+    print(f"{args.events} events")
+    print(f"{'sink':<8} {'emit ns':>8} {'call ns':>8} {'flush s':>8} {'events/s':>11} {'report s':>9}")
+    for name in ("sqlite", "jsonl"):
+        pool = fresh_pool(workdir, "events.db")
+        directory = os.path.join(workdir, "logs")
+        for path in os.listdir(directory) if os.path.isdir(directory) else []:
+            os.remove(os.path.join(directory, path))
+        sink = telemetry.SQLiteSink(pool) if name == "sqlite" else telemetry.JsonlSink(directory)
+        # A long interval keeps the flush thread out of the emit loop's way.
+        bus = telemetry.EventBus([sink], user_id=1, capacity=args.events, interval=3600)
+        floor, cost = time_emit(events, bus)
+        started = time.perf_counter()
+        bus.flush()
+        flush = time.perf_counter() - started
+        assert bus.dropped == 0, bus.dropped
+        started = time.perf_counter()
+        summary = telemetry.summarize(telemetry.read_day(day, directory=directory if name == "jsonl" else None,
+                                                         pool=pool))
+        report = time.perf_counter() - started
+        assert summary["events"] == args.events, summary["events"]
+        bus.close()
+        pool.close()
+        print(f"{name:<8} {cost * 1e9:>8.0f} {floor * 1e9:>8.0f} {flush:>8.2f} {args.events / flush:>11,.0f} {report:>9.2f}")
+
+    # The alternative: one INSERT + commit for every hover and click.
+    pool = fresh_pool(workdir, "per_event.db")
+    started = time.perf_counter()
+    for kind, subject in events[:args.per_event]:
+        database.record_events([(time.time(), "bench", 1, kind, subject, None)], pool=pool)
+    elapsed = (time.perf_counter() - started) / args.per_event
+    pool.close()
+    print(f"\ncommitting each event: {elapsed * 1e6:.0f} us per event on the calling thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Time the mission timeline's pan and zoom frames on large mission catalogs.
+
+    python benchmarks/timeline_bench.py --missions 1000 10000 100000
+    xvfb-run python benchmarks/timeline_bench.py --backend tk
+
+For each catalog size: index build time, then per-frame render time while panning
+across a few years of missions, and while zooming out from days to the whole catalog
+and back. The baseline draws every mission up front, as the old timeline did, and pans
+by moving all items.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class NoScheduler:
+    # render() is called directly, so frame callbacks are not needed.
+    def add_frame_callback(self, callback):
+        pass
+
+    def remove_frame_callback(self, callback):
+        pass
+
+
+def make_missions(count, rng):
+    first, last = date(1957, 10, 4).toordinal(), date(2030, 1, 1).toordinal()
+    missions = []
+    for i in range(count):
+        start = rng.randint(first, last)
+        mission = {"key": f"m{i}", "title": f"Mission {i}", "date": date.fromordinal(start).isoformat()}
+        if rng.random() < 0.1:
+            mission["end"] = date.fromordinal(min(last, start + int(rng.expovariate(1 / 900)))).isoformat()
+        missions.append(mission)
+    return missions
+
+
+def frame_times(view, steps, step):
+    times = []
+    for _ in range(steps):
+        step(view)
+        started = time.perf_counter()
+        view.render()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def report(name, times, extra=""):
+    ms = sorted(t * 1000 for t in times)
+    print(f"  {name:<22} p50 {ms[len(ms) // 2]:>7.2f} ms  p95 {ms[int(len(ms) * 0.95)]:>7.2f} ms  max {ms[-1]:>7.2f} ms{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--backend", choices=["headless", "tk"], default="headless")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.backend == "headless":
+        import headless
+        tk = headless.install()
+    else:
+        import tkinter as tk
+    from timeline_view import MAX_DAYS_PER_PX, MIN_DAYS_PER_PX, TimelineView, mission_interval
+
+    root = tk.Tk()
+    root.geometry("1000x500")
+    rng = random.Random(args.seed)
+    for count in args.missions:
+        missions = make_missions(count, rng)
+        canvas = tk.Canvas(root, width=1000, height=400)
+        canvas.pack()
+        if args.backend == "headless":
+            canvas.resize(1000, 400)
+        root.update()
+        started = time.perf_counter()
+        view = TimelineView(canvas, missions, NoScheduler())
+        view.fit()
+        build = (time.perf_counter() - started) * 1000
+        print(f"{count} missions (index built in {build:.1f} ms)")
+
+        # Pan across ~3 years at a zoom where individual missions are drawn.
+        view.days_per_px = view.target_days_per_px = 1.5 * 1000 / count
+        view.start = date(1990, 1, 1).toordinal()
+        times = frame_times(view, args.frames, lambda v: v.pan(8))
+        mode = "histogram" if view.stats["histogram"] else f"{view.stats['drawn']} drawn, {view.stats['labels']} labels"
+        report("pan", times, f"  ({mode})")
+
+        def zoom_out(v):
+            v.days_per_px = v.target_days_per_px = min(MAX_DAYS_PER_PX, v.days_per_px * 1.08)
+        view.days_per_px = MIN_DAYS_PER_PX
+        times = frame_times(view, args.frames, zoom_out)
+        report("zoom out (days->all)", times, f"  (histogram: {view.stats['histogram']})")
+        print(f"  {'canvas items':<22} {view.stats['items_created']}")
+        canvas.destroy()
+
+        # Baseline: every mission drawn up front, panning moves them all.
+        canvas = tk.Canvas(root, width=1000, height=400)
+        canvas.pack()
+        started = time.perf_counter()
+        scale = 1.5 * 1000 / count
+        origin = date(1990, 1, 1).toordinal()
+        for start, end, mission in map(mission_interval, missions):
+            x0, x1 = (start - origin) / scale, max((start - origin) / scale + 8, (end - origin) / scale)
+            canvas.create_rectangle(x0, 254, x1, 266, fill="#444466")
+            canvas.create_text(x0, 234, text=mission["title"], fill="white")
+        root.update()
+        build = (time.perf_counter() - started) * 1000
+        times = []
+        for _ in range(min(args.frames, 30)):
+            started = time.perf_counter()
+            canvas.move("all", -8, 0)
+            root.update_idletasks()
+            times.append(time.perf_counter() - started)
+        report("draw-all baseline pan", times, f"  (built in {build:.0f} ms, {2 * count} items)")
+        canvas.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Integrate many vehicle/mission ascents in bulk and report throughput.
+
+    python benchmarks/trajectory_bench.py --sizes 1 25 250 2500
+
+Also times what a launch spends preparing its ascent and orbit paths, first
+built and then replayed from mission_paths.PathCache.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mission_paths import PathCache
+from trajectory import MISSION_PROFILES, VEHICLES, simulate_ascent, simulate_mission
+
+
+def combinations(count):
+    ships = list(VEHICLES)
+    missions = list(MISSION_PROFILES)
+    pairs = [(ship, mission) for mission in missions for ship in ships]
+    chosen = [pairs[i % len(pairs)] for i in range(count)]
+    return [VEHICLES[s] for s, _ in chosen], [MISSION_PROFILES[m] for _, m in chosen]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 25, 250, 2500])
+    parser.add_argument("--dt", type=float, default=2.0)
+    parser.add_argument("--duration", type=float, default=600.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    steps = int(args.duration / args.dt)
+    print(f"RK4 ascent, dt={args.dt}s, {steps} steps per vehicle (best of {args.repeat})")
+    print(f"{'batch':>7} {'total ms':>10} {'ms/ascent':>10} {'vehicle-steps/s':>16}")
+    for size in args.sizes:
+        vehicles, profiles = combinations(size)
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            simulate_ascent(vehicles, profiles, dt=args.dt, duration=args.duration)
+            best = min(best, time.perf_counter() - started)
+        print(f"{size:>7} {best * 1000:>10.1f} {best * 1000 / size:>10.3f} {size * steps / best:>16,.0f}")
+
+    print()
+    print(f"{'vehicle':<10} {'mission':<16} {'burnout s':>9} {'alt km':>7} {'speed m/s':>9}")
+    for mission in MISSION_PROFILES:
+        for ship in VEHICLES:
+            result = simulate_mission(ship, mission, dt=args.dt, duration=args.duration)
+            i = min(len(result["time"]) - 1, int(result["burnout"] / args.dt))
+            print(f"{ship:<10} {mission:<16} {result['burnout']:>9.0f} "
+                  f"{result['altitude'][i] / 1000:>7.0f} {result['speed'][i]:>9.0f}")
+
+    # Launch preparation: every ship/mission pair at two canvas sizes, built once
+    # and then requested again as repeat launches would.
+    cache = PathCache(capacity=2 * len(VEHICLES) * len(MISSION_PROFILES))
+    launches = [(ship, mission, size) for size in ((1000, 700), (1280, 800))
+                for mission in MISSION_PROFILES for ship in VEHICLES]
+    print()
+    for label in ("first launch", "repeat launch"):
+        started = time.perf_counter()
+        for ship, mission, (width, height) in launches:
+            cache.ascent(ship, mission, 400)
+            cache.orbit(mission, 150, width, height)
+        elapsed = (time.perf_counter() - started) / len(launches)
+        print(f"{label:<14} {elapsed * 1e6:>9.0f} us per launch to prepare ascent and orbit paths")
+    print(f"cache: {cache.stats}, {len(cache.paths)} paths")
+
+
+if __name__ == "__main__":
+    main()
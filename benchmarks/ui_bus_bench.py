@@ -0,0 +1,136 @@
+"""Count and time label writes made directly versus through the UI update bus.
+
+    python benchmarks/ui_bus_bench.py --seconds 4
+    xvfb-run python benchmarks/ui_bus_bench.py --backend tk
+
+Replays a launch readout at the scheduler's fixed timestep, with catch-up steps
+when a frame runs late, writing the science and status labels either with
+label.config() on every step or through UIUpdateBus. Then several threads post to
+the labels as fast as they can while the Tk loop runs, and the labels are checked
+to end on each thread's last value.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def readout(step):
+    # Same rounding as the ascent readout: altitude in km, speed in m/s.
+    t = step / 60
+    altitude = 400 * t * t
+    return (f"Mission: Earth Orbit | Altitude: {altitude / 1000:.0f} km | Speed: {800 * t:.0f} m/s | "
+            f"Thrust: {100 - 5 * int(t):.0f}% | Gravity: {9.8 - 0.1 * int(t):.1f} m/s²")
+
+
+class Counting:
+    # Wraps a label so config() calls are counted.
+    def __init__(self, label):
+        self.label = label
+        self.calls = 0
+
+    def config(self, **options):
+        self.calls += 1
+        self.label.config(**options)
+
+    def cget(self, option):
+        return self.label.cget(option)
+
+
+def replay(root, scheduler, bus, labels, seconds, late_every):
+    from animation import Timeline
+    step = [0]
+    times = []
+
+    def write(_):
+        step[0] += 1
+        text = readout(step[0])
+        status = f"Status: T+{step[0] // 60} s"
+        if bus is None:
+            labels[0].config(text=text)
+            labels[1].config(text=status)
+        else:
+            bus.post(labels[0], text=text)
+            bus.post(labels[1], text=status)
+
+    def frame():
+        started = time.perf_counter()
+        if late_every and scheduler.stats["frames"] % late_every == 0:
+            time.sleep(3 / 60)  # a slow frame: the next one runs catch-up steps
+        root.update_idletasks()
+        times.append(time.perf_counter() - started)
+
+    timeline = Timeline("replay")
+    timeline.during(0, seconds, write)
+    scheduler.add_frame_callback(frame)
+    scheduler.play(timeline)
+    deadline = time.perf_counter() + seconds + 0.2
+    while time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    scheduler.remove_frame_callback(frame)
+    return step[0], times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["headless", "tk"], default="headless")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--late-every", type=int, default=10, help="make every Nth frame slow (0: never)")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--posts", type=int, default=20000, help="posts per thread")
+    args = parser.parse_args()
+
+    if args.backend == "headless":
+        import headless
+        tk = headless.install()
+    else:
+        import tkinter as tk
+    from animation import FrameScheduler
+    from ui_bus import UIUpdateBus
+
+    root = tk.Tk()
+    print(f"{'path':<8} {'steps':>6} {'config calls':>13} {'frame ms p50':>13} {'frame ms max':>13}")
+    for name in ("direct", "bus"):
+        scheduler = FrameScheduler(root, fps=60)
+        labels = [Counting(tk.Label(root, text="")) for _ in range(2)]
+        bus = UIUpdateBus(root, scheduler) if name == "bus" else None
+        steps, times = replay(root, scheduler, bus, labels, args.seconds, args.late_every)
+        ms = sorted(t * 1000 for t in times)
+        print(f"{name:<8} {steps:>6} {sum(l.calls for l in labels):>13} {ms[len(ms) // 2]:>13.2f} {ms[-1]:>13.2f}")
+        if bus is not None:
+            print(f"  bus stats: {bus.stats}")
+            bus.close()
+        scheduler.stop()
+
+    scheduler = FrameScheduler(root, fps=60)
+    bus = UIUpdateBus(root, scheduler)
+    labels = [Counting(tk.Label(root, text="")) for _ in range(args.threads)]
+
+    def worker(label, rank):
+        for i in range(args.posts):
+            bus.post(label, text=f"worker {rank}: {i}")
+
+    threads = [threading.Thread(target=worker, args=(label, rank)) for rank, label in enumerate(labels)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads) or bus.pending:
+        root.update()
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    correct = all(label.cget("text") == f"worker {rank}: {args.posts - 1}" for rank, label in enumerate(labels))
+    posted = args.threads * args.posts
+    print(f"\n{args.threads} threads posted {posted} updates in {elapsed * 1000:.0f} ms "
+          f"({posted / elapsed:,.0f}/s); {sum(l.calls for l in labels)} config calls; "
+          f"labels show each thread's last value: {correct}")
+    bus.close()
+    scheduler.stop()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
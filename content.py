@@ -0,0 +1,207 @@
+import json
+from collections import defaultdict
+
+import database
+
+# Seed rows for the content table. Entries missing from the table are inserted
+# at startup; existing rows are left as they are, since the feeds may have
+# refreshed them. Entries added directly to the table (e.g. imported in bulk)
+# are loaded alongside these.
+CONTENT = [
+    {"kind": "spacecraft", "key": "shuttle", "title": "Space Shuttle", "topic": "spacecraft",
+     "data": {"era": "1981-2011", "summary": "Reusable spacecraft that carried astronauts to space 135 times"},
+     "body": "Space Shuttle Facts:\n"
+             "- First launched: April 12, 1981\n"
+             "- Length: 184 feet (56 m)\n"
+             "- Wingspan: 78 feet (24 m)\n"
+             "- Maximum payload: 65,000 lbs (29,500 kg)\n"
+             "- Unique as the first reusable spacecraft\n"
+             "- Flew 135 missions over 30 years"},
+    {"kind": "spacecraft", "key": "artemis", "title": "Artemis SLS", "topic": "spacecraft",
+     "data": {"era": "2022-Present", "summary": "NASA's new rocket for returning astronauts to the Moon"},
+     "body": "Artemis SLS Facts:\n"
+             "- First launched: November 16, 2022\n"
+             "- Height: 322 feet (98 m)\n"
+             "- Thrust: 8.8 million pounds\n"
+             "- Payload to Moon: 59,000 lbs (27,000 kg)\n"
+             "- Carries the Orion crew capsule\n"
+             "- Part of NASA's return to the Moon"},
+    {"kind": "spacecraft", "key": "saturn", "title": "Saturn V", "topic": "spacecraft",
+     "data": {"era": "1967-1973", "summary": "Tallest rocket ever flown (363 ft), took astronauts to the Moon"},
+     "body": "Saturn V Facts:\n"
+             "- Height: 363 feet (111 m)\n"
+             "- Weight: 6.5 million pounds\n"
+             "- Thrust: 7.6 million pounds\n"
+             "- Launched all Apollo Moon missions\n"
+             "- Remains the tallest, heaviest rocket ever flown\n"
+             "- Never lost a payload in 13 launches"},
+    {"kind": "spacecraft", "key": "falcon", "title": "Falcon Heavy", "topic": "spacecraft",
+     "data": {"era": "2018-Present", "summary": "World's most powerful operational rocket with reusable boosters"},
+     "body": "Falcon Heavy Facts:\n"
+             "- First launched: February 6, 2018\n"
+             "- Height: 230 feet (70 m)\n"
+             "- Thrust: 5.1 million pounds\n"
+             "- Payload to LEO: 141,000 lbs (64,000 kg)\n"
+             "- Features reusable boosters\n"
+             "- Side boosters return to landing sites"},
+    {"kind": "spacecraft", "key": "voyager", "title": "Voyager Probe", "topic": "spacecraft",
+     "data": {"era": "1977-Present", "summary": "Farthest human-made object from Earth, now in interstellar space"},
+     "body": "Voyager Facts:\n"
+             "- Launched: September 5, 1977\n"
+             "- Speed: 38,000 mph (61,000 km/h)\n"
+             "- Distance from Earth: 14+ billion miles\n"
+             "- Powered by radioisotope thermoelectric generators\n"
+             "- Carries Golden Record with sounds of Earth\n"
+             "- Entered interstellar space in 2012"},
+
+    {"kind": "planet", "key": "Mercury", "title": "Mercury", "topic": "planets",
+     "body": "Closest planet to the Sun\nSurface temperature: 430°C (day) to -180°C (night)\nNo moons"},
+    {"kind": "planet", "key": "Venus", "title": "Venus", "topic": "planets",
+     "body": "Hottest planet (475°C)\nThick toxic atmosphere\nRotates backwards"},
+    {"kind": "planet", "key": "Earth", "title": "Earth", "topic": "planets",
+     "body": "Only known planet with life\n71% covered in water\n1 Moon"},
+    {"kind": "planet", "key": "Mars", "title": "Mars", "topic": "planets",
+     "body": "The Red Planet\nLargest volcano in solar system (Olympus Mons)\n2 moons: Phobos and Deimos"},
+    {"kind": "planet", "key": "Jupiter", "title": "Jupiter", "topic": "planets",
+     "body": "Largest planet\nGreat Red Spot is a giant storm\n79 known moons"},
+    {"kind": "planet", "key": "Saturn", "title": "Saturn", "topic": "planets",
+     "body": "Famous for its rings\nLess dense than water\n62 moons"},
+    {"kind": "planet", "key": "Uranus", "title": "Uranus", "topic": "planets",
+     "body": "Rotates on its side\nBlue-green from methane gas\n27 moons"},
+    {"kind": "planet", "key": "Neptune", "title": "Neptune", "topic": "planets",
+     "body": "Windiest planet (2,100 km/h winds)\nDiscovered through math\n14 moons"},
+
+    # Missions with an "end" (or still "ongoing") are drawn as spans on the timeline.
+    {"kind": "mission", "key": "Apollo 11", "title": "Apollo 11", "topic": "history",
+     "date": "1969-07-20", "body": "First Moon landing"},
+    {"kind": "mission", "key": "Voyager 1", "title": "Voyager 1", "topic": "history",
+     "date": "1977-09-05", "body": "First probe to interstellar space",
+     "data": {"ongoing": True}},
+    {"kind": "mission", "key": "Space Shuttle", "title": "Space Shuttle", "topic": "history",
+     "date": "1981-04-12", "body": "First reusable spacecraft",
+     "data": {"end": "2011-07-21"}},
+    {"kind": "mission", "key": "Hubble Telescope", "title": "Hubble Telescope", "topic": "history",
+     "date": "1990-04-24", "body": "Revolutionized astronomy",
+     "data": {"ongoing": True}},
+    {"kind": "mission", "key": "ISS", "title": "ISS", "topic": "history",
+     "date": "1998-11-20", "body": "International Space Station",
+     "data": {"ongoing": True}},
+    {"kind": "mission", "key": "Mars Rover", "title": "Mars Rover", "topic": "history",
+     "date": "2004-01-04", "body": "Exploration of Mars",
+     "data": {"end": "2018-06-10"}},
+    {"kind": "mission", "key": "Artemis", "title": "Artemis", "topic": "history",
+     "date": "2022-11-16", "body": "Return to the Moon"},
+
+    # Difficulty runs from 1 (easiest) to 3.
+    {"kind": "quiz", "key": "thrust", "title": "What force propels a rocket upward?",
+     "topic": "physics", "difficulty": 1, "body": "Thrust",
+     "data": {"options": ["Gravity", "Thrust", "Magnetism", "Friction"], "answer": 1}},
+    {"kind": "quiz", "key": "red-planet", "title": "Which planet is known as the Red Planet?",
+     "topic": "planets", "difficulty": 1, "body": "Mars",
+     "data": {"options": ["Venus", "Jupiter", "Mars", "Saturn"], "answer": 2}},
+    {"kind": "quiz", "key": "first-animal", "title": "What was the first animal in space?",
+     "topic": "history", "difficulty": 2, "body": "Dog (Laika)",
+     "data": {"options": ["Dog (Laika)", "Chimpanzee", "Monkey", "Cat"], "answer": 0}},
+    {"kind": "quiz", "key": "escape-speed", "title": "How fast must a rocket go to escape Earth's gravity?",
+     "topic": "physics", "difficulty": 3, "body": "40,000 km/h",
+     "data": {"options": ["1,000 km/h", "10,000 km/h", "28,000 km/h", "40,000 km/h"], "answer": 3}},
+    {"kind": "quiz", "key": "not-nasa", "title": "Which of these is NOT a real NASA spacecraft?",
+     "topic": "spacecraft", "difficulty": 2, "body": "Enterprise",
+     "data": {"options": ["Voyager", "Cassini", "Enterprise", "Galileo"], "answer": 2}},
+    {"kind": "quiz", "key": "largest-planet", "title": "What is the largest planet in our solar system?",
+     "topic": "planets", "difficulty": 1, "body": "Jupiter",
+     "data": {"options": ["Earth", "Jupiter", "Saturn", "Neptune"], "answer": 1}},
+    {"kind": "quiz", "key": "first-moonwalk", "title": "Who was the first human to walk on the Moon?",
+     "topic": "history", "difficulty": 1, "body": "Neil Armstrong",
+     "data": {"options": ["Yuri Gagarin", "Buzz Aldrin", "Neil Armstrong", "John Glenn"], "answer": 2}},
+
+    {"kind": "fact", "key": "sun-size", "title": "Fun Space Fact", "topic": "sun",
+     "body": "The Sun is so big that about 1.3 million Earths could fit inside it."},
+    {"kind": "fact", "key": "venus-spin", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Venus spins in the opposite direction to most other planets."},
+    {"kind": "fact", "key": "venus-day", "title": "Fun Space Fact", "topic": "planets",
+     "body": "A day on Venus is longer than a year on Venus."},
+    {"kind": "fact", "key": "olympus-mons", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Mars has the largest volcano in the solar system, Olympus Mons."},
+    {"kind": "fact", "key": "great-red-spot", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Jupiter's Great Red Spot is a storm that has been raging for over 300 years."},
+    {"kind": "fact", "key": "saturn-rings", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Saturn's rings are made mostly of ice particles."},
+    {"kind": "fact", "key": "uranus-tilt", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Uranus rotates on its side, making its seasons very extreme."},
+    {"kind": "fact", "key": "neptune-maths", "title": "Fun Space Fact", "topic": "planets",
+     "body": "Neptune was discovered using mathematics before it was seen with a telescope."},
+    {"kind": "fact", "key": "iss-orbit", "title": "Fun Space Fact", "topic": "spacecraft",
+     "body": "The International Space Station orbits Earth every 90 minutes."},
+    {"kind": "fact", "key": "fruit-flies", "title": "Fun Space Fact", "topic": "history",
+     "body": "The first living creatures in space were fruit flies in 1947."},
+
+    {"kind": "training", "key": "Physical Training", "title": "Physical Training", "topic": "training",
+     "body": "Astronauts must be in top physical shape. They exercise daily in space to combat muscle and bone loss."},
+    {"kind": "training", "key": "Simulations", "title": "Simulations", "topic": "training",
+     "body": "Astronauts train in simulators that mimic spacecraft and space station environments."},
+    {"kind": "training", "key": "Space Living", "title": "Space Living", "topic": "training",
+     "body": "In space, astronauts eat specially prepared food, sleep in sleeping bags, and use special toilets."},
+]
+
+
+class ContentCatalog:
+    # Every content row, read once into memory and grouped by kind (in table
+    # order) and by (kind, key). Full-text search goes to the FTS5 index.
+    def __init__(self, pool=None, seed=CONTENT):
+        self.pool = pool
+        if seed:
+            database.seed_content(seed, pool=pool, replace=False)
+        self.fts = database.has_content_index(pool=pool)
+        self.by_kind = defaultdict(list)
+        self.by_key = {}
+        for row in database.load_content(pool=pool):
+            entry = dict(row)
+            entry.update(json.loads(entry.pop("data") or "{}"))
+            self.by_kind[entry["kind"]].append(entry)
+            self.by_key[(entry["kind"], entry["key"])] = entry
+
+    def update(self, entries):
+        # Upsert CONTENT-shaped entries (e.g. from ingest feeds) into the table
+        # and the in-memory groups; changed entries keep their place in order.
+        if not entries:
+            return
+        database.seed_content(entries, pool=self.pool)
+        for e in entries:
+            entry = {"topic": None, "difficulty": None, "date": None}
+            entry.update((key, value) for key, value in e.items() if key != "data")
+            entry.update(e.get("data") or {})
+            current = self.by_key.get((entry["kind"], entry["key"]))
+            group = self.by_kind[entry["kind"]]
+            if current is None:
+                group.append(entry)
+            else:
+                entry["id"] = current.get("id")
+                group[group.index(current)] = entry
+            self.by_key[(entry["kind"], entry["key"])] = entry
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def get(self, kind, key):
+        return self.by_key.get((kind, key))
+
+    def entries(self, kind):
+        return self.by_kind[kind]
+
+    def spacecraft(self):
+        return [{"name": e["title"], "id": e["key"], "era": e["era"], "fact": e["summary"]}
+                for e in self.by_kind["spacecraft"]]
+
+    def missions(self):
+        return sorted(self.by_kind["mission"], key=lambda e: e["date"])
+
+    def quiz_questions(self, topic=None, difficulty=None):
+        return [e for e in self.by_kind["quiz"]
+                if (topic is None or e["topic"] == topic)
+                and (difficulty is None or e["difficulty"] == difficulty)]
+
+    def search(self, text, limit=20):
+        rows = database.search_content(text, limit=limit, fts=self.fts, pool=self.pool)
+        return [self.by_key.get((row["kind"], row["key"]), dict(row)) | {"snippet": row["snippet"]}
+                for row in rows]
@@ -0,0 +1,35 @@
+import argparse
+
+import database
+
+# Teacher dashboard for the quiz, read from the precomputed aggregate tables:
+#
+#     python dashboard.py [--db nasa_explorer.db] [--top 20]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quiz leaderboard and per-question difficulty.")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    database.DB_PATH = args.db
+    database.create_tables()
+
+    print(f"{'rank':>4}  {'student':<20} {'correct':>7} {'answered':>8} {'accuracy':>8} {'avg time':>9}")
+    for rank, row in enumerate(database.leaderboard(args.top), 1):
+        print(f"{rank:>4}  {row['username']:<20} {row['correct']:>7} {row['attempts']:>8} "
+              f"{row['correct'] / row['attempts']:>8.0%} {row['avg_latency_ms'] / 1000:>8.1f}s")
+
+    print()
+    print(f"{'question (hardest first)':<56} {'level':>5} {'answered':>8} {'accuracy':>8} {'avg time':>9}")
+    for row in database.question_stats():
+        title = row["title"] or row["question"]
+        level = row["difficulty"] if row["difficulty"] is not None else "-"
+        print(f"{title[:56]:<56} {level:>5} {row['attempts']:>8} {row['accuracy']:>8.0%} "
+              f"{row['avg_latency_ms'] / 1000:>8.1f}s")
+    database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,817 @@
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+import queue
+import time
+from contextlib import contextmanager
+
+DB_PATH = 'nasa_explorer.db'
+
+# SQL is kept in constants so sqlite3's per-connection statement cache
+# always sees the exact same string and reuses the prepared statement.
+SELECT_USER = "SELECT * FROM users WHERE username = ? AND password = ?"
+INSERT_USER = "INSERT INTO users (username, password) VALUES (?, ?)"
+INSERT_PROGRESS = "INSERT INTO progress (user_id) VALUES (?)"
+SELECT_PROGRESS = "SELECT * FROM progress WHERE user_id = ?"
+UPDATE_PROGRESS = """
+    UPDATE progress SET explore_progress = ?, solar_progress = ?, quiz_progress = ?
+    WHERE user_id = ?
+"""
+
+CREATE_USERS = '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE,
+        password TEXT
+    )
+'''
+# user_id is the primary key (an alias for the rowid), so per-user reads and
+# updates are a B-tree lookup instead of a table scan.
+CREATE_PROGRESS = '''
+    CREATE TABLE IF NOT EXISTS progress (
+        user_id INTEGER PRIMARY KEY,
+        explore_progress INTEGER DEFAULT 0,
+        solar_progress INTEGER DEFAULT 0,
+        quiz_progress INTEGER DEFAULT 0,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+'''
+IMPORT_USER = "INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)"
+IMPORT_PROGRESS = "INSERT OR IGNORE INTO progress (user_id) SELECT id FROM users WHERE id > ?"
+SELECT_MAX_USER_ID = "SELECT COALESCE(MAX(id), 0) FROM users"
+
+# Quiz history. quiz_attempts is append-only; quiz_scores (per user) and
+# quiz_question_stats (per question) are running totals updated by a trigger on
+# every insert, so leaderboards and difficulty reports never scan attempts.
+CREATE_QUIZ = [
+    """CREATE TABLE IF NOT EXISTS quiz_attempts (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users (id),
+        question TEXT NOT NULL,
+        choice INTEGER NOT NULL,
+        correct INTEGER NOT NULL,
+        latency_ms INTEGER NOT NULL,
+        answered_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS quiz_scores (
+        user_id INTEGER PRIMARY KEY REFERENCES users (id),
+        attempts INTEGER NOT NULL DEFAULT 0,
+        correct INTEGER NOT NULL DEFAULT 0,
+        total_latency_ms INTEGER NOT NULL DEFAULT 0,
+        last_answered_at REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS quiz_attempts_user ON quiz_attempts (user_id, id)",
+    "CREATE INDEX IF NOT EXISTS quiz_scores_rank ON quiz_scores (correct DESC, attempts, user_id)",
+    """CREATE TABLE IF NOT EXISTS quiz_question_stats (
+        question TEXT PRIMARY KEY,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        correct INTEGER NOT NULL DEFAULT 0,
+        total_latency_ms INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS quiz_attempts_ai AFTER INSERT ON quiz_attempts BEGIN
+        INSERT INTO quiz_scores (user_id, attempts, correct, total_latency_ms, last_answered_at)
+        VALUES (new.user_id, 1, new.correct, new.latency_ms, new.answered_at)
+        ON CONFLICT (user_id) DO UPDATE SET
+            attempts = attempts + 1, correct = correct + new.correct,
+            total_latency_ms = total_latency_ms + new.latency_ms,
+            last_answered_at = MAX(COALESCE(last_answered_at, 0), new.answered_at);
+        INSERT INTO quiz_question_stats (question, attempts, correct, total_latency_ms)
+        VALUES (new.question, 1, new.correct, new.latency_ms)
+        ON CONFLICT (question) DO UPDATE SET
+            attempts = attempts + 1, correct = correct + new.correct,
+            total_latency_ms = total_latency_ms + new.latency_ms;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS quiz_attempts_no_update BEFORE UPDATE ON quiz_attempts BEGIN
+        SELECT RAISE(ABORT, 'quiz_attempts is append-only');
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS quiz_attempts_no_delete BEFORE DELETE ON quiz_attempts BEGIN
+        SELECT RAISE(ABORT, 'quiz_attempts is append-only');
+    END""",
+]
+INSERT_ATTEMPT = """
+    INSERT INTO quiz_attempts (user_id, question, choice, correct, latency_ms, answered_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SELECT_LEADERBOARD = """
+    SELECT users.username, s.user_id, s.attempts, s.correct,
+           s.total_latency_ms * 1.0 / s.attempts AS avg_latency_ms
+    FROM quiz_scores s JOIN users ON users.id = s.user_id
+    ORDER BY s.correct DESC, s.attempts, s.user_id
+    LIMIT ?
+"""
+SELECT_RECENT_ATTEMPTS = "SELECT question, correct FROM quiz_attempts WHERE user_id = ? ORDER BY id DESC LIMIT ?"
+SELECT_QUIZ_SCORE = "SELECT * FROM quiz_scores WHERE user_id = ?"
+SELECT_QUIZ_PROGRESS = """
+    SELECT COALESCE(p.quiz_progress, 0) AS stored, COALESCE(s.correct, 0) AS correct
+    FROM users LEFT JOIN progress p ON p.user_id = users.id LEFT JOIN quiz_scores s ON s.user_id = users.id
+    WHERE users.id = ?
+"""
+SELECT_QUESTION_STATS = """
+    SELECT q.question, content.title, content.difficulty, q.attempts, q.correct,
+           q.correct * 1.0 / q.attempts AS accuracy, q.total_latency_ms * 1.0 / q.attempts AS avg_latency_ms
+    FROM quiz_question_stats q
+    LEFT JOIN content ON content.kind = 'quiz' AND content.key = q.question
+    ORDER BY accuracy, q.question
+"""
+REBUILD_QUIZ_AGGREGATES = [
+    "DELETE FROM quiz_scores",
+    "DELETE FROM quiz_question_stats",
+    """INSERT INTO quiz_scores (user_id, attempts, correct, total_latency_ms, last_answered_at)
+       SELECT user_id, COUNT(*), SUM(correct), SUM(latency_ms), MAX(answered_at)
+       FROM quiz_attempts GROUP BY user_id""",
+    """INSERT INTO quiz_question_stats (question, attempts, correct, total_latency_ms)
+       SELECT question, COUNT(*), SUM(correct), SUM(latency_ms)
+       FROM quiz_attempts GROUP BY question""",
+]
+
+# Session telemetry (see telemetry.py). Rows arrive in bulk from the event
+# bus's flush thread; reports read a time range through the ts index.
+CREATE_EVENTS = [
+    """CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        ts REAL NOT NULL,
+        session TEXT NOT NULL,
+        user_id INTEGER,
+        kind TEXT NOT NULL,
+        subject TEXT,
+        detail TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS events_ts ON events (ts)",
+]
+INSERT_EVENT = "INSERT INTO events (ts, session, user_id, kind, subject, detail) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_EVENTS = "SELECT ts, session, user_id, kind, subject, detail FROM events WHERE ts >= ? AND ts < ? ORDER BY ts"
+
+# Educational content: one row per spacecraft, planet, mission, quiz item,
+# fun fact or training module. Type-specific fields (quiz options, spacecraft
+# era) live in the JSON `data` column. content_fts is an external-content FTS5
+# index over the same rows, kept in sync by triggers.
+CREATE_CONTENT = '''
+    CREATE TABLE IF NOT EXISTS content (
+        id INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        title TEXT NOT NULL,
+        body TEXT NOT NULL,
+        topic TEXT,
+        difficulty INTEGER,
+        date TEXT,
+        data TEXT,
+        UNIQUE (kind, key)
+    )
+'''
+CREATE_CONTENT_INDEX = "CREATE INDEX IF NOT EXISTS content_kind ON content (kind, topic, difficulty)"
+CREATE_CONTENT_FTS = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5("
+    "title, body, topic, content='content', content_rowid='id', tokenize='porter unicode61')",
+    """CREATE TRIGGER IF NOT EXISTS content_ai AFTER INSERT ON content BEGIN
+        INSERT INTO content_fts (rowid, title, body, topic) VALUES (new.id, new.title, new.body, new.topic);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS content_ad AFTER DELETE ON content BEGIN
+        INSERT INTO content_fts (content_fts, rowid, title, body, topic)
+        VALUES ('delete', old.id, old.title, old.body, old.topic);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS content_au AFTER UPDATE ON content BEGIN
+        INSERT INTO content_fts (content_fts, rowid, title, body, topic)
+        VALUES ('delete', old.id, old.title, old.body, old.topic);
+        INSERT INTO content_fts (rowid, title, body, topic) VALUES (new.id, new.title, new.body, new.topic);
+    END""",
+]
+# Unchanged rows are skipped by the WHERE clause, so repeating an update costs
+# no writes and leaves the FTS index alone.
+UPSERT_CONTENT = """
+    INSERT INTO content (kind, key, title, body, topic, difficulty, date, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (kind, key) DO UPDATE SET
+        title = excluded.title, body = excluded.body, topic = excluded.topic,
+        difficulty = excluded.difficulty, date = excluded.date, data = excluded.data
+    WHERE (content.title, content.body, content.topic, content.difficulty, content.date, content.data)
+        IS NOT (excluded.title, excluded.body, excluded.topic, excluded.difficulty, excluded.date, excluded.data)
+"""
+# The startup seed only fills in missing rows, so rows refreshed since (e.g.
+# from the feeds) are never rolled back to the bundled text.
+INSERT_MISSING_CONTENT = """
+    INSERT INTO content (kind, key, title, body, topic, difficulty, date, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (kind, key) DO NOTHING
+"""
+SELECT_CONTENT = "SELECT * FROM content ORDER BY id"
+SEARCH_CONTENT = """
+    SELECT content.*, snippet(content_fts, 1, '[', ']', '...', 10) AS snippet
+    FROM content_fts JOIN content ON content.id = content_fts.rowid
+    WHERE content_fts MATCH ?
+    ORDER BY bm25(content_fts, 10.0, 1.0, 2.0)
+    LIMIT ?
+"""
+SEARCH_CONTENT_LIKE = """
+    SELECT content.*, substr(body, 1, 60) AS snippet FROM content
+    WHERE title LIKE ? OR body LIKE ? OR topic LIKE ?
+    ORDER BY title LIKE ? DESC, id
+    LIMIT ?
+"""
+
+
+def is_busy_error(error):
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class ConnectionPool:
+    def __init__(self, path=DB_PATH, size=4, busy_timeout=5.0, retries=5,
+                 retry_delay=0.02, cached_statements=128):
+        self.path = path
+        self.size = size
+        self.busy_timeout = busy_timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.cached_statements = cached_statements
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.closed = False
+        self._local = threading.local()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats = {
+                "transactions": 0,
+                "pool_wait": 0.0,
+                "lock_wait": 0.0,
+                "max_lock_wait": 0.0,
+                "retries": 0,
+                "busy_errors": 0,
+            }
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                               check_same_thread=False, cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        return conn
+
+    def _acquire(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self.closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+                if len(self._all) < self.size:
+                    conn = self._connect()
+                    self._all.append(conn)
+                    return conn
+            started = time.perf_counter()
+            conn = self._idle.get()
+            self._add_stat("pool_wait", time.perf_counter() - started)
+        if conn is None:
+            # close() wakes waiting threads with None; pass it on to the next one.
+            self._idle.put(None)
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        return conn
+
+    def _release(self, conn):
+        # Connections still checked out when the pool closes are closed on return.
+        with self._lock:
+            if not self.closed:
+                self._idle.put(conn)
+                return
+            self._all.remove(conn)
+        conn.close()
+
+    def _add_stat(self, key, value):
+        with self._stats_lock:
+            self.stats[key] += value
+
+    @contextmanager
+    def connection(self):
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(conn)
+
+    @contextmanager
+    def single_attempt(self, busy_timeout=0.25):
+        # On this thread, run() makes one attempt with a short busy timeout
+        # instead of retrying: for last-chance writes that have a fallback.
+        self._local.single = busy_timeout
+        try:
+            yield
+        finally:
+            self._local.single = None
+
+    def run(self, work, write=False):
+        delay = self.retry_delay
+        single = getattr(self._local, "single", None)
+        retries = 0 if single is not None else self.retries
+        for attempt in range(retries + 1):
+            with self.connection() as conn:
+                if single is not None:
+                    conn.execute(f"PRAGMA busy_timeout={int(single * 1000)}")
+                try:
+                    if not write:
+                        return work(conn)
+                    started = time.perf_counter()
+                    conn.execute("BEGIN IMMEDIATE")
+                    waited = time.perf_counter() - started
+                    with self._stats_lock:
+                        self.stats["lock_wait"] += waited
+                        self.stats["max_lock_wait"] = max(self.stats["max_lock_wait"], waited)
+                    result = work(conn)
+                    conn.execute("COMMIT")
+                    self._add_stat("transactions", 1)
+                    return result
+                except sqlite3.OperationalError as e:
+                    if not is_busy_error(e):
+                        raise
+                    self._add_stat("busy_errors", 1)
+                    if attempt == retries:
+                        raise
+                finally:
+                    if single is not None:
+                        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+            self._add_stat("retries", 1)
+            time.sleep(delay)
+            delay *= 2
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    self._all.remove(conn)
+                    conn.close()
+            self._idle.put(None)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            _pool = ConnectionPool(DB_PATH)
+        return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def create_tables(pool=None):
+    pool = pool or get_pool()
+
+    def work(conn):
+        conn.execute(CREATE_USERS)
+        conn.execute(CREATE_PROGRESS)
+        conn.execute(CREATE_CONTENT)
+        conn.execute(CREATE_CONTENT_INDEX)
+        for statement in CREATE_QUIZ + CREATE_EVENTS:
+            conn.execute(statement)
+    pool.run(work, write=True)
+    migrate(pool)
+    create_content_index(pool)
+    recover_pending(pool)
+
+
+def _progress_primary_key(conn):
+    # Databases created before user_id became the primary key: rebuild the
+    # table, keeping the furthest progress if a user somehow has several rows.
+    columns = conn.execute("PRAGMA table_info(progress)").fetchall()
+    if any(column["name"] == "user_id" and column["pk"] for column in columns):
+        return
+    conn.execute("ALTER TABLE progress RENAME TO progress_old")
+    conn.execute(CREATE_PROGRESS)
+    conn.execute("""
+        INSERT INTO progress (user_id, explore_progress, solar_progress, quiz_progress)
+        SELECT user_id, MAX(explore_progress), MAX(solar_progress), MAX(quiz_progress)
+        FROM progress_old WHERE user_id IS NOT NULL GROUP BY user_id
+    """)
+    conn.execute("DROP TABLE progress_old")
+
+
+# Schema migrations, applied in order. PRAGMA user_version records how many have
+# run; each one runs in the same transaction that bumps it.
+MIGRATIONS = [
+    _progress_primary_key,
+]
+
+
+def schema_version(pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(pool=None):
+    pool = pool or get_pool()
+    applied = []
+    for version, migration in enumerate(MIGRATIONS, 1):
+        def work(conn):
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                return False
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            return True
+        if pool.run(work, write=True):
+            applied.append(migration.__name__.strip("_"))
+    return applied
+
+
+def create_content_index(pool=None):
+    # FTS5 is compiled into practically every SQLite build, but not all of
+    # them; search_content() falls back to LIKE when the index is missing.
+    pool = pool or get_pool()
+
+    def work(conn):
+        for statement in CREATE_CONTENT_FTS:
+            conn.execute(statement)
+    try:
+        pool.run(work, write=True)
+        return True
+    except sqlite3.OperationalError as e:
+        print(f"Full-text search unavailable, using LIKE: {e}", file=sys.stderr)
+        return False
+
+
+def has_content_index(pool=None):
+    pool = pool or get_pool()
+    row = pool.run(lambda conn: conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'content_fts'").fetchone())
+    return row is not None
+
+
+def seed_content(entries, pool=None, replace=True):
+    pool = pool or get_pool()
+    sql = UPSERT_CONTENT if replace else INSERT_MISSING_CONTENT
+    rows = [(e["kind"], e["key"], e["title"], e["body"], e.get("topic"), e.get("difficulty"),
+             e.get("date"), json.dumps(e["data"], sort_keys=True) if "data" in e else None)
+            for e in entries]
+    pool.run(lambda conn: conn.executemany(sql, rows), write=True)
+
+
+def load_content(pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_CONTENT).fetchall())
+
+
+def fts_query(text):
+    # Every word must match, the last one as a prefix so results appear while typing.
+    words = ["".join(ch for ch in word if ch.isalnum()) for word in text.split()]
+    words = [word for word in words if word]
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words[:-1]) + f' "{words[-1]}"*'
+
+
+def search_content(text, limit=20, fts=True, pool=None):
+    pool = pool or get_pool()
+    if fts:
+        query = fts_query(text)
+        if query is None:
+            return []
+        return pool.run(lambda conn: conn.execute(SEARCH_CONTENT, (query, limit)).fetchall())
+    pattern = f"%{text.strip()}%"
+    return pool.run(lambda conn: conn.execute(
+        SEARCH_CONTENT_LIKE, (pattern, pattern, pattern, pattern, limit)).fetchall())
+
+
+def find_user(username, password, pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_USER, (username, password)).fetchone())
+
+
+def create_user(username, password, pool=None):
+    pool = pool or get_pool()
+
+    def work(conn):
+        user_id = conn.execute(INSERT_USER, (username, password)).lastrowid
+        conn.execute(INSERT_PROGRESS, (user_id,))
+        return user_id
+    return pool.run(work, write=True)
+
+
+def import_users(accounts, batch_size=1000, pool=None, on_batch=None):
+    # Bulk account creation: one write transaction per `batch_size` accounts
+    # instead of one per user. Usernames that already exist are skipped. Each
+    # batch's progress rows come from a single INSERT ... SELECT over the ids
+    # the batch created, which grow monotonically under AUTOINCREMENT.
+    pool = pool or get_pool()
+    totals = {"created": 0, "skipped": 0, "batches": 0}
+
+    def work(conn, batch):
+        first_new = conn.execute(SELECT_MAX_USER_ID).fetchone()[0]
+        created = conn.executemany(IMPORT_USER, batch).rowcount
+        conn.execute(IMPORT_PROGRESS, (first_new,))
+        return created
+
+    batch = []
+    for account in accounts:
+        batch.append(account)
+        if len(batch) >= batch_size:
+            _import_batch(pool, work, batch, totals, on_batch)
+            batch = []
+    if batch:
+        _import_batch(pool, work, batch, totals, on_batch)
+    return totals
+
+
+def _import_batch(pool, work, batch, totals, on_batch):
+    created = pool.run(lambda conn: work(conn, batch), write=True)
+    totals["created"] += created
+    totals["skipped"] += len(batch) - created
+    totals["batches"] += 1
+    if on_batch:
+        on_batch(totals)
+
+
+def record_attempts(attempts, pool=None):
+    # attempts: (user_id, question, choice, correct, latency_ms, answered_at) tuples.
+    pool = pool or get_pool()
+    pool.run(lambda conn: conn.executemany(INSERT_ATTEMPT, attempts), write=True)
+
+
+def recent_attempts(user_id, limit=500, pool=None):
+    # (question, correct) for the user's latest answers, oldest first.
+    pool = pool or get_pool()
+    rows = pool.run(lambda conn: conn.execute(SELECT_RECENT_ATTEMPTS, (user_id, limit)).fetchall())
+    return [(row["question"], bool(row["correct"])) for row in reversed(rows)]
+
+
+def leaderboard(limit=10, pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_LEADERBOARD, (limit,)).fetchall())
+
+
+def quiz_score(user_id, pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_QUIZ_SCORE, (user_id,)).fetchone())
+
+
+def quiz_progress(user_id, cap, pool=None):
+    # Correct answers on record, up to `cap`, but never below the stored
+    # quiz_progress: users from before quiz_attempts existed keep what they had.
+    pool = pool or get_pool()
+    row = pool.run(lambda conn: conn.execute(SELECT_QUIZ_PROGRESS, (user_id,)).fetchone())
+    return 0 if row is None else max(row["stored"], min(cap, row["correct"]))
+
+
+def question_stats(pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_QUESTION_STATS).fetchall())
+
+
+def rebuild_quiz_aggregates(pool=None):
+    # Recompute the running totals from the raw attempts, e.g. after restoring a backup.
+    pool = pool or get_pool()
+
+    def work(conn):
+        for statement in REBUILD_QUIZ_AGGREGATES:
+            conn.execute(statement)
+    pool.run(work, write=True)
+
+
+def record_events(rows, pool=None):
+    # rows: (ts, session, user_id, kind, subject, detail) tuples.
+    pool = pool or get_pool()
+    pool.run(lambda conn: conn.executemany(INSERT_EVENT, rows), write=True)
+
+
+def load_events(start, end, pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_EVENTS, (start, end)).fetchall())
+
+
+def load_progress(user_id, pool=None):
+    pool = pool or get_pool()
+    return pool.run(lambda conn: conn.execute(SELECT_PROGRESS, (user_id,)).fetchone())
+
+
+def save_progress(user_id, explore, solar, quiz, pool=None):
+    pool = pool or get_pool()
+    pool.run(lambda conn: conn.execute(UPDATE_PROGRESS, (explore, solar, quiz, user_id)), write=True)
+
+
+def pending_path(pool):
+    return f"{pool.path}.pending.jsonl"
+
+
+def recover_pending(pool=None):
+    # Writes that close() couldn't get into the database were appended to the
+    # pending file; apply them (oldest first) and remove it.
+    pool = pool or get_pool()
+    path = pending_path(pool)
+    try:
+        with open(path, encoding="utf-8") as f:
+            spills = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"Cannot read pending writes in {path}: {e}", file=sys.stderr)
+        return 0
+
+    def work(conn):
+        for spill in spills:
+            if spill["kind"] == "progress":
+                conn.executemany(UPDATE_PROGRESS, [(explore, solar, quiz, user_id)
+                                                   for user_id, explore, solar, quiz in spill["rows"]])
+            elif spill["kind"] == "attempts":
+                conn.executemany(INSERT_ATTEMPT, [tuple(row) for row in spill["rows"]])
+    # One transaction for the whole file: either every spilled row lands and the
+    # file goes, or none do and it is kept, so nothing is applied twice.
+    try:
+        pool.run(work, write=True)
+    except sqlite3.Error as e:
+        print(f"Pending writes in {path} not applied, will retry: {e}", file=sys.stderr)
+        return 0
+    os.remove(path)
+    return sum(len(spill["rows"]) for spill in spills)
+
+
+class WriteBehind:
+    # Write-behind persistence: callers queue changes in memory and a background
+    # thread writes them in one transaction every `interval` seconds, or sooner
+    # once `max_pending` pile up. Subclasses decide what a batch is by
+    # implementing _take() and _write(), and _requeue() for failed writes;
+    # _rows() turns a batch into JSON rows for the pending file.
+    label = "Write"
+    kind = None
+
+    def __init__(self, pool=None, interval=2.0, max_pending=10):
+        self.pool = pool
+        self.interval = interval
+        self.max_pending = max_pending
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self.stats = {
+            "changes": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+        self._thread = threading.Thread(target=self._run, name=f"{self.label.lower()}-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def _queued(self):
+        # Call with self._cond held, after recording a change.
+        self._pending += 1
+        self.stats["changes"] += 1
+        if self._pending >= self.max_pending:
+            self._cond.notify()
+
+    def _take(self):
+        raise NotImplementedError
+
+    def _requeue(self, batch):
+        pass
+
+    def _write(self, batch):
+        raise NotImplementedError
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._pending >= self.max_pending,
+                                    timeout=self.interval)
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._cond:
+                if not self._pending:
+                    return True
+                batch, count = self._take(), self._pending
+                self._pending = 0
+            started = time.perf_counter()
+            try:
+                self._write(batch)
+            except sqlite3.Error as e:
+                with self._cond:
+                    self._requeue(batch)
+                    self._pending += count
+                self.stats["failed_flushes"] += 1
+                print(f"{self.label} flush failed, will retry: {e}", file=sys.stderr)
+                return False
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stats["flushes"] += 1
+            self.stats["last_flush_ms"] = elapsed
+            self.stats["max_flush_ms"] = max(self.stats["max_flush_ms"], elapsed)
+            self.stats["total_flush_ms"] += elapsed
+            return True
+
+    def close(self):
+        with self._cond:
+            if self._closed and not self._pending:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=self.interval + 1)
+        # One last flush, without retries, so closing never waits out the
+        # pool's backoff; if the database can't take it, the rows go to the
+        # pending file rather than being lost, and the next create_tables()
+        # applies them.
+        pool = self.pool or get_pool()
+        with pool.single_attempt():
+            written = self.flush()
+        if not written:
+            self._spill(pool)
+        atexit.unregister(self.close)
+
+    def _rows(self, batch):
+        raise NotImplementedError
+
+    def _spill(self, pool):
+        with self._write_lock, self._cond:
+            if not self._pending:
+                return
+            rows = self._rows(self._take())
+            self._pending = 0
+        path = pending_path(pool)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"kind": self.kind, "rows": rows}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        print(f"{self.label} flush failed; {len(rows)} pending rows kept in {path}", file=sys.stderr)
+
+
+class ProgressWriter(WriteBehind):
+    # Coalesces a user's progress changes: only the latest snapshot is written,
+    # as a single UPDATE, however many changes were marked since the last flush.
+    label = "Progress"
+    kind = "progress"
+
+    def __init__(self, user_id, pool=None, interval=2.0, max_pending=10):
+        self.user_id = user_id
+        self._snapshot = None
+        WriteBehind.__init__(self, pool, interval, max_pending)
+
+    def mark_dirty(self, progress):
+        with self._cond:
+            self._snapshot = (progress["explore"], progress["solar"], progress["quiz"])
+            self._queued()
+
+    def _take(self):
+        return self._snapshot
+
+    def _write(self, snapshot):
+        save_progress(self.user_id, *snapshot, pool=self.pool)
+
+    def _rows(self, snapshot):
+        return [[self.user_id, *snapshot]]
+
+
+class AttemptWriter(WriteBehind):
+    # Appends quiz attempts in batches: one executemany per flush. The
+    # aggregate tables are kept current by triggers in the same transaction.
+    label = "Quiz attempt"
+    kind = "attempts"
+
+    def __init__(self, pool=None, interval=2.0, max_pending=50):
+        self._queue = []
+        WriteBehind.__init__(self, pool, interval, max_pending)
+
+    def record(self, user_id, question, choice, correct, latency_ms):
+        with self._cond:
+            self._queue.append((user_id, question, choice, int(correct), int(latency_ms), time.time()))
+            self._queued()
+
+    def _take(self):
+        batch, self._queue = self._queue, []
+        return batch
+
+    def _requeue(self, batch):
+        self._queue[:0] = batch
+
+    def _write(self, batch):
+        record_attempts(batch, pool=self.pool)
+
+    def _rows(self, batch):
+        return [list(row) for row in batch]
@@ -0,0 +1,658 @@
+# Display-free stand-in for the parts of tkinter the explorer uses.
+#
+# install() registers it as `tkinter` (and `tkinter.messagebox`) in sys.modules so
+# main.py can be imported and driven on CI machines and kiosks without an X server.
+# Canvas items are tracked in plain dicts so benchmarks can count them.
+import heapq
+import itertools
+import sys
+import time
+import types
+
+TkVersion = 8.6
+BOTH = "both"
+LEFT = "left"
+RIGHT = "right"
+TOP = "top"
+BOTTOM = "bottom"
+X = "x"
+Y = "y"
+RIDGE = "ridge"
+HORIZONTAL = "horizontal"
+VERTICAL = "vertical"
+END = "end"
+NW = "nw"
+CENTER = "center"
+ALL = "all"
+
+
+class TclError(Exception):
+    pass
+
+
+class _Loop:
+    # Shared event queue standing in for the Tcl interpreter's timer list.
+    def __init__(self):
+        self.timers = []
+        self.cancelled = set()
+        self.ids = itertools.count(1)
+
+    def after(self, ms, callback, *args):
+        after_id = f"after#{next(self.ids)}"
+        due = time.perf_counter() + max(0, ms) / 1000
+        heapq.heappush(self.timers, (due, after_id, callback, args))
+        return after_id
+
+    def cancel(self, after_id):
+        self.cancelled.add(after_id)
+
+    def run_due(self):
+        now = time.perf_counter()
+        ran = 0
+        while self.timers and self.timers[0][0] <= now:
+            _, after_id, callback, args = heapq.heappop(self.timers)
+            if after_id in self.cancelled:
+                self.cancelled.discard(after_id)
+                continue
+            callback(*args)
+            ran += 1
+        return ran
+
+    def pump(self, seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            self.run_due()
+            if self.timers:
+                wait = min(self.timers[0][0], end) - time.perf_counter()
+            else:
+                wait = end - time.perf_counter()
+            if wait > 0:
+                time.sleep(min(wait, 0.001))
+
+
+_loop = _Loop()
+
+
+class Misc:
+    _default_width = 1
+    _default_height = 1
+
+    def __init__(self, master=None, cnf=None, **kw):
+        self.master = master
+        self.children = {}
+        self.options = dict(cnf or {}, **kw)
+        self.bindings = {}
+        self.destroyed = False
+        self.manager = None
+        self.width = int(kw.get("width", self._default_width) or self._default_width)
+        self.height = int(kw.get("height", self._default_height) or self._default_height)
+        if master is not None:
+            master.children[str(id(self))] = self
+
+    def config(self, cnf=None, **kw):
+        if cnf is None and not kw:
+            return dict(self.options)
+        self.options.update(cnf or {}, **kw)
+        if "width" in kw:
+            self.width = int(kw["width"])
+        if "height" in kw:
+            self.height = int(kw["height"])
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    __getitem__ = cget
+
+    def __setitem__(self, key, value):
+        self.config(**{key: value})
+
+    def bind(self, sequence=None, func=None, add=None):
+        self.bindings.setdefault(sequence, [])
+        if add:
+            self.bindings[sequence].append(func)
+        else:
+            self.bindings[sequence] = [func]
+
+    def bind_all(self, sequence=None, func=None, add=None):
+        self.bind(sequence, func, add)
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+
+    def event_generate(self, sequence, **kw):
+        kw.setdefault("widget", self)
+        event = Event(**kw)
+        for func in list(self.bindings.get(sequence, [])):
+            func(event)
+
+    def after(self, ms, func=None, *args):
+        return _loop.after(ms, func, *args)
+
+    def after_idle(self, func, *args):
+        return _loop.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        _loop.cancel(after_id)
+
+    def update(self):
+        _loop.run_due()
+
+    def update_idletasks(self):
+        pass
+
+    def pack(self, **kw):
+        self.manager = "pack"
+
+    def grid(self, **kw):
+        self.manager = "grid"
+
+    def place(self, **kw):
+        self.manager = "place"
+
+    pack_configure = pack
+    grid_configure = grid
+
+    def pack_forget(self):
+        self.manager = None
+
+    grid_forget = pack_forget
+    place_forget = pack_forget
+
+    def grid_rowconfigure(self, index, **kw):
+        pass
+
+    def grid_columnconfigure(self, index, **kw):
+        pass
+
+    rowconfigure = grid_rowconfigure
+    columnconfigure = grid_columnconfigure
+
+    def winfo_children(self):
+        return [c for c in self.children.values() if not c.destroyed]
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def winfo_toplevel(self):
+        widget = self
+        while widget.master is not None and not isinstance(widget, (Tk, Toplevel)):
+            widget = widget.master
+        return widget
+
+    def focus_set(self):
+        pass
+
+    focus = focus_set
+
+    def destroy(self):
+        for child in list(self.children.values()):
+            child.destroy()
+        self.destroyed = True
+        if self.master is not None:
+            self.master.children.pop(str(id(self)), None)
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.event_generate("<Configure>", width=width, height=height)
+        top = self.winfo_toplevel()
+        if top is not self:
+            top.event_generate("<Configure>", widget=self, width=width, height=height)
+
+
+class Event:
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+
+class Wm:
+    def title(self, text=None):
+        if text is not None:
+            self.options["title"] = text
+        return self.options.get("title", "")
+
+    def geometry(self, spec=None):
+        if spec:
+            size = spec.split("+")[0]
+            if "x" in size:
+                w, h = size.split("x")
+                self.width, self.height = int(w), int(h)
+        return f"{self.width}x{self.height}"
+
+    def protocol(self, name=None, func=None):
+        self.bindings[name] = [func]
+
+    def attributes(self, *args):
+        pass
+
+    def withdraw(self):
+        self.options["state"] = "withdrawn"
+
+    def deiconify(self):
+        self.options["state"] = "normal"
+
+    def iconify(self):
+        self.options["state"] = "iconic"
+
+    def state(self, value=None):
+        return self.options.get("state", "normal")
+
+    def lift(self):
+        pass
+
+    def transient(self, master=None):
+        pass
+
+    def resizable(self, width=None, height=None):
+        pass
+
+    def minsize(self, width=None, height=None):
+        pass
+
+    def iconbitmap(self, *args, **kw):
+        pass
+
+
+class Tk(Misc, Wm):
+    _default_width = 1000
+    _default_height = 700
+
+    def __init__(self, *args, **kw):
+        Misc.__init__(self, None)
+
+    def mainloop(self, n=0):
+        while not self.destroyed:
+            _loop.pump(0.05)
+
+    def pump(self, seconds):
+        _loop.pump(seconds)
+
+    def report_callback_exception(self, exc, value, tb):
+        import traceback
+        traceback.print_exception(exc, value, tb)
+
+    def quit(self):
+        self.destroy()
+
+
+class Toplevel(Misc, Wm):
+    _default_width = 200
+    _default_height = 200
+
+
+class Frame(Misc):
+    pass
+
+
+class Label(Misc):
+    pass
+
+
+class Button(Misc):
+    def invoke(self):
+        command = self.options.get("command")
+        if command:
+            return command()
+
+
+class Entry(Misc):
+    def __init__(self, master=None, cnf=None, **kw):
+        Misc.__init__(self, master, cnf, **kw)
+        self.value = ""
+
+    def get(self):
+        return self.value
+
+    def insert(self, index, text):
+        self.value = self.value + text if index == END else text + self.value
+
+    def delete(self, first, last=None):
+        self.value = ""
+
+
+class Scale(Misc):
+    def __init__(self, master=None, cnf=None, **kw):
+        Misc.__init__(self, master, cnf, **kw)
+        self.value = kw.get("from_", 0)
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        command = self.options.get("command")
+        if command:
+            command(str(value))
+
+
+class Listbox(Misc):
+    def __init__(self, master=None, cnf=None, **kw):
+        Misc.__init__(self, master, cnf, **kw)
+        self.items = []
+
+    def insert(self, index, *elements):
+        self.items.extend(elements)
+
+    def delete(self, first, last=None):
+        self.items = []
+
+    def get(self, first, last=None):
+        return self.items[first]
+
+    def size(self):
+        return len(self.items)
+
+    def curselection(self):
+        return ()
+
+
+class Variable:
+    def __init__(self, master=None, value=None, name=None):
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.traces:
+            callback()
+
+    def trace_add(self, mode, callback):
+        self.traces.append(lambda: callback("", "", mode))
+
+
+class StringVar(Variable):
+    def __init__(self, master=None, value="", name=None):
+        Variable.__init__(self, master, value, name)
+
+
+class IntVar(Variable):
+    def __init__(self, master=None, value=0, name=None):
+        Variable.__init__(self, master, value, name)
+
+
+class DoubleVar(Variable):
+    def __init__(self, master=None, value=0.0, name=None):
+        Variable.__init__(self, master, value, name)
+
+
+class OptionMenu(Misc):
+    def __init__(self, master, variable, value, *values, **kw):
+        Misc.__init__(self, master)
+        self.variable = variable
+        self.values = (value,) + values
+
+
+class PhotoImage:
+    def __init__(self, name=None, cnf=None, master=None, **kw):
+        self.options = dict(kw)
+
+    def width(self):
+        return int(self.options.get("width", 0))
+
+    def height(self):
+        return int(self.options.get("height", 0))
+
+    def paste(self, *args, **kw):
+        pass
+
+
+class Canvas(Misc):
+    _default_width = 980
+    _default_height = 480
+
+    def __init__(self, master=None, cnf=None, **kw):
+        Misc.__init__(self, master, cnf, **kw)
+        self.items = {}
+        self.item_bindings = {}
+        self.ids = itertools.count(1)
+        self.stats = {"created": 0, "deleted": 0, "configured": 0, "moved": 0}
+
+    def _create(self, kind, args, kw):
+        coords = []
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                coords.extend(arg)
+            else:
+                coords.append(arg)
+        tags = kw.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = next(self.ids)
+        self.items[item] = {"type": kind, "coords": [float(c) for c in coords],
+                            "options": kw, "tags": list(tags)}
+        self.stats["created"] += 1
+        return item
+
+    def create_oval(self, *args, **kw):
+        return self._create("oval", args, kw)
+
+    def create_rectangle(self, *args, **kw):
+        return self._create("rectangle", args, kw)
+
+    def create_polygon(self, *args, **kw):
+        return self._create("polygon", args, kw)
+
+    def create_line(self, *args, **kw):
+        return self._create("line", args, kw)
+
+    def create_text(self, *args, **kw):
+        return self._create("text", args, kw)
+
+    def create_image(self, *args, **kw):
+        return self._create("image", args, kw)
+
+    def create_window(self, *args, **kw):
+        return self._create("window", args, kw)
+
+    def create_arc(self, *args, **kw):
+        return self._create("arc", args, kw)
+
+    def find_withtag(self, tag):
+        if isinstance(tag, int):
+            return (tag,) if tag in self.items else ()
+        if tag == "all":
+            return tuple(self.items)
+        return tuple(i for i, item in self.items.items() if tag in item["tags"])
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        found = []
+        for i, item in self.items.items():
+            box = self._bbox(item)
+            if box and box[0] <= x2 and box[2] >= x1 and box[1] <= y2 and box[3] >= y1:
+                found.append(i)
+        return tuple(found)
+
+    def _bbox(self, item):
+        coords = item["coords"]
+        if not coords:
+            return None
+        xs, ys = coords[0::2], coords[1::2]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def bbox(self, tag):
+        boxes = [self._bbox(self.items[i]) for i in self.find_withtag(tag)]
+        boxes = [b for b in boxes if b]
+        if not boxes:
+            return None
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def gettags(self, item):
+        found = self.find_withtag(item)
+        return tuple(self.items[found[0]]["tags"]) if found else ()
+
+    def type(self, item):
+        found = self.find_withtag(item)
+        return self.items[found[0]]["type"] if found else None
+
+    def addtag_withtag(self, newtag, tag):
+        for i in self.find_withtag(tag):
+            if newtag not in self.items[i]["tags"]:
+                self.items[i]["tags"].append(newtag)
+
+    def dtag(self, tag, tag_to_delete=None):
+        tag_to_delete = tag_to_delete or tag
+        for i in self.find_withtag(tag):
+            if tag_to_delete in self.items[i]["tags"]:
+                self.items[i]["tags"].remove(tag_to_delete)
+
+    def delete(self, *tags):
+        for tag in tags:
+            for i in self.find_withtag(tag):
+                del self.items[i]
+                self.item_bindings.pop(i, None)
+                self.stats["deleted"] += 1
+
+    def coords(self, tag, *args):
+        found = self.find_withtag(tag)
+        if not found:
+            return []
+        if not args:
+            return list(self.items[found[0]]["coords"])
+        coords = []
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                coords.extend(arg)
+            else:
+                coords.append(arg)
+        self.items[found[0]]["coords"] = [float(c) for c in coords]
+        self.stats["moved"] += 1
+
+    def move(self, tag, dx, dy):
+        for i in self.find_withtag(tag):
+            coords = self.items[i]["coords"]
+            for j in range(0, len(coords) - 1, 2):
+                coords[j] += dx
+                coords[j + 1] += dy
+            self.stats["moved"] += 1
+
+    def moveto(self, tag, x, y):
+        box = self.bbox(tag)
+        if box:
+            self.move(tag, x - box[0], y - box[1])
+
+    def scale(self, tag, x0, y0, sx, sy):
+        for i in self.find_withtag(tag):
+            coords = self.items[i]["coords"]
+            for j in range(0, len(coords) - 1, 2):
+                coords[j] = x0 + (coords[j] - x0) * sx
+                coords[j + 1] = y0 + (coords[j + 1] - y0) * sy
+            self.stats["moved"] += 1
+
+    def itemconfig(self, tag, cnf=None, **kw):
+        for i in self.find_withtag(tag):
+            self.items[i]["options"].update(cnf or {}, **kw)
+            self.stats["configured"] += 1
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag, option):
+        found = self.find_withtag(tag)
+        return self.items[found[0]]["options"].get(option, "") if found else ""
+
+    def tag_bind(self, tag, sequence=None, func=None, add=None):
+        self.item_bindings.setdefault(tag, {}).setdefault(sequence, [])
+        if add:
+            self.item_bindings[tag][sequence].append(func)
+        else:
+            self.item_bindings[tag][sequence] = [func]
+
+    def tag_unbind(self, tag, sequence, funcid=None):
+        self.item_bindings.get(tag, {}).pop(sequence, None)
+
+    def tag_raise(self, tag, above=None):
+        pass
+
+    def tag_lower(self, tag, below=None):
+        pass
+
+    lift = tag_raise
+    lower = tag_lower
+
+    def canvasx(self, x, gridspacing=None):
+        return x
+
+    def canvasy(self, y, gridspacing=None):
+        return y
+
+    def fire(self, item, sequence, **kw):
+        # Deliver a synthetic item event, as a click or hover on `item` would.
+        event = Event(widget=self, **kw)
+        handlers = list(self.item_bindings.get(item, {}).get(sequence, []))
+        for tag in self.items.get(item, {}).get("tags", []):
+            handlers.extend(self.item_bindings.get(tag, {}).get(sequence, []))
+        for func in handlers:
+            func(event)
+
+
+class _MessageBox(types.ModuleType):
+    def __init__(self):
+        types.ModuleType.__init__(self, "tkinter.messagebox")
+        self.shown = []
+
+    def _show(self, kind, title, message, result):
+        self.shown.append((kind, title, message))
+        return result
+
+    def showinfo(self, title=None, message=None, **kw):
+        return self._show("info", title, message, "ok")
+
+    def showwarning(self, title=None, message=None, **kw):
+        return self._show("warning", title, message, "ok")
+
+    def showerror(self, title=None, message=None, **kw):
+        return self._show("error", title, message, "ok")
+
+    def askyesno(self, title=None, message=None, **kw):
+        return self._show("question", title, message, True)
+
+
+messagebox = _MessageBox()
+
+
+class _ImageTkPhoto:
+    # Replaces PIL.ImageTk.PhotoImage, which needs a real Tcl interpreter.
+    def __init__(self, image=None, size=None, **kw):
+        self.size = image.size if image is not None else size
+
+    def width(self):
+        return self.size[0]
+
+    def height(self):
+        return self.size[1]
+
+    def paste(self, image, box=None):
+        pass
+
+
+def install():
+    module = sys.modules[__name__]
+    sys.modules["tkinter"] = module
+    sys.modules["tkinter.messagebox"] = messagebox
+    image_tk = types.ModuleType("PIL.ImageTk")
+    image_tk.PhotoImage = _ImageTkPhoto
+    sys.modules["PIL.ImageTk"] = image_tk
+    try:
+        import PIL
+        PIL.ImageTk = image_tk
+    except ImportError:
+        pass
+    return module
+
+
+def pump(seconds):
+    _loop.pump(seconds)
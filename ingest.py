@@ -0,0 +1,252 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import urljoin
+
+# NASA-style JSON feeds that refresh the spacecraft, planet and mission text.
+# Every response is kept on disk with its ETag and Last-Modified, so a refresh
+# sends conditional GETs (an unchanged feed costs one 304) and the app starts
+# from the cache with no network at all. When a fetch fails the cached copy is
+# served instead. Feeds are fetched concurrently by a small thread pool sharing
+# one requests.Session, so connections are reused across feeds and refreshes.
+#
+#     python ingest.py --url http://localhost:8000/feeds/ [--cache feed_cache] [--offline]
+
+FEED_CACHE = "feed_cache"
+WORKERS = 4
+TIMEOUT = 5.0  # seconds, per request
+
+
+def spacecraft_entries(payload, catalog):
+    # {"spacecraft": [{"id", "name", "facts": [...], "era"?, "summary"?}]}. Ships
+    # need a drawn shape, so the feed only updates the ones the app knows.
+    entries = []
+    for item in payload["spacecraft"]:
+        current = catalog.get("spacecraft", item["id"])
+        if current is None:
+            continue
+        name = item.get("name", current["title"])
+        entries.append({"kind": "spacecraft", "key": item["id"], "title": name, "topic": "spacecraft",
+                        "data": {"era": item.get("era", current["era"]),
+                                 "summary": item.get("summary", current["summary"])},
+                        "body": f"{name} Facts:\n" + "\n".join(f"- {fact}" for fact in item["facts"])})
+    return entries
+
+
+def planet_entries(payload, catalog):
+    # {"planets": [{"name", "facts": [...]}]}
+    return [{"kind": "planet", "key": item["name"], "title": item["name"], "topic": "planets",
+             "body": "\n".join(item["facts"])}
+            for item in payload["planets"]]
+
+
+def launch_entries(payload, catalog):
+    # {"launches": [{"name", "date", "summary", "end"?, "ongoing"?}]}: the launch
+    # manifest becomes timeline missions. Dates must be ISO (YYYY-MM-DD), as the
+    # timeline parses them on every draw.
+    entries = []
+    for item in payload["launches"]:
+        date.fromisoformat(item["date"])
+        if item.get("end"):
+            date.fromisoformat(item["end"])
+        entry = {"kind": "mission", "key": item["name"], "title": item["name"], "topic": "history",
+                 "date": item["date"], "body": item["summary"]}
+        data = {key: item[key] for key in ("end", "ongoing") if key in item}
+        if data:
+            entry["data"] = data
+        entries.append(entry)
+    return entries
+
+
+FEEDS = {
+    "spacecraft": ("spacecraft.json", spacecraft_entries),
+    "planets": ("planets.json", planet_entries),
+    "launches": ("launches.json", launch_entries),
+}
+
+
+class HTTPCache:
+    # Per feed, the response body (<name>.json) and its URL and validators
+    # (<name>.meta.json). Files are replaced atomically, so a reader never sees
+    # half a body; the body is written first, so at worst the validators are
+    # stale and the next refresh downloads the feed again.
+    def __init__(self, directory=FEED_CACHE):
+        self.directory = directory
+
+    def _paths(self, name):
+        return (os.path.join(self.directory, f"{name}.json"),
+                os.path.join(self.directory, f"{name}.meta.json"))
+
+    def load(self, name):
+        body_path, meta_path = self._paths(name)
+        try:
+            with open(meta_path, "rb") as f:
+                meta = json.loads(f.read())
+            with open(body_path, "rb") as f:
+                payload = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return payload, meta
+
+    def store(self, name, url, body, headers):
+        os.makedirs(self.directory, exist_ok=True)
+        meta = {"url": url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"),
+                "stored": time.time(), "bytes": len(body)}
+        body_path, meta_path = self._paths(name)
+        self._replace(body_path, body)
+        self._replace(meta_path, json.dumps(meta).encode())
+
+    def _replace(self, path, data):
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+
+
+class FeedClient:
+    # fetch() returns (payload, source), where source is "downloaded",
+    # "not modified" (revalidated with a 304), "cache" (offline, or the request
+    # failed) or None when there is nothing to serve. requests is imported on
+    # the first network fetch, so an offline start never pays for it.
+    def __init__(self, base_url=None, cache_dir=FEED_CACHE, workers=WORKERS, timeout=TIMEOUT, offline=False):
+        self.base_url = base_url.rstrip("/") + "/" if base_url else None
+        self.cache = HTTPCache(cache_dir)
+        self.workers = workers
+        self.timeout = timeout
+        self.offline = offline or self.base_url is None
+        self._session = None
+        self._pool = None
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "downloaded": 0, "not_modified": 0, "cache": 0, "errors": 0,
+                      "bytes": 0, "seconds": 0.0}
+
+    def _add(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self.stats[key] += value
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._session = requests.Session()
+                self._session.headers["Accept"] = "application/json"
+                # One keep-alive connection per worker to the feed host.
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+            return self._session
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="feeds")
+            return self._pool
+
+    def url(self, name):
+        return urljoin(self.base_url, FEEDS[name][0])
+
+    def fetch(self, name):
+        cached = self.cache.load(name)
+        if self.offline:
+            if cached is None:
+                return None, None
+            self._add(cache=1)
+            return cached[0], "cache"
+
+        import requests
+        url = self.url(name)
+        headers = {}
+        if cached is not None and cached[1].get("url") == url:
+            if cached[1].get("etag"):
+                headers["If-None-Match"] = cached[1]["etag"]
+            if cached[1].get("last_modified"):
+                headers["If-Modified-Since"] = cached[1]["last_modified"]
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and headers:
+                self._add(requests=1, not_modified=1, seconds=time.perf_counter() - started)
+                return cached[0], "not modified"
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            self._add(requests=1, errors=1, seconds=time.perf_counter() - started)
+            if cached is None:
+                print(f"Feed {name} unavailable: {e}", file=sys.stderr)
+                return None, None
+            self._add(cache=1)
+            return cached[0], "cache"
+        self.cache.store(name, url, response.content, response.headers)
+        self._add(requests=1, downloaded=1, bytes=len(response.content), seconds=time.perf_counter() - started)
+        return payload, "downloaded"
+
+    def refresh(self, names=None):
+        # One future per feed, fetched in parallel on the pool.
+        return {name: self.pool.submit(self.fetch, name) for name in (names or FEEDS)}
+
+    def fetch_all(self, names=None):
+        return {name: future.result() for name, future in self.refresh(names).items()}
+
+    def cached(self):
+        # What the cache holds right now, without touching the network.
+        results = {}
+        for name in FEEDS:
+            cached = self.cache.load(name)
+            results[name] = (None, None) if cached is None else (cached[0], "cache")
+        return results
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._session is not None:
+                self._session.close()
+            self._pool = self._session = None
+
+
+def content_entries(results, catalog):
+    # Content rows (shaped like content.CONTENT) for every feed that returned a
+    # payload. A feed whose payload doesn't have the expected shape is skipped
+    # whole, so one bad feed can't half-update the catalog.
+    entries = []
+    for name, (payload, source) in results.items():
+        if payload is None:
+            continue
+        try:
+            entries.extend(FEEDS[name][1](payload, catalog))
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            print(f"Feed {name} ignored, unexpected format: {e!r}", file=sys.stderr)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the NASA feed cache and report what changed.")
+    parser.add_argument("--url", help="base URL of the feeds (omit to read the cache only)")
+    parser.add_argument("--cache", default=FEED_CACHE, metavar="DIR")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--offline", action="store_true", help="serve from the cache, no requests")
+    args = parser.parse_args()
+
+    client = FeedClient(args.url, args.cache, workers=args.workers, offline=args.offline)
+    started = time.perf_counter()
+    results = client.fetch_all()
+    elapsed = time.perf_counter() - started
+    client.close()
+    for name, (payload, source) in results.items():
+        print(f"{name:<12} {source or 'unavailable'}")
+    print(f"{len(results)} feeds in {elapsed * 1000:.0f} ms: {client.stats}")
+    if all(payload is None for payload, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,59 @@
+import startup
+import argparse
 import tkinter as tk
 from tkinter import Canvas, messagebox, Frame, Label, Button, OptionMenu, Entry
-import threading
-import time
 import random
 import math
+import multiprocessing
+import os
 import sqlite3
-import pygame
-
-# Database Functions
-def get_db_connection():
-    conn = sqlite3.connect('nasa_explorer.db')
-    conn.row_factory = sqlite3.Row
-    return conn
-
-def create_tables():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE,
-            password TEXT
-        )
-    ''')
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS progress (
-            user_id INTEGER,
-            explore_progress INTEGER DEFAULT 0,
-            solar_progress INTEGER DEFAULT 0,
-            quiz_progress INTEGER DEFAULT 0,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    conn.commit()
-    conn.close()
+import sys
+import threading
+import time
+import database
+import ingest
+import telemetry
+from animation import FrameScheduler, Timeline
+from ui_bus import UIUpdateBus
+from starfield import Starfield
+from scene import SceneGraph
+from perf_overlay import LeakTracker, PerfOverlay
+from spacecraft_shapes import SPACECRAFT_SHAPES
+from content import ContentCatalog
+from quiz import AdaptiveQuiz, QuestionBank
+from timeline_view import TimelineView
+# pygame, and the NumPy-backed particles, trajectory, mission_paths, orbits, solar_view and
+# nbody modules, are imported where they are first used so the login window isn't kept waiting.
+startup.mark("imports")
+
+RESIZE_DEBOUNCE_MS = 120
+SEARCH_DEBOUNCE_MS = 150
+EXHAUST_PARTICLES = 1200
+EXHAUST_RATE = 900  # particles emitted per second of ascent at full thrust
+ASCENT_SECONDS = 4.0
+ASCENT_PIXELS = 400
+AUDIO_WARMUP_MS = 1000
+AUDIO_CHANNELS = 8
+QUIZ_LENGTH = 7
+QUIZ_PROGRESS = 5  # progress bar steps for the quiz: one per correct answer on record
+PATH_CACHE_SIZE = 16  # precomputed ascents and orbits kept for repeat launches
+# Orbit radius in canvas pixels and the colour of the body orbited, per mission.
+MISSIONS = {
+    "Earth Orbit": {"orbit_radius": 150, "color": "#2277CC"},
+    "Moon Mission": {"orbit_radius": 500, "color": "#AAAAAA"},
+    "Mars Expedition": {"orbit_radius": 800, "color": "#FF5500"},
+    "Jupiter Flyby": {"orbit_radius": 1200, "color": "#D8CA9D"},
+    "Deep Space": {"orbit_radius": 1500, "color": "#666699"},
+}
+TELEMETRY_DIR = None  # set by --telemetry-dir
+NBODY_WORKERS = 0  # set by --nbody-workers; 0 keeps belt bodies on fixed circular orbits
+LAUNCH_SEED = None  # set by --seed: every launch's flame flicker and exhaust then play out identically
+RECORD_DIR = None  # set by --record
+REPLAY_PATH = None  # set by --replay
+REPLAY_SPEED = 1.0
+FEED_URL = None  # set by --feed-url; without it the app only reads the feed cache
+FEED_CACHE = ingest.FEED_CACHE
+FEED_POLL_MS = 250
 
 # Login Window Class
 class LoginWindow:
@@ -60,12 +80,9 @@ class LoginWindow:
     def login(self):
         username = self.username_entry.get()
         password = self.password_entry.get()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE username = ? AND password = ?", (username, password))
-        user = cursor.fetchone()
-        conn.close()
+        user = database.find_user(username, password)
         if user:
+            startup.mark("login", exclude=True)
             self.login_root.destroy()
             self.main_root.deiconify()
             app = NASASpaceshipExplorer(self.main_root, user['id'])
@@ -78,25 +95,19 @@ class LoginWindow:
         if not username or not password:
             messagebox.showerror("Error", "Please enter username and password")
             return
-        conn = get_db_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, password))
-            user_id = cursor.lastrowid
-            cursor.execute("INSERT INTO progress (user_id) VALUES (?)", (user_id,))
-            conn.commit()
+            database.create_user(username, password)
             messagebox.showinfo("Success", "Account created. Please login.")
         except sqlite3.IntegrityError:
             messagebox.showerror("Error", "Username already exists")
-        finally:
-            conn.close()
     
     def on_close(self):
+        database.close_pool()
         self.main_root.destroy()
 
 # Main Application Class
 class NASASpaceshipExplorer:
-    def __init__(self, root, user_id):
+    def __init__(self, root, user_id, catalog=None):
         self.root = root
         self.user_id = user_id
         self.root.title("🚀 NASA Spaceship Explorer for Kids")
@@ -104,30 +115,50 @@ class NASASpaceshipExplorer:
         self.root.config(bg="#000033")
         self.fullscreen = False
         self.responsive = True
-        pygame.mixer.init()
-        self.load_sounds()
-        self.count_thread = None
-        
-        self.spacecraft = [
-            {"name": "Space Shuttle", "id": "shuttle", "era": "1981-2011", 
-             "fact": "Reusable spacecraft that carried astronauts to space 135 times"},
-            {"name": "Artemis SLS", "id": "artemis", "era": "2022-Present", 
-             "fact": "NASA's new rocket for returning astronauts to the Moon"},
-            {"name": "Saturn V", "id": "saturn", "era": "1967-1973", 
-             "fact": "Tallest rocket ever flown (363 ft), took astronauts to the Moon"},
-            {"name": "Falcon Heavy", "id": "falcon", "era": "2018-Present", 
-             "fact": "World's most powerful operational rocket with reusable boosters"},
-            {"name": "Voyager Probe", "id": "voyager", "era": "1977-Present", 
-             "fact": "Farthest human-made object from Earth, now in interstellar space"}
-        ]
+        self.layout_size = (0, 0)
+        self.resize_job = None
+        self.sound_bank = None
+        self.audio_loaded = False
+        self.sound_lock = threading.Lock()
+        self.audio_thread = None
+        self.scheduler = FrameScheduler(self.root, fps=60)
+        # Status and science label text goes through the bus: applied once per frame, unchanged text skipped.
+        self.ui = UIUpdateBus(self.root, self.scheduler)
+        self.paths = None  # mission_paths.PathCache, built by path_cache()
+        self.paths_lock = threading.Lock()
+        self.launch_seed = None
+        self.launch_rng = random.Random()
+        self.recorder = None
+        
+        self.catalog = catalog or ContentCatalog()
+        # Feed text from the last refresh comes from the disk cache, before
+        # anything is built from the catalog; a network refresh follows the first paint.
+        self.feeds = ingest.FeedClient(FEED_URL, FEED_CACHE)
+        self.catalog.update(ingest.content_entries(self.feeds.cached(), self.catalog))
+        self.feed_refresh = None
+        self.search_job = None
+        self.search_window = None
+        
+        self.spacecraft = self.catalog.spacecraft()
         self.current_ship = 0
         self.mode = "explore"
         self.quiz_score = 0
         self.quiz_question = 0
+        self.quiz = None
+        self.quiz_window = None
+        self.current_question = None
         self.mission = "Earth Orbit"
-        self.missions = ["Earth Orbit", "Moon Mission", "Mars Expedition", "Jupiter Flyby", "Deep Space"]
+        self.missions = list(MISSIONS)
         self.progress = {"explore": 0, "solar": 0, "quiz": 0}
         self.load_progress()
+        self.progress_writer = database.ProgressWriter(self.user_id)
+        self.attempt_writer = database.AttemptWriter()
+        sinks = [telemetry.SQLiteSink()]
+        if TELEMETRY_DIR:
+            sinks.append(telemetry.JsonlSink(TELEMETRY_DIR))
+        self.events = telemetry.EventBus(sinks, user_id=self.user_id)
+        self.question_shown_at = None
+        self.root.report_callback_exception = self.on_callback_error
         
         self.planets = [
             {"name": "Mercury", "color": "gray", "size": 15, "distance": 50},
@@ -139,42 +170,138 @@ class NASASpaceshipExplorer:
             {"name": "Uranus", "color": "lightblue", "size": 25, "distance": 350},
             {"name": "Neptune", "color": "royalblue", "size": 24, "distance": 400}
         ]
+        self.solar_system = None
+        self.belt_simulation = None
+        self.solar_view = None
+        self.solar_years = None
+        self.timeline_view = None
+        self.solar_warp_days = 20.0
+        self.warp_scale = None
+        
+        startup.mark("content")
         
         self.setup_ui()
         self.draw_spaceship()
-        self.root.bind("<Configure>", self.on_window_resize)
+        startup.mark("ui build")
+        self.root.after_idle(self.on_first_paint)
+        self.canvas.bind("<Configure>", self.on_window_resize)
+        self.leaks = LeakTracker(self.root, {"canvas": self.canvas, "progress_bar": self.progress_bar})
+        self.perf_overlay = PerfOverlay(self.root, self.canvas, self.scheduler, self.leaks)
+        self.root.bind("<F3>", self.perf_overlay.toggle)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if REPLAY_PATH:
+            self.root.after_idle(lambda: self.replay_launch(REPLAY_PATH, REPLAY_SPEED))
+
+    def on_first_paint(self):
+        startup.mark("first paint")
+        startup.PROFILER.finish()
+        # Open the mixer in the background once the window is up, so the first
+        # sound doesn't stall the UI on pygame's import.
+        self.root.after(AUDIO_WARMUP_MS, self.warm_up_audio)
+        self.warm_ascent()
+        self.mission_var.trace_add("write", self.warm_ascent)
+        if FEED_URL:
+            self.refresh_feeds()
+
+    def warm_up_audio(self):
+        self.audio_thread = threading.Thread(target=self.load_sounds, name="audio-warmup", daemon=True)
+        self.audio_thread.start()
 
     def load_sounds(self):
-        self.beep_sound = None
-        self.launch_sound = None
-        self.space_sound = None
-        self.planet_sound = None
-        self.quiz_sound = None
+        # Runs on the warm-up thread: opens a low-latency mixer and synthesises
+        # every clip into memory, so playing one later is just a channel start.
+        with self.sound_lock:
+            if self.audio_loaded:
+                return self.sound_bank
+            self.audio_loaded = True
+            try:
+                import pygame
+            except ImportError as e:
+                print(f"Audio disabled: {e}", file=sys.stderr)
+                return None
+            try:
+                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            except pygame.error as e:
+                print(f"Audio disabled: {e}", file=sys.stderr)
+                return None
+            from sound import SoundBank
+            self.sound_bank = SoundBank(pygame.mixer, channels=AUDIO_CHANNELS)
+            return self.sound_bank
+
+    def play_sound(self, name, loops=0):
+        # Never waits for the mixer: sounds requested before the warm-up has
+        # finished (or with audio unavailable) are skipped.
+        if self.sound_bank is not None:
+            self.sound_bank.play(name, loops=loops)
+
+    def stop_sound(self, name=None):
+        if self.sound_bank is not None:
+            self.sound_bank.stop(name)
+
+    def refresh_feeds(self):
+        # Feeds are fetched on the client's pool; results are applied here, on
+        # the Tk thread, once every feed is back.
+        if self.feed_refresh is not None:
+            return
+        self.feed_refresh = self.feeds.refresh()
+        self.root.after(FEED_POLL_MS, self.apply_feeds)
+
+    def apply_feeds(self):
+        if self.feed_refresh is None:
+            return
+        if not all(future.done() for future in self.feed_refresh.values()):
+            self.root.after(FEED_POLL_MS, self.apply_feeds)
+            return
+        refresh, self.feed_refresh = self.feed_refresh, None
+        results = {}
+        for name, future in refresh.items():
+            # A feed whose worker failed (e.g. the cache disk is full) counts as unavailable.
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"Feed {name} failed: {e!r}", file=sys.stderr)
+                results[name] = (None, None)
+        self.events.emit("feeds", FEED_URL, {name: source for name, (_, source) in results.items()})
+        # Cached payloads were applied at startup; only new downloads change anything.
+        fresh = {name: result for name, result in results.items() if result[1] == "downloaded"}
+        if fresh:
+            self.catalog.update(ingest.content_entries(fresh, self.catalog))
+            self.spacecraft = self.catalog.spacecraft()
+            self.ui.post(self.status_label, text="Status: Space facts updated from NASA feeds")
 
     def load_progress(self):
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM progress WHERE user_id = ?", (self.user_id,))
-        progress = cursor.fetchone()
-        conn.close()
+        progress = database.load_progress(self.user_id)
         if progress:
             self.progress["explore"] = progress["explore_progress"]
             self.progress["solar"] = progress["solar_progress"]
-            self.progress["quiz"] = progress["quiz_progress"]
+        # Correct answers from the quiz_scores aggregate (as the dashboard counts
+        # them), or the stored value if higher.
+        self.progress["quiz"] = database.quiz_progress(self.user_id, QUIZ_PROGRESS)
 
     def save_progress(self):
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE progress SET explore_progress = ?, solar_progress = ?, quiz_progress = ?
-            WHERE user_id = ?
-        """, (self.progress["explore"], self.progress["solar"], self.progress["quiz"], self.user_id))
-        conn.commit()
-        conn.close()
+        self.progress_writer.mark_dirty(self.progress)
+
+    def on_callback_error(self, exc, value, tb):
+        self.progress_writer.flush()
+        self.attempt_writer.flush()
+        self.events.flush()
+        tk.Tk.report_callback_exception(self.root, exc, value, tb)
 
     def on_close(self):
         self.save_progress()
+        self.scheduler.stop()
+        self.ui.close()
+        if self.audio_thread is not None:
+            # Let an in-flight pygame import finish rather than dying mid-import at exit.
+            self.audio_thread.join(timeout=2)
+        self.stop_sound()
+        self.progress_writer.close()
+        self.attempt_writer.close()
+        self.events.close()
+        self.feeds.close()
+        if self.belt_simulation is not None:
+            self.belt_simulation.close()
+        database.close_pool()
         self.root.destroy()
 
     def setup_ui(self):
@@ -208,6 +335,12 @@ class NASASpaceshipExplorer:
         mission_menu.config(font=("Arial", 12), bg="#9933FF", fg="white")
         mission_menu.pack(side=tk.LEFT, padx=5)
         
+        tk.Label(mission_frame, text="Search:", 
+                font=("Arial", 12), fg="white", bg="#000033").pack(side=tk.LEFT, padx=(20, 5))
+        self.search_entry = Entry(mission_frame, font=("Arial", 12), width=24)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
+        
         self.progress_bar = tk.Canvas(mission_frame, width=200, height=15, bg="#000033", highlightthickness=0)
         self.progress_bar.pack(side=tk.RIGHT, padx=10)
         self.update_progress_bar()
@@ -215,6 +348,9 @@ class NASASpaceshipExplorer:
         self.canvas = Canvas(self.root, bg="black", highlightthickness=0)
         self.canvas.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
         
+        self.starfield = Starfield(self.canvas)
+        self.scene = SceneGraph(self.canvas, SPACECRAFT_SHAPES, on_hover=self.show_tooltip)
+        self.exhaust = None
         self.create_stars()
         
         status_frame = Frame(self.root, bg="#000033")
@@ -257,35 +393,47 @@ class NASASpaceshipExplorer:
 
     def update_progress_bar(self):
         self.progress_bar.delete("progress")
-        total = len(self.spacecraft) + len(self.planets) + 5
+        total = len(self.spacecraft) + len(self.planets) + QUIZ_PROGRESS
         completed = self.progress["explore"] + self.progress["solar"] + self.progress["quiz"]
         width = 200 * completed / total
         
         self.progress_bar.create_rectangle(0, 0, width, 15, fill="#00CC00", tags="progress")
         self.progress_bar.create_text(100, 8, text=f"{completed}/{total}", 
-                                    fill="white", font=("Arial", 10))
+                                    fill="white", font=("Arial", 10), tags="progress")
 
     def on_window_resize(self, event):
+        # Bound to the canvas only, so child widgets' <Configure> events never get here.
+        # A drag produces bursts of events; they collapse into one relayout once it settles.
         if not self.responsive:
             return
+        if (event.width, event.height) == self.layout_size == self.starfield.size:
+            return
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+        self.resize_job = self.root.after(RESIZE_DEBOUNCE_MS, self.relayout)
+
+    def relayout(self):
+        self.resize_job = None
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        self.starfield.show(width, height)
+        if (width, height) == self.layout_size:
+            return
+        old_width, old_height = self.layout_size
+        if old_width <= 1 or old_height <= 1:
+            if self.mode == "explore":
+                self.draw_spaceship()
+            elif self.mode == "solar":
+                self.show_solar_system()
+            return
         if self.mode == "explore":
-            self.draw_spaceship()
+            self.scene.move(width//2 - old_width//2, height - old_height)
         elif self.mode == "solar":
-            self.show_solar_system()
-        elif self.mode == "timeline":
-            self.show_timeline()
+            self.solar_view.resize(width, height)
+        self.layout_size = (width, height)
 
     def create_stars(self):
-        self.canvas.delete("stars")
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        
-        for _ in range(200):
-            x = random.randint(0, width)
-            y = random.randint(0, height)
-            size = random.uniform(0.1, 1.5)
-            color = random.choice(["white", "#FFFFCC", "#CCFFFF"])
-            self.canvas.create_oval(x, y, x+size, y+size, fill=color, outline="", tags="stars")
+        self.starfield.show(self.canvas.winfo_width(), self.canvas.winfo_height())
 
     def create_educational_panels(self):
         self.science_frame = Frame(self.root, bg="#001133", bd=2, relief=tk.RIDGE)
@@ -312,518 +460,602 @@ class NASASpaceshipExplorer:
 
     def next_ship(self):
         self.current_ship = (self.current_ship + 1) % len(self.spacecraft)
+        self.events.emit("ship", self.spacecraft[self.current_ship]["id"])
         self.ship_name.config(text=self.spacecraft[self.current_ship]["name"])
         self.draw_spaceship()
-        self.status_label.config(text=f"Loaded {self.spacecraft[self.current_ship]['name']}")
+        self.warm_ascent()
+        self.ui.post(self.status_label, text=f"Loaded {self.spacecraft[self.current_ship]['name']}")
         self.progress["explore"] = min(len(self.spacecraft), self.progress["explore"] + 1)
         self.update_progress_bar()
         self.save_progress()
 
     def draw_spaceship(self):
-        self.canvas.delete("spaceship")
         ship_id = self.spacecraft[self.current_ship]["id"]
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
-        center_x = width // 2
-        base_y = height - 50
-        
-        if ship_id == "shuttle":
-            self.draw_shuttle(center_x, base_y)
-        elif ship_id == "artemis":
-            self.draw_artemis(center_x, base_y)
-        elif ship_id == "saturn":
-            self.draw_saturn_v(center_x, base_y)
-        elif ship_id == "falcon":
-            self.draw_falcon_heavy(center_x, base_y)
-        elif ship_id == "voyager":
-            self.draw_voyager(center_x, base_y)
-
-    def draw_shuttle(self, center_x, base_y):
-        body = self.canvas.create_polygon(
-            center_x-50, base_y, center_x+50, base_y, center_x+70, base_y-170, center_x-70, base_y-170, 
-            fill="#D0D0D0", outline="white", width=2, tags="spaceship"
-        )
-        nose = self.canvas.create_polygon(
-            center_x-70, base_y-170, center_x+70, base_y-170, center_x, base_y-220, 
-            fill="white", outline="gray", width=2, tags="spaceship"
-        )
-        wing1 = self.canvas.create_polygon(
-            center_x-70, base_y, center_x-110, base_y+40, center_x-70, base_y+40, 
-            fill="#A0A0A0", outline="white", width=1, tags="spaceship"
-        )
-        wing2 = self.canvas.create_polygon(
-            center_x+50, base_y, center_x+90, base_y+40, center_x+50, base_y+40, 
-            fill="#A0A0A0", outline="white", width=1, tags="spaceship"
-        )
-        tail = self.canvas.create_polygon(
-            center_x-30, base_y-220, center_x+30, base_y-220, center_x+40, base_y-250, center_x-40, base_y-250, 
-            fill="gray", outline="white", width=1, tags="spaceship"
-        )
-        engine1 = self.canvas.create_oval(center_x-30, base_y, center_x-10, base_y+20, fill="#FF8800", outline="red", tags="spaceship")
-        engine2 = self.canvas.create_oval(center_x+10, base_y, center_x+30, base_y+20, fill="#FF8800", outline="red", tags="spaceship")
-        
-        self.canvas.tag_bind(body, "<Enter>", lambda e: self.show_tooltip("Orbiter", "Carries crew and cargo"))
-        self.canvas.tag_bind(nose, "<Enter>", lambda e: self.show_tooltip("Cockpit", "Where astronauts control the shuttle"))
-        self.canvas.tag_bind(wing1, "<Enter>", lambda e: self.show_tooltip("Wing", "Provides lift during landing"))
-        self.canvas.tag_bind(tail, "<Enter>", lambda e: self.show_tooltip("Vertical Stabilizer", "Keeps shuttle stable during flight"))
-        self.canvas.tag_bind(engine1, "<Enter>", lambda e: self.show_tooltip("Main Engine", "Burns liquid hydrogen and oxygen"))
-        self.canvas.tag_bind(engine2, "<Enter>", lambda e: self.show_tooltip("Main Engine", "Each produces 400,000 lbs of thrust"))
-
-    def draw_artemis(self, center_x, base_y):
-        core = self.canvas.create_rectangle(center_x-10, base_y-200, center_x+10, base_y, fill="white", outline="orange", width=3, tags="spaceship")
-        booster1 = self.canvas.create_rectangle(center_x-40, base_y-190, center_x-20, base_y-10, fill="silver", outline="gray", width=2, tags="spaceship")
-        booster2 = self.canvas.create_rectangle(center_x+20, base_y-190, center_x+40, base_y-10, fill="silver", outline="gray", width=2, tags="spaceship")
-        capsule = self.canvas.create_polygon(
-            center_x-40, base_y-200, center_x+40, base_y-200, center_x, base_y-240, 
-            fill="#99CCFF", outline="gray", width=2, tags="spaceship"
-        )
-        engine = self.canvas.create_oval(center_x-10, base_y, center_x+10, base_y+20, fill="#FF5500", tags="spaceship")
-        
-        self.canvas.tag_bind(core, "<Enter>", lambda e: self.show_tooltip("Core Stage", "Holds liquid hydrogen and oxygen fuel"))
-        self.canvas.tag_bind(booster1, "<Enter>", lambda e: self.show_tooltip("Solid Rocket Booster", "Provides extra thrust at liftoff"))
-        self.canvas.tag_bind(capsule, "<Enter>", lambda e: self.show_tooltip("Orion Capsule", "Carries astronauts to the Moon"))
-        self.canvas.tag_bind(engine, "<Enter>", lambda e: self.show_tooltip("RS-25 Engine", "Reused from Space Shuttle program"))
-
-    def draw_saturn_v(self, center_x, base_y):
-        stage1 = self.canvas.create_rectangle(center_x-20, base_y, center_x+20, base_y-100, fill="white", outline="black", width=2, tags="spaceship")
-        stage2 = self.canvas.create_rectangle(center_x-15, base_y-100, center_x+15, base_y-160, fill="white", outline="black", width=2, tags="spaceship")
-        stage3 = self.canvas.create_rectangle(center_x-10, base_y-160, center_x+10, base_y-200, fill="white", outline="black", width=2, tags="spaceship")
-        module = self.canvas.create_polygon(
-            center_x-10, base_y-200, center_x+10, base_y-200, center_x, base_y-230, 
-            fill="silver", outline="gray", width=1, tags="spaceship"
-        )
-        engine1 = self.canvas.create_oval(center_x-15, base_y, center_x-5, base_y+10, fill="orange", tags="spaceship")
-        engine2 = self.canvas.create_oval(center_x+5, base_y, center_x+15, base_y+10, fill="orange", tags="spaceship")
-        
-        self.canvas.tag_bind(stage1, "<Enter>", lambda e: self.show_tooltip("First Stage", "5 F-1 engines burning kerosene"))
-        self.canvas.tag_bind(stage2, "<Enter>", lambda e: self.show_tooltip("Second Stage", "5 J-2 engines burning liquid hydrogen"))
-        self.canvas.tag_bind(stage3, "<Enter>", lambda e: self.show_tooltip("Third Stage", "Single J-2 engine for trans-lunar injection"))
-        self.canvas.tag_bind(module, "<Enter>", lambda e: self.show_tooltip("Command Module", "Housed astronauts during lunar missions"))
-
-    def draw_falcon_heavy(self, center_x, base_y):
-        core = self.canvas.create_rectangle(center_x-10, base_y, center_x+10, base_y-170, fill="white", outline="black", width=2, tags="spaceship")
-        booster1 = self.canvas.create_rectangle(center_x-50, base_y, center_x-30, base_y-140, fill="white", outline="black", width=2, tags="spaceship")
-        booster2 = self.canvas.create_rectangle(center_x+30, base_y, center_x+50, base_y-140, fill="white", outline="black", width=2, tags="spaceship")
-        fairing = self.canvas.create_polygon(
-            center_x-10, base_y-170, center_x+10, base_y-170, center_x, base_y-220, 
-            fill="lightgray", outline="black", width=1, tags="spaceship"
-        )
-        fin1 = self.canvas.create_polygon(center_x-50, base_y-140, center_x-60, base_y-130, center_x-50, base_y-130, fill="gray", tags="spaceship")
-        fin2 = self.canvas.create_polygon(center_x+50, base_y-140, center_x+60, base_y-130, center_x+50, base_y-130, fill="gray", tags="spaceship")
-        
-        self.canvas.tag_bind(core, "<Enter>", lambda e: self.show_tooltip("Core Stage", "Powered by Merlin engines, lands vertically"))
-        self.canvas.tag_bind(booster1, "<Enter>", lambda e: self.show_tooltip("Booster", "Reusable side booster, returns to launch site"))
-        self.canvas.tag_bind(fairing, "<Enter>", lambda e: self.show_tooltip("Payload Fairing", "Protects satellites during launch"))
-        self.canvas.tag_bind(fin1, "<Enter>", lambda e: self.show_tooltip("Grid Fin", "Steers booster during descent"))
-
-    def draw_voyager(self, center_x, base_y):
-        bus = self.canvas.create_rectangle(center_x-10, base_y-50, center_x+10, base_y-20, fill="gold", outline="gray", tags="spaceship")
-        dish = self.canvas.create_oval(center_x-15, base_y-70, center_x+15, base_y-40, fill="silver", outline="gray", tags="spaceship")
-        boom = self.canvas.create_rectangle(center_x-1, base_y-20, center_x+1, base_y+20, fill="gray", tags="spaceship")
-        inst1 = self.canvas.create_rectangle(center_x-20, base_y-30, center_x-10, base_y-25, fill="darkgray", tags="spaceship")
-        inst2 = self.canvas.create_rectangle(center_x+10, base_y-30, center_x+20, base_y-25, fill="darkgray", tags="spaceship")
-        
-        self.canvas.tag_bind(bus, "<Enter>", lambda e: self.show_tooltip("Spacecraft Bus", "Holds scientific instruments and computers"))
-        self.canvas.tag_bind(dish, "<Enter>", lambda e: self.show_tooltip("High-Gain Antenna", "Communicates with Earth across billions of miles"))
-        self.canvas.tag_bind(boom, "<Enter>", lambda e: self.show_tooltip("Magnetometer Boom", "Measures magnetic fields in space"))
-        self.canvas.tag_bind(inst1, "<Enter>", lambda e: self.show_tooltip("Cosmic Ray Detector", "Studies high-energy particles from space"))
+        self.layout_size = (width, height)
+        self.scene.show(ship_id, width // 2, height - 50)
 
     def show_tooltip(self, title, description):
-        self.status_label.config(text=f"{title}: {description}")
+        self.events.emit("tooltip", title)
+        self.ui.post(self.status_label, text=f"{title}: {description}")
 
     def show_facts(self):
         ship = self.spacecraft[self.current_ship]
-        facts = {
-            "shuttle": (
-                "Space Shuttle Facts:\n"
-                "- First launched: April 12, 1981\n"
-                "- Length: 184 feet (56 m)\n"
-                "- Wingspan: 78 feet (24 m)\n"
-                "- Maximum payload: 65,000 lbs (29,500 kg)\n"
-                "- Unique as the first reusable spacecraft\n"
-                "- Flew 135 missions over 30 years"
-            ),
-            "artemis": (
-                "Artemis SLS Facts:\n"
-                "- First launched: November 16, 2022\n"
-                "- Height: 322 feet (98 m)\n"
-                "- Thrust: 8.8 million pounds\n"
-                "- Payload to Moon: 59,000 lbs (27,000 kg)\n"
-                "- Carries the Orion crew capsule\n"
-                "- Part of NASA's return to the Moon"
-            ),
-            "saturn": (
-                "Saturn V Facts:\n"
-                "- Height: 363 feet (111 m)\n"
-                "- Weight: 6.5 million pounds\n"
-                "- Thrust: 7.6 million pounds\n"
-                "- Launched all Apollo Moon missions\n"
-                "- Remains the tallest, heaviest rocket ever flown\n"
-                "- Never lost a payload in 13 launches"
-            ),
-            "falcon": (
-                "Falcon Heavy Facts:\n"
-                "- First launched: February 6, 2018\n"
-                "- Height: 230 feet (70 m)\n"
-                "- Thrust: 5.1 million pounds\n"
-                "- Payload to LEO: 141,000 lbs (64,000 kg)\n"
-                "- Features reusable boosters\n"
-                "- Side boosters return to landing sites"
-            ),
-            "voyager": (
-                "Voyager Facts:\n"
-                "- Launched: September 5, 1977\n"
-                "- Speed: 38,000 mph (61,000 km/h)\n"
-                "- Distance from Earth: 14+ billion miles\n"
-                "- Powered by radioisotope thermoelectric generators\n"
-                "- Carries Golden Record with sounds of Earth\n"
-                "- Entered interstellar space in 2012"
-            )
-        }
-        messagebox.showinfo(f"🚀 {ship['name']} Information", facts[ship["id"]])
+        messagebox.showinfo(f"🚀 {ship['name']} Information", self.catalog.get("spacecraft", ship["id"])["body"])
 
     def start_countdown(self):
-        if hasattr(self, 'count_thread') and self.count_thread and self.count_thread.is_alive():
+        if self.scheduler.is_playing("launch"):
             return
-        self.count_thread = threading.Thread(target=self.countdown_sequence)
-        self.count_thread.daemon = True
-        self.count_thread.start()
+        # One seed drives all of a launch's randomness, so it can be reproduced with --seed.
+        self.launch_seed = LAUNCH_SEED if LAUNCH_SEED is not None else random.randrange(2 ** 32)
+        self.launch_rng = random.Random(self.launch_seed)
+        self.events.emit("launch", self.spacecraft[self.current_ship]["id"],
+                         {"mission": self.mission_var.get(), "seed": self.launch_seed})
+        self.scheduler.play(self.countdown_sequence())
 
     def countdown_sequence(self):
-        self.status_label.config(text="Status: Starting countdown sequence")
-        time.sleep(1)
+        timeline = Timeline("launch")
+        timeline.at(0, lambda: self.ui.post(self.status_label, text="Status: Starting countdown sequence"))
+        t = 1.0
         
         for check in ["Engine check", "Fuel tanks pressurized", "Guidance systems online", "Weather clear"]:
-            self.status_label.config(text=f"Status: {check}...")
-            time.sleep(0.7)
+            timeline.at(t, lambda c=check: self.ui.post(self.status_label, text=f"Status: {c}..."))
+            t += 0.7
         
+        timeline.at(t, self.prepare_ascent)
         for i in range(10, 0, -1):
-            self.status_label.config(text=f"Status: T-{i} seconds to launch")
-            self.update_thrust_display(i)
-            self.flicker_flame()
-            time.sleep(1)
+            timeline.at(t, lambda i=i: self.ui.post(self.status_label, text=f"Status: T-{i} seconds to launch"))
+            timeline.at(t, lambda i=i: self.update_thrust_display(i))
+            timeline.at(t, lambda: self.play_sound("beep"))
+            self.flicker_flame(timeline, t)
+            t += 1
         
-        self.status_label.config(text="Status: LIFT-OFF! 🚀")
-        self.launch_animation()
+        timeline.at(t, lambda: self.ui.post(self.status_label, text="Status: LIFT-OFF! 🚀"))
+        timeline.at(t, lambda: self.play_sound("launch"))
+        timeline.on_finish(lambda: self.scheduler.play(self.launch_animation()))
+        return timeline
 
     def update_thrust_display(self, countdown):
         thrust = 100 - (countdown * 10)
         gravity = 9.8 - (countdown * 0.1)
-        self.science_label.config(text=f"Thrust: {thrust}% | Gravity: {gravity:.1f} m/s²")
+        self.ui.post(self.science_label, text=f"Thrust: {thrust}% | Gravity: {gravity:.1f} m/s²")
 
-    def flicker_flame(self):
+    def flicker_flame(self, timeline, start):
         colors = ["#FF0000", "#FF5500", "#FFFF00"]
-        for _ in range(5):
-            color = random.choice(colors)
-            self.canvas.itemconfig("spaceship", fill=color)
-            self.canvas.update()
-            time.sleep(0.1)
-        self.canvas.itemconfig("spaceship", fill="")
+        original = {}
+
+        def flicker(_):
+            if not original:
+                for item in self.canvas.find_withtag("spaceship"):
+                    original[item] = self.canvas.itemcget(item, "fill")
+            self.canvas.itemconfig("spaceship", fill=self.launch_rng.choice(colors))
+
+        def restore():
+            for item, fill in original.items():
+                self.canvas.itemconfig(item, fill=fill)
+            original.clear()
+
+        timeline.every(start, 0.1, 5, flicker)
+        timeline.at(start + 0.5, restore)
+        timeline.on_cancel(restore)
+
+    def path_cache(self):
+        with self.paths_lock:
+            if self.paths is None:
+                from mission_paths import PathCache
+                from trajectory import MISSION_PROFILES
+                # The menu lists MISSIONS, the ascents need MISSION_PROFILES: a
+                # mission added to one and not the other must fail here, not mid-launch.
+                assert MISSIONS.keys() == MISSION_PROFILES.keys(), "MISSIONS and MISSION_PROFILES differ"
+                self.paths = PathCache(PATH_CACHE_SIZE)
+            return self.paths
+
+    def warm_ascent(self, *_):
+        # The first ascent costs ~60 ms of NumPy/trajectory imports and ~80 ms
+        # of RK4. Build the selected ship and mission's ascent on a worker
+        # thread, so prepare_ascent() at T-10 is only a cache lookup.
+        ship_id, mission = self.spacecraft[self.current_ship]["id"], self.mission_var.get()
+        threading.Thread(target=lambda: self.path_cache().ascent(ship_id, mission, ASCENT_PIXELS),
+                         name="path-warmup", daemon=True).start()
+
+    def prepare_ascent(self):
+        return self.path_cache().ascent(self.spacecraft[self.current_ship]["id"], self.mission_var.get(), ASCENT_PIXELS)
 
     def launch_animation(self):
-        self.status_label.config(text="Status: Ascending through atmosphere")
-        
+        self.ui.post(self.status_label, text="Status: Ascending through atmosphere")
         mission = self.mission_var.get()
-        if mission == "Earth Orbit":
-            target_altitude = 400
-            orbit_radius = 150
-        elif mission == "Moon Mission":
-            target_altitude = 380000
-            orbit_radius = 500
-        elif mission == "Mars Expedition":
-            target_altitude = 78000000
-            orbit_radius = 800
-        elif mission == "Jupiter Flyby":
-            target_altitude = 628000000
-            orbit_radius = 1200
-        else:
-            target_altitude = 1000000000
-            orbit_radius = 1500
-        
-        for step in range(80):
-            self.canvas.move("spaceship", 0, -5)
-            altitude = step * target_altitude // 80
-            gravity = max(1.0, 9.8 - (step * 0.12))
-            thrust = 100 if step < 60 else 70
-            self.science_label.config(text=f"Mission: {mission} | Altitude: {altitude} km | Thrust: {thrust}% | Gravity: {gravity:.1f} m/s²")
-            
-            if step > 20:
-                for _ in range(3):
-                    width = self.canvas.winfo_width()
-                    height = self.canvas.winfo_height()
-                    x = random.randint(width//2-50, width//2+50)
-                    y = random.randint(height-100, height-50)
-                    size = random.randint(2, 8)
-                    self.canvas.create_oval(x, y, x+size, y+size, fill="#FF5500", tags="effect")
-            
-            self.canvas.update()
-            time.sleep(0.05)
         
-        self.canvas.delete("effect")
-        self.status_label.config(text=f"Status: Achieving orbit for {mission}")
-        self.simulate_orbit(orbit_radius)
+        if self.exhaust is None:
+            from particles import ParticleSystem
+            self.exhaust = ParticleSystem(self.canvas, capacity=EXHAUST_PARTICLES)
+        self.exhaust.reseed(self.launch_seed)
+        if RECORD_DIR:
+            self.start_recording(mission)
+        
+        # Play back the precomputed ascent: the tween only indexes into its arrays.
+        path = self.prepare_ascent()
+        last = path["last"]
+        frame = [0]
+        climbed = [0]
+        stage = [0]
 
-    def simulate_orbit(self, orbit_radius):
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        body_size = orbit_radius // 3
-        
-        if self.mission_var.get() == "Earth Orbit":
-            color = "#2277CC"
-        elif self.mission_var.get() == "Moon Mission":
-            color = "#AAAAAA"
-        elif self.mission_var.get() == "Mars Expedition":
-            color = "#FF5500"
-        elif self.mission_var.get() == "Jupiter Flyby":
-            color = "#D8CA9D"
-        else:
-            color = "#666699"
-        
-        celestial_body = self.canvas.create_oval(
-            width-body_size, height//2-body_size, width+body_size, height//2+body_size, 
-            fill=color, outline="", tags="celestial"
-        )
-        
-        orbit = self.canvas.create_oval(
-            width//2-orbit_radius, height//2-orbit_radius,
-            width//2+orbit_radius, height//2+orbit_radius,
-            outline="#444444", dash=(4, 4), width=1, tags="orbit"
-        )
-        
-        craft = self.canvas.create_oval(
-            width//2+orbit_radius-5, height//2-5, 
-            width//2+orbit_radius+5, height//2+5, 
-            fill="white", tags="craft"
-        )
-        
-        for angle in range(0, 360, 3):
-            rad = math.radians(angle)
-            x = width//2 + orbit_radius * math.cos(rad)
-            y = height//2 + orbit_radius * math.sin(rad)
-            self.canvas.coords(craft, x-5, y-5, x+5, y+5)
-            speed = 28000 - (200 * math.sin(rad*2))
-            self.science_label.config(text=f"Orbit: {int(speed)} km/h | Altitude: {orbit_radius*10} km")
-            self.canvas.update()
-            time.sleep(0.03)
-        
-        self.status_label.config(text="Status: Mission accomplished! Ready for next mission")
-        self.science_label.config(text="Thrust: 0% | Gravity: 9.8 m/s²")
-        self.canvas.delete("celestial")
-        self.canvas.delete("orbit")
-        self.canvas.delete("craft")
+        def ascend(progress):
+            i = frame[0] = int(progress * last)
+            if path["stage"][i] != stage[0]:
+                stage[0] = path["stage"][i]
+                self.play_sound("staging")
+            offset = int(path["offsets"][i])
+            self.scene.move(0, climbed[0] - offset)
+            self.starfield.scroll(offset - climbed[0])
+            climbed[0] = offset
+            self.ui.post(self.science_label, text=path["readouts"][i])
 
-    def show_solar_system(self):
-        self.mode = "solar"
-        self.canvas.delete("all")
+        def exhaust(dt):
+            node = self.scene.nodes.get(self.scene.visible)
+            if node is not None:
+                self.exhaust.emit(int(EXHAUST_RATE * dt * path["thrust"][frame[0]]), node.x, node.y + 20)
+            self.exhaust.update(dt)
+
+        def record(dt):
+            from recording import ASCENT, pack_particles
+            self.recorder.write(ASCENT, path["stage"][frame[0]], frame[0], climbed[0], pack_particles(self.exhaust))
+
+        def start():
+            # Lift off from the pad even if an earlier launch left the craft up high.
+            self.draw_spaceship()
+            self.scheduler.add_frame_callback(self.exhaust.render)
+
+        def stop():
+            self.scheduler.remove_frame_callback(self.exhaust.render)
+            self.exhaust.clear()
+
+        def cancel():
+            stop()
+            self.stop_recording()
+
+        def finish():
+            stop()
+            self.ui.post(self.status_label, text=f"Status: Achieving orbit for {mission}")
+
+        timeline = Timeline("launch")
+        timeline.at(0, start)
+        timeline.tween(0, ASCENT_SECONDS, ascend)
+        timeline.during(0, ASCENT_SECONDS, exhaust)
+        if self.recorder is not None:
+            timeline.during(0, ASCENT_SECONDS, record)
+        timeline.on_finish(finish)
+        timeline.on_finish(lambda: self.scheduler.play(self.simulate_orbit(mission)))
+        timeline.on_cancel(cancel)
+        return timeline
+
+    def simulate_orbit(self, mission):
+        from mission_paths import ORBIT_STEPS
+        spec = MISSIONS[mission]
+        path = self.path_cache().orbit(mission, spec["orbit_radius"], self.canvas.winfo_width(), self.canvas.winfo_height())
+        self.canvas.create_oval(*path["body"], fill=spec["color"], outline="", tags="celestial")
+        self.canvas.create_oval(*path["orbit"], outline="#444444", dash=(4, 4), width=1, tags="orbit")
+        craft = self.canvas.create_oval(*path["craft"][0].tolist(), fill="white", tags="craft")
+        shown = [-1]
+        
+        def orbit_step(progress):
+            # Replays the cached path; the craft only moves when the step index does.
+            k = min(ORBIT_STEPS - 1, int(progress * ORBIT_STEPS))
+            if k == shown[0]:
+                return
+            shown[0] = k
+            self.canvas.coords(craft, *path["craft"][k].tolist())
+            self.ui.post(self.science_label, text=path["readouts"][k])
+
+        def record(dt):
+            from recording import ORBIT
+            self.recorder.write(ORBIT, 0, max(0, shown[0]), None)
+
+        def cleanup():
+            self.canvas.delete("celestial")
+            self.canvas.delete("orbit")
+            self.canvas.delete("craft")
+            self.stop_recording()
+
+        def finish():
+            self.ui.post(self.status_label, text="Status: Mission accomplished! Ready for next mission")
+            self.ui.post(self.science_label, text="Thrust: 0% | Gravity: 9.8 m/s²")
+            cleanup()
+
+        timeline = Timeline("launch")
+        timeline.tween(0, ORBIT_STEPS * 0.03, orbit_step)
+        if self.recorder is not None:
+            timeline.during(0, ORBIT_STEPS * 0.03, record)
+        timeline.on_finish(finish)
+        timeline.on_cancel(cleanup)
+        return timeline
+
+    def start_recording(self, mission):
+        from recording import RecordingWriter
+        os.makedirs(RECORD_DIR, exist_ok=True)
+        ship_id = self.spacecraft[self.current_ship]["id"]
+        path = os.path.join(RECORD_DIR, f"launch-{time.strftime('%Y%m%d-%H%M%S')}-{ship_id}-{self.launch_seed}.nsxr")
+        self.stop_recording()
+        self.recorder = RecordingWriter(path, self.scheduler.timestep, {
+            "ship": ship_id, "mission": mission, "seed": self.launch_seed,
+            "width": self.canvas.winfo_width(), "height": self.canvas.winfo_height()})
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.events.emit("recording", self.recorder.path, {"frames": len(self.recorder.offsets)})
+            self.recorder = None
+
+    def replay_launch(self, path, speed=1.0):
+        # Plays a recording back on the spacecraft screen at 0.25x-16x. Left/Right
+        # seek five seconds, Up/Down double or halve the speed. Frames are read
+        # from the memory-mapped file as the clock reaches them.
+        from recording import ASCENT, RecordingReader, ReplayClock
+        try:
+            reader = RecordingReader(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Replay", f"Cannot replay {path}: {e}")
+            return
+        meta = reader.meta
+        ships = [ship["id"] for ship in self.spacecraft]
+        # Recordings made with another ship list or mission table can't be replayed here.
+        if not (isinstance(meta, dict) and meta.get("ship") in ships and meta.get("mission") in MISSIONS
+                and isinstance(meta.get("width"), int) and isinstance(meta.get("height"), int)):
+            reader.close()
+            messagebox.showerror("Replay", f"Cannot replay {path}: unknown ship or mission in {meta!r}")
+            return
+        self.scheduler.cancel("launch")
+        self.current_ship = ships.index(meta["ship"])
+        self.ship_name.config(text=self.spacecraft[self.current_ship]["name"])
+        self.draw_spaceship()
+        self.mission_var.set(meta["mission"])
+        ascent = self.prepare_ascent()
+        spec = MISSIONS[meta["mission"]]
+        orbit = self.path_cache().orbit(meta["mission"], spec["orbit_radius"], meta["width"], meta["height"])
+        if self.exhaust is None:
+            from particles import ParticleSystem
+            self.exhaust = ParticleSystem(self.canvas, capacity=EXHAUST_PARTICLES)
+        clock = ReplayClock(reader, speed)
+        climbed = [0]
+        craft = [None]
+        keys = {
+            "<Left>": lambda e: clock.seek(clock.position - 5),
+            "<Right>": lambda e: clock.seek(clock.position + 5),
+            "<Up>": lambda e: clock.set_speed(clock.speed * 2),
+            "<Down>": lambda e: clock.set_speed(clock.speed / 2),
+        }
+
+        def show(i):
+            frame, particles = reader.frame(i)
+            offset = int(frame["offset"])
+            self.scene.move(0, climbed[0] - offset)
+            self.starfield.scroll(offset - climbed[0])
+            climbed[0] = offset
+            if frame["phase"] == ASCENT:
+                remove_orbit()
+                self.exhaust.restore(particles["x"] / 4, particles["y"] / 4, particles["size"], particles["fade"])
+                self.ui.post(self.science_label, text=ascent["readouts"][frame["index"]])
+            else:
+                if craft[0] is None:
+                    self.exhaust.clear()
+                    self.canvas.create_oval(*orbit["body"], fill=spec["color"], outline="", tags="celestial")
+                    self.canvas.create_oval(*orbit["orbit"], outline="#444444", dash=(4, 4), width=1, tags="orbit")
+                    craft[0] = self.canvas.create_oval(0, 0, 0, 0, fill="white", tags="craft")
+                self.canvas.coords(craft[0], *orbit["craft"][frame["index"]].tolist())
+                self.ui.post(self.science_label, text=orbit["readouts"][frame["index"]])
+            self.ui.post(self.status_label, text=f"Status: Replay {clock.speed:g}x - {clock.position:.1f} / "
+                                                 f"{reader.duration:.1f} s (arrows seek and change speed)")
+
+        def remove_orbit():
+            if craft[0] is not None:
+                for tag in ("celestial", "orbit", "craft"):
+                    self.canvas.delete(tag)
+                craft[0] = None
+
+        def play(dt):
+            show(clock.advance(dt))
+            if clock.finished:
+                self.scheduler.cancel(timeline)
+
+        def start():
+            for sequence, handler in keys.items():
+                self.root.bind(sequence, handler)
+            self.scheduler.add_frame_callback(self.exhaust.render)
+
+        def stop():
+            for sequence in keys:
+                self.root.unbind(sequence)
+            self.scheduler.remove_frame_callback(self.exhaust.render)
+            self.exhaust.clear()
+            remove_orbit()
+            reader.close()
+            self.ui.post(self.status_label, text="Status: Replay finished")
+
+        timeline = Timeline("launch")
+        timeline.at(0, start)
+        timeline.during(0, math.inf, play)
+        timeline.on_cancel(stop)
+        self.scheduler.play(timeline)
+
+    def enter_mode(self, mode):
+        # Snapshot the outgoing mode before tearing it down, so repeated visits
+        # to the same mode can be compared for leftover items and widgets.
+        self.leaks.snapshot(self.mode)
+        self.events.emit("mode", mode)
+        self.mode = mode
+        self.clear_canvas()
         self.create_stars()
+
+    def clear_canvas(self):
+        self.scheduler.cancel("launch")
+        self.scheduler.cancel("solar")
+        self.stop_sound("space")
+        if self.solar_view is not None:
+            self.solar_view.close()
+            self.solar_view = None
+        if self.timeline_view is not None:
+            self.timeline_view.close()
+            self.timeline_view = None
+        # Embedded widgets (warp slider, timeline canvas, training buttons) are not
+        # canvas items, so delete("all") alone would leave them behind.
+        for child in self.canvas.winfo_children():
+            child.destroy()
+        self.warp_scale = None
+        self.canvas.delete("all")
+
+    def show_solar_system(self):
+        self.enter_mode("solar")
         self.title.config(text="Solar System Explorer")
         self.ship_name.config(text="Our Solar System")
-        self.status_label.config(text="Status: Exploring our cosmic neighborhood")
+        self.ui.post(self.status_label, text="Status: Exploring our cosmic neighborhood - drag to pan, scroll to zoom")
         
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        self.layout_size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if self.solar_system is None:
+            from solar_view import SolarSystem
+            from orbits import years_since_j2000
+            self.solar_system = SolarSystem(self.planets)
+            self.solar_years = years_since_j2000()
+            if NBODY_WORKERS:
+                from nbody import BeltSimulation
+                self.belt_simulation = BeltSimulation(self.solar_system, self.solar_years, NBODY_WORKERS)
+        from solar_view import SolarView
+        self.solar_view = SolarView(self.canvas, self.solar_system, self.scheduler, on_select=self.show_body_info,
+                                    belt_source=self.belt_simulation)
+        self.solar_view.set_time(self.solar_years)
+        
+        self.warp_scale = tk.Scale(self.canvas, from_=0, to=365, orient=tk.HORIZONTAL, length=180,
+                                   label="Days per second", font=("Arial", 9), fg="white", bg="#000033",
+                                   highlightthickness=0, command=self.set_time_warp)
+        self.set_time_warp(self.solar_warp_days)
+        self.warp_scale.set(self.solar_warp_days)
+        self.canvas.create_window(10, 10, anchor="nw", window=self.warp_scale, tags="solar_ui")
         
-        sun_size = 30
-        self.canvas.create_oval(
-            width//8-sun_size, height//2-sun_size,
-            width//8+sun_size, height//2+sun_size,
-            fill="#FFCC00", outline="#FF9900", width=2
-        )
-        
-        planet_objects = []
-        for i, planet in enumerate(self.planets):
-            x = width//8 + planet["distance"]
-            y = height//2
-            size = planet["size"]
-            planet_obj = self.canvas.create_oval(x-size, y-size, x+size, y+size, 
-                                               fill=planet["color"], tags=planet["name"])
-            self.canvas.tag_bind(planet_obj, "<Button-1>", 
-                                lambda e, p=planet: self.show_planet_info(p))
-            planet_objects.append(planet_obj)
-            self.canvas.create_oval(
-                width//8-planet["distance"], height//2-planet["distance"],
-                width//8+planet["distance"], height//2+planet["distance"],
-                outline="#333366", dash=(2, 2)
-            )
-        
-        self.canvas.create_text(width//8, height//2-sun_size-10, text="Sun", fill="white", font=("Arial", 10))
-        for i, planet in enumerate(self.planets):
-            x = width//8 + planet["distance"]
-            y = height//2 - planet["size"] - 10
-            self.canvas.create_text(x, y, text=planet["name"], fill="white", font=("Arial", 9))
+        timeline = Timeline("solar")
+        timeline.during(0, math.inf, self.advance_solar)
+        self.scheduler.play(timeline)
+        self.play_sound("space", loops=-1)
+
+    def set_time_warp(self, value):
+        from orbits import DAYS_PER_YEAR
+        self.solar_warp_days = float(value)
+        self.solar_warp_years = self.solar_warp_days / DAYS_PER_YEAR
+
+    def advance_solar(self, dt):
+        self.solar_years += dt * self.solar_warp_years
+        self.solar_view.set_time(self.solar_years)
+
+    def show_body_info(self, body):
+        if body["kind"] == "planet":
+            self.show_planet_info(body["planet"])
+            return
+        self.events.emit("body", body["name"])
+        if body["kind"] == "moon":
+            text = f"A moon of {body['parent']}, going around it every {body['period_days']:.1f} days"
+        else:
+            kind = {"dwarf": "Dwarf planet", "asteroid": "Asteroid belt", "kuiper": "Kuiper belt"}[body["kind"]]
+            text = f"{kind}, {body['au']:.1f} times as far from the Sun as Earth; one orbit takes {body['period']:.1f} years"
+        self.play_sound("planet")
+        messagebox.showinfo(body["name"], text)
 
     def show_planet_info(self, planet):
-        facts = {
-            "Mercury": "Closest planet to the Sun\nSurface temperature: 430°C (day) to -180°C (night)\nNo moons",
-            "Venus": "Hottest planet (475°C)\nThick toxic atmosphere\nRotates backwards",
-            "Earth": "Only known planet with life\n71% covered in water\n1 Moon",
-            "Mars": "The Red Planet\nLargest volcano in solar system (Olympus Mons)\n2 moons: Phobos and Deimos",
-            "Jupiter": "Largest planet\nGreat Red Spot is a giant storm\n79 known moons",
-            "Saturn": "Famous for its rings\nLess dense than water\n62 moons",
-            "Uranus": "Rotates on its side\nBlue-green from methane gas\n27 moons",
-            "Neptune": "Windiest planet (2,100 km/h winds)\nDiscovered through math\n14 moons"
-        }
-        messagebox.showinfo(f"Planet {planet['name']}", facts[planet["name"]])
+        self.events.emit("planet", planet["name"])
+        self.play_sound("planet")
+        messagebox.showinfo(f"Planet {planet['name']}", self.catalog.get("planet", planet["name"])["body"])
         self.progress["solar"] = min(len(self.planets), self.progress["solar"] + 1)
         self.update_progress_bar()
         self.save_progress()
 
     def start_quiz(self):
+        if self.quiz is None:
+            # Built on first use; later rounds keep adapting from this session's answers.
+            bank = QuestionBank(self.catalog.quiz_questions())
+            self.quiz = AdaptiveQuiz(bank, database.recent_attempts(self.user_id))
+        self.quiz.new_round()
         self.quiz_score = 0
         self.quiz_question = 0
         self.ask_question()
 
+    def build_quiz_window(self):
+        # One window for every question of every round: ask_question() only
+        # reconfigures these widgets, and closing the window just hides it.
+        self.quiz_window = tk.Toplevel(self.root)
+        self.quiz_window.geometry("500x300")
+        self.quiz_window.config(bg="#000033")
+        self.quiz_window.attributes('-topmost', True)
+        self.quiz_window.protocol("WM_DELETE_WINDOW", self.quiz_window.withdraw)
+        self.quiz_label = Label(self.quiz_window, font=("Arial", 14, "bold"),
+                                fg="white", bg="#000033", wraplength=450)
+        self.quiz_label.pack(pady=20)
+        self.quiz_buttons = []
+        self.quiz_packed = 0
+
     def ask_question(self):
-        questions = [
-            {
-                "question": "What force propels a rocket upward?",
-                "options": ["Gravity", "Thrust", "Magnetism", "Friction"],
-                "answer": 1
-            },
-            {
-                "question": "Which planet is known as the Red Planet?",
-                "options": ["Venus", "Jupiter", "Mars", "Saturn"],
-                "answer": 2
-            },
-            {
-                "question": "What was the first animal in space?",
-                "options": ["Dog (Laika)", "Chimpanzee", "Monkey", "Cat"],
-                "answer": 0
-            },
-            {
-                "question": "How fast must a rocket go to escape Earth's gravity?",
-                "options": ["1,000 km/h", "10,000 km/h", "28,000 km/h", "40,000 km/h"],
-                "answer": 3
-            },
-            {
-                "question": "Which of these is NOT a real NASA spacecraft?",
-                "options": ["Voyager", "Cassini", "Enterprise", "Galileo"],
-                "answer": 2
-            },
-            {
-                "question": "What is the largest planet in our solar system?",
-                "options": ["Earth", "Jupiter", "Saturn", "Neptune"],
-                "answer": 1
-            },
-            {
-                "question": "Who was the first human to walk on the Moon?",
-                "options": ["Yuri Gagarin", "Buzz Aldrin", "Neil Armstrong", "John Glenn"],
-                "answer": 2
-            }
-        ]
-        
-        if self.quiz_question < len(questions):
-            q = questions[self.quiz_question]
-            self.quiz_window = tk.Toplevel(self.root)
-            self.quiz_window.title(f"Space Quiz - Question {self.quiz_question+1}")
-            self.quiz_window.geometry("500x300")
-            self.quiz_window.config(bg="#000033")
-            self.quiz_window.attributes('-topmost', True)
-            
-            Label(self.quiz_window, text=q["question"], font=("Arial", 14, "bold"), 
-                 fg="white", bg="#000033", wraplength=450).pack(pady=20)
-            
-            for i, option in enumerate(q["options"]):
-                Button(self.quiz_window, text=option, font=("Arial", 12), 
-                      width=30, bg="#444466", fg="white", 
-                      command=lambda idx=i: self.check_answer(idx, q["answer"])).pack(pady=5)
-        else:
-            self.progress["quiz"] = 5
+        question = self.quiz.next_question() if self.quiz_question < QUIZ_LENGTH else None
+        if question is None:
+            if self.quiz_window is not None:
+                self.quiz_window.withdraw()
+            # The round's last answers may still be queued; write them so the aggregate includes them.
+            self.attempt_writer.flush()
+            self.progress["quiz"] = max(self.progress["quiz"], database.quiz_progress(self.user_id, QUIZ_PROGRESS))
             self.update_progress_bar()
             self.save_progress()
             messagebox.showinfo("Quiz Complete", 
-                               f"Your score: {self.quiz_score}/{len(questions)}\n"
+                               f"Your score: {self.quiz_score}/{self.quiz_question}\n"
                                f"Great job, space explorer!")
+            return
+        
+        if self.quiz_window is None:
+            self.build_quiz_window()
+        self.current_question = question
+        self.quiz_window.title(f"Space Quiz - Question {self.quiz_question+1}")
+        self.quiz_label.config(text=question["title"])
+        options = question["options"]
+        while len(self.quiz_buttons) < len(options):
+            self.quiz_buttons.append(Button(self.quiz_window, font=("Arial", 12), width=30, bg="#444466", fg="white",
+                                            command=lambda idx=len(self.quiz_buttons): self.check_answer(idx)))
+        for i, button in enumerate(self.quiz_buttons):
+            if i < len(options):
+                button.config(text=options[i])
+                if i >= self.quiz_packed:
+                    button.pack(pady=5)
+            elif i < self.quiz_packed:
+                button.pack_forget()
+        self.quiz_packed = len(options)
+        self.quiz_window.deiconify()
+        self.quiz_window.lift()
+        self.question_shown_at = time.perf_counter()
 
-    def check_answer(self, selected, correct):
-        if selected == correct:
+    def check_answer(self, selected):
+        question = self.current_question
+        correct = selected == question["answer"]
+        latency_ms = (time.perf_counter() - self.question_shown_at) * 1000
+        self.attempt_writer.record(self.user_id, question["key"], selected, correct, latency_ms)
+        self.quiz.record(question, correct)
+        if correct:
             self.quiz_score += 1
-            self.status_label.config(text="Status: Correct answer!")
+            self.play_sound("quiz")
+            self.ui.post(self.status_label, text="Status: Correct answer!")
         else:
-            self.status_label.config(text="Status: Try the next one!")
+            self.ui.post(self.status_label, text="Status: Try the next one!")
         
         self.quiz_question += 1
-        self.quiz_window.destroy()
         self.ask_question()
 
     def show_training(self):
-        self.mode = "training"
-        self.canvas.delete("all")
-        self.create_stars()
+        self.enter_mode("training")
         self.title.config(text="Astronaut Training Center")
         self.ship_name.config(text="Prepare for Space!")
-        self.status_label.config(text="Status: Learning to be an astronaut")
+        self.ui.post(self.status_label, text="Status: Learning to be an astronaut")
         
         training_frame = Frame(self.canvas, bg="#000033")
         training_frame.pack(pady=20)
         
-        modules = ["Physical Training", "Simulations", "Space Living"]
-        for module in modules:
+        for module in [entry["key"] for entry in self.catalog.entries("training")]:
             Button(training_frame, text=module, font=("Arial", 12), bg="#444466", fg="white",
                    command=lambda m=module: self.show_module(m)).pack(pady=10)
 
     def show_module(self, module):
-        info = {
-            "Physical Training": "Astronauts must be in top physical shape. They exercise daily in space to combat muscle and bone loss.",
-            "Simulations": "Astronauts train in simulators that mimic spacecraft and space station environments.",
-            "Space Living": "In space, astronauts eat specially prepared food, sleep in sleeping bags, and use special toilets."
-        }
-        messagebox.showinfo(module, info[module])
+        messagebox.showinfo(module, self.catalog.get("training", module)["body"])
 
     def show_timeline(self):
-        self.mode = "timeline"
-        self.canvas.delete("all")
-        self.create_stars()
+        self.enter_mode("timeline")
         self.title.config(text="NASA Mission Timeline")
         self.ship_name.config(text="Key Space Missions")
-        self.status_label.config(text="Status: Exploring space history")
+        self.ui.post(self.status_label, text="Status: Exploring space history - drag to pan, scroll to zoom")
         
         timeline_canvas = Canvas(self.canvas, bg="black", highlightthickness=0)
         timeline_canvas.pack(fill=tk.BOTH, expand=True)
-        
-        missions = [
-            {"name": "Apollo 11", "date": "1969", "desc": "First Moon landing"},
-            {"name": "Voyager 1", "date": "1977", "desc": "First probe to interstellar space"},
-            {"name": "Space Shuttle", "date": "1981", "desc": "First reusable spacecraft"},
-            {"name": "Hubble Telescope", "date": "1990", "desc": "Revolutionized astronomy"},
-            {"name": "ISS", "date": "1998", "desc": "International Space Station"},
-            {"name": "Mars Rover", "date": "2004", "desc": "Exploration of Mars"},
-            {"name": "Artemis", "date": "2022", "desc": "Return to the Moon"}
-        ]
-        
-        for i, mission in enumerate(missions):
-            x = 100 + i * 150
-            y = 100
-            rect = timeline_canvas.create_rectangle(x-50, y-30, x+50, y+30, fill="#444466", tags=mission["name"])
-            timeline_canvas.create_text(x, y, text=mission["name"], fill="white", font=("Arial", 10))
-            timeline_canvas.create_text(x, y+20, text=mission["date"], fill="gray", font=("Arial", 8))
-            timeline_canvas.tag_bind(rect, "<Button-1>", lambda e, m=mission: self.show_mission_info(m))
-        
-        timeline_canvas.create_line(50, 100, 100 + len(missions)*150, 100, fill="white", width=2)
+        self.timeline_view = TimelineView(timeline_canvas, self.catalog.missions(), self.scheduler,
+                                          on_select=self.show_mission_info)
 
     def show_mission_info(self, mission):
-        messagebox.showinfo(mission["name"], f"{mission['date']}: {mission['desc']}")
+        self.events.emit("mission", mission["key"])
+        messagebox.showinfo(mission["title"], f"{mission['date']}: {mission['body']}")
+
+    def on_search_key(self, event):
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        delay = 0 if event.keysym == "Return" else SEARCH_DEBOUNCE_MS
+        self.search_job = self.root.after(delay, self.run_search)
+
+    def run_search(self):
+        self.search_job = None
+        text = self.search_entry.get().strip()
+        if not text:
+            return
+        self.search_results = self.catalog.search(text)
+        self.events.emit("search", text, {"results": len(self.search_results)})
+        
+        if self.search_window is None or not self.search_window.winfo_exists():
+            self.search_window = tk.Toplevel(self.root)
+            self.search_window.geometry("520x320")
+            self.search_window.config(bg="#000033")
+            self.search_list = tk.Listbox(self.search_window, font=("Arial", 11), bg="#000033", fg="white",
+                                          selectbackground="#9933FF", activestyle="none")
+            self.search_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self.search_list.bind("<Double-Button-1>", self.open_search_result)
+            self.search_list.bind("<Return>", self.open_search_result)
+        self.search_window.title(f"Search: {text} ({len(self.search_results)} results)")
+        self.search_list.delete(0, tk.END)
+        for entry in self.search_results:
+            snippet = " ".join(entry["snippet"].split())
+            self.search_list.insert(tk.END, f"[{entry['kind']}] {entry['title']} - {snippet}")
+
+    def open_search_result(self, event=None):
+        selection = self.search_list.curselection()
+        if not selection:
+            return
+        entry = self.search_results[selection[0]]
+        kind = entry["kind"]
+        if kind == "planet":
+            self.show_planet_info(next(p for p in self.planets if p["name"] == entry["key"]))
+        elif kind == "mission":
+            self.show_mission_info(entry)
+        elif kind == "quiz":
+            messagebox.showinfo("Quiz Question", f"{entry['title']}\nAnswer: {entry['body']}")
+        else:
+            messagebox.showinfo(entry["title"], entry["body"])
 
     def show_fun_fact(self):
-        facts = [
-            "The Sun is so big that about 1.3 million Earths could fit inside it.",
-            "Venus spins in the opposite direction to most other planets.",
-            "A day on Venus is longer than a year on Venus.",
-            "Mars has the largest volcano in the solar system, Olympus Mons.",
-            "Jupiter's Great Red Spot is a storm that has been raging for over 300 years.",
-            "Saturn's rings are made mostly of ice particles.",
-            "Uranus rotates on its side, making its seasons very extreme.",
-            "Neptune was discovered using mathematics before it was seen with a telescope.",
-            "The International Space Station orbits Earth every 90 minutes.",
-            "The first living creatures in space were fruit flies in 1947."
-        ]
-        fact = random.choice(facts)
-        messagebox.showinfo("Fun Space Fact", fact)
+        fact = random.choice(self.catalog.entries("fact"))
+        messagebox.showinfo(fact["title"], fact["body"])
 
 if __name__ == "__main__":
-    create_tables()
+    multiprocessing.freeze_support()  # the packaged exe starts nbody workers by re-running itself
+    parser = argparse.ArgumentParser(description="NASA Spaceship Explorer")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import, database, UI build and first paint times")
+    parser.add_argument("--startup-log", metavar="PATH",
+                        help="append the startup timings to PATH as one JSON line per run")
+    parser.add_argument("--telemetry-dir", metavar="DIR",
+                        help="also write session events to daily JSON-lines files in DIR")
+    parser.add_argument("--nbody-workers", type=int, default=0, metavar="N",
+                        help="simulate asteroid and Kuiper belt gravity in N worker processes")
+    parser.add_argument("--seed", type=int, metavar="N", help="make every launch deterministic with this seed")
+    parser.add_argument("--record", metavar="DIR", help="record each launch to a .nsxr file in DIR")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded launch after logging in")
+    parser.add_argument("--replay-speed", type=float, default=1.0, metavar="X", help="replay speed, 0.25 to 16")
+    parser.add_argument("--feed-url", metavar="URL",
+                        help="refresh spacecraft, planet and launch facts from the JSON feeds under URL")
+    parser.add_argument("--feed-cache", default=ingest.FEED_CACHE, metavar="DIR",
+                        help="where fetched feeds are kept for offline use (default: %(default)s)")
+    args = parser.parse_args()
+    FEED_URL = args.feed_url
+    FEED_CACHE = args.feed_cache
+    TELEMETRY_DIR = args.telemetry_dir
+    LAUNCH_SEED = args.seed
+    RECORD_DIR = args.record
+    REPLAY_PATH = args.replay
+    REPLAY_SPEED = args.replay_speed
+    NBODY_WORKERS = args.nbody_workers
+    startup.PROFILER.echo = args.profile_startup
+    startup.PROFILER.log_path = args.startup_log
+    
+    database.create_tables()
+    startup.mark("database")
     root = tk.Tk()
     root.withdraw()
     login_window = tk.Toplevel(root)
     login_app = LoginWindow(login_window, root)
+    root.after_idle(lambda: startup.mark("login window"))
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from trajectory import simulate_mission
+
+ORBIT_STEPS = 120  # craft positions around the orbit, 3 degrees apart
+CRAFT_RADIUS = 5
+
+
+class PathCache:
+    # Mission paths computed once and then replayed by index. Ascents are keyed
+    # by (ship, mission, pixels) and orbits by (mission, canvas size), so a
+    # resize only recomputes the orbit; the least recently used path is evicted
+    # past `capacity`. Safe to use from a warm-up thread: a path being built
+    # is waited for rather than built twice.
+    def __init__(self, capacity=16):
+        self.capacity = capacity
+        self.paths = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "waits": 0}
+        self._lock = threading.Lock()
+        self._building = {}
+
+    def get(self, key, build):
+        with self._lock:
+            path = self.paths.get(key)
+            if path is not None:
+                self.paths.move_to_end(key)
+                self.stats["hits"] += 1
+                return path
+            building = self._building.get(key)
+            owner = building is None
+            if owner:
+                building = self._building[key] = threading.Event()
+                self.stats["misses"] += 1
+            else:
+                self.stats["waits"] += 1
+        if not owner:
+            building.wait()
+            return self.get(key, build)
+        try:
+            path = build()
+            with self._lock:
+                self.paths[key] = path
+                if len(self.paths) > self.capacity:
+                    self.paths.popitem(last=False)
+                    self.stats["evictions"] += 1
+        finally:
+            with self._lock:
+                del self._building[key]
+            building.set()
+        return path
+
+    def ascent(self, ship_id, mission, pixels):
+        return self.get(("ascent", ship_id, mission, pixels), lambda: ascent_path(ship_id, mission, pixels))
+
+    def orbit(self, mission, radius, width, height):
+        return self.get(("orbit", mission, width, height), lambda: orbit_path(radius, width, height))
+
+
+def ascent_path(ship_id, mission, pixels):
+    # The simulated ascent up to burnout, as per-frame screen offsets (the peak
+    # altitude climbs `pixels`), stage numbers, thrust and readout text.
+    record = simulate_mission(ship_id, mission)
+    last = min(len(record["time"]) - 1, int(record["burnout"] / (record["time"][1] - record["time"][0])))
+    altitude = record["altitude"][:last + 1]
+    peak = max(1.0, float(altitude.max()))
+    readouts = [f"Mission: {mission} | Altitude: {a / 1000:.0f} km | Speed: {s:.0f} m/s | "
+                f"Thrust: {t * 100:.0f}% | Gravity: {g:.1f} m/s²"
+                for a, s, t, g in zip(altitude.tolist(), record["speed"][:last + 1].tolist(),
+                                      record["thrust"][:last + 1].tolist(), record["gravity"][:last + 1].tolist())]
+    return {
+        "last": last,
+        "offsets": (pixels * altitude / peak).astype(np.int32),
+        "stage": record["stage"][:last + 1].astype(np.int8),
+        "thrust": record["thrust"][:last + 1].astype(np.float32),
+        "readouts": readouts,
+    }
+
+
+def orbit_path(radius, width, height):
+    # The craft's bounding box at each of ORBIT_STEPS angles around a circle of
+    # `radius` at the canvas centre, the orbited body on the right edge, and the
+    # speed readouts.
+    cx, cy = width // 2, height // 2
+    angle = np.radians(3 * np.arange(ORBIT_STEPS))
+    x, y = cx + radius * np.cos(angle), cy + radius * np.sin(angle)
+    speed = (28000 - 200 * np.sin(angle * 2)).astype(np.int32)
+    body = radius // 3
+    return {
+        "body": (width - body, cy - body, width + body, cy + body),
+        "orbit": (cx - radius, cy - radius, cx + radius, cy + radius),
+        "craft": np.column_stack((x - CRAFT_RADIUS, y - CRAFT_RADIUS, x + CRAFT_RADIUS, y + CRAFT_RADIUS)),
+        "readouts": [f"Orbit: {s} km/h | Altitude: {radius * 10} km" for s in speed.tolist()],
+    }
@@ -0,0 +1,217 @@
+import atexit
+import math
+import os
+import time
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from orbits import PLANET_ORBITS, EphemerisTable
+from solar_view import world_radius
+
+GM_SUN = 4 * math.pi ** 2  # AU^3 / year^2
+# In solar masses. Belt bodies are test particles: they feel the Sun and these,
+# and the planets themselves follow their ephemeris.
+PLANET_MASSES = {
+    "Mercury": 1.66e-7, "Venus": 2.45e-6, "Earth": 3.00e-6, "Mars": 3.23e-7,
+    "Jupiter": 9.55e-4, "Saturn": 2.86e-4, "Uranus": 4.37e-5, "Neptune": 5.15e-5,
+}
+SOFTENING = 0.01  # AU; keeps close planet encounters finite
+MAX_STEP = 0.004  # years per leapfrog step
+MAX_STEPS = 8  # per published frame; past this a worker falls behind the clock instead of stalling
+FRAME_SECONDS = 1 / 60
+TARGET, STOP = 0, 1  # control slots
+
+
+class Layout:
+    # One shared block: a float64 control area (target time, stop flag), each
+    # worker's last published frame number, each worker's simulation time per
+    # buffer, then two (bodies, 2) float32 buffers of world positions.
+    def __init__(self, bodies, workers):
+        self.bodies = bodies
+        self.workers = workers
+        self.size = 8 * (2 + 3 * workers) + 2 * bodies * 2 * 4
+
+    def views(self, buffer):
+        workers = self.workers
+        control = np.ndarray(2, np.float64, buffer, 0)
+        frames = np.ndarray(workers, np.int64, buffer, 16)
+        times = np.ndarray((2, workers), np.float64, buffer, 16 + 8 * workers)
+        positions = np.ndarray((2, self.bodies, 2), np.float32, buffer, 16 + 24 * workers)
+        return control, frames, times, positions
+
+
+class BeltIntegrator:
+    # Leapfrog (kick-drift-kick) integration of a slice of belt bodies, in AU
+    # and years. Coordinates are kept as separate x and y arrays and updated in
+    # place with preallocated scratch, so a step is a few passes over contiguous
+    # memory per planet. world() maps the result onto SolarSystem's compressed scale.
+    def __init__(self, position, velocity, years, planets, planet_log_au, planet_world):
+        position, velocity = np.asarray(position, dtype=float), np.asarray(velocity, dtype=float)
+        self.x, self.y = position[:, 0].copy(), position[:, 1].copy()
+        self.vx, self.vy = velocity[:, 0].copy(), velocity[:, 1].copy()
+        self.years = years
+        self.ephemeris = EphemerisTable(planets)
+        self.planet_au = np.array([PLANET_ORBITS[name]["period"] ** (2 / 3) for name in planets])
+        self.planet_gm = GM_SUN * np.array([PLANET_MASSES[name] for name in planets])
+        self.planet_log_au = planet_log_au
+        self.planet_world = planet_world
+        self.ax, self.ay, self.dx, self.dy, self.d2, self.scratch = (np.empty_like(self.x) for _ in range(6))
+        self.acceleration()
+        self.steps = 0
+
+    def acceleration(self):
+        x, y, ax, ay, dx, dy, d2, scratch = self.x, self.y, self.ax, self.ay, self.dx, self.dy, self.d2, self.scratch
+        np.multiply(x, x, out=d2)
+        d2 += np.multiply(y, y, out=scratch)
+        np.sqrt(d2, out=scratch)
+        scratch *= d2
+        np.divide(-GM_SUN, scratch, out=scratch)
+        np.multiply(x, scratch, out=ax)
+        np.multiply(y, scratch, out=ay)
+        planets = self.ephemeris.unit_positions(self.years) * self.planet_au[:, None]
+        for (px, py), gm in zip(planets.tolist(), self.planet_gm.tolist()):
+            np.subtract(px, x, out=dx)
+            np.subtract(py, y, out=dy)
+            np.multiply(dx, dx, out=d2)
+            d2 += np.multiply(dy, dy, out=scratch)
+            d2 += SOFTENING * SOFTENING
+            np.sqrt(d2, out=scratch)
+            scratch *= d2
+            np.divide(gm, scratch, out=scratch)
+            dx *= scratch
+            ax += dx
+            dy *= scratch
+            ay += dy
+
+    def advance(self, target, max_steps=MAX_STEPS):
+        span = min(target - self.years, max_steps * MAX_STEP)
+        if span <= 0:
+            return 0
+        steps = math.ceil(span / MAX_STEP)
+        dt = span / steps
+        for _ in range(steps):
+            self.vx += np.multiply(self.ax, dt / 2, out=self.dx)
+            self.vy += np.multiply(self.ay, dt / 2, out=self.dy)
+            self.x += np.multiply(self.vx, dt, out=self.dx)
+            self.y += np.multiply(self.vy, dt, out=self.dy)
+            self.years += dt
+            self.acceleration()
+            self.vx += np.multiply(self.ax, dt / 2, out=self.dx)
+            self.vy += np.multiply(self.ay, dt / 2, out=self.dy)
+        self.steps += steps
+        return steps
+
+    def world(self, out):
+        r = np.hypot(self.x, self.y)
+        scale = world_radius(r, self.planet_log_au, self.planet_world) / r
+        np.multiply(self.x, scale, out=out[:, 0], casting="same_kind")
+        np.multiply(self.y, scale, out=out[:, 1], casting="same_kind")
+
+
+def run_worker(name, layout, rank, lo, hi, integrator):
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        simulate(block.buf, layout, rank, lo, hi, integrator)
+    finally:
+        block.close()
+
+
+def simulate(buffer, layout, rank, lo, hi, integrator):
+    # Frame n goes to buffer n % 2, and is only started once every worker has
+    # published n - 1. So while the slowest worker is still on frame m + 1,
+    # nobody is writing buffer m % 2, which is the one the UI reads.
+    control, frames, times, positions = layout.views(buffer)
+    frame = 0
+    integrator.world(positions[0, lo:hi])
+    times[0, rank] = integrator.years
+    frames[rank] = 0
+    while not control[STOP]:
+        started = time.perf_counter()
+        if integrator.advance(control[TARGET]):
+            frame += 1
+            while frames.min() < frame - 1 and not control[STOP]:
+                time.sleep(0.0005)
+            integrator.world(positions[frame % 2, lo:hi])
+            times[frame % 2, rank] = integrator.years
+            frames[rank] = frame
+        time.sleep(max(0.0, started + FRAME_SECONDS - time.perf_counter()))
+
+
+class BeltSimulation:
+    # A SolarSystem's belt bodies simulated by `workers` processes, each owning
+    # a contiguous slice, so physics cost is split across cores and never runs
+    # on the Tk thread. The UI sets the target time and copies the newest
+    # complete frame out of shared memory; nothing is pickled after start-up.
+    def __init__(self, system, years, workers=None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        count = len(system.belt_au)
+        self.layout = Layout(count, self.workers)
+        self.block = shared_memory.SharedMemory(create=True, size=self.layout.size)
+        self.control, self.frames, self.times, self.positions = self.layout.views(self.block.buf)
+        self.control[:] = (years, 0)
+        self.frames[:] = -1
+        self.frame = np.empty((count, 2), dtype=np.float32)
+        self.frame_number = -1
+        self.years = years
+        self.torn = 0
+
+        # Start every body on its circular orbit at `years`, matching the analytic belt.
+        angle = system.belt_angles(years)
+        cos, sin = np.cos(angle), np.sin(angle)
+        position = system.belt_au[:, None] * np.column_stack((cos, -sin))
+        velocity = (system.belt_au * system.belt_omega)[:, None] * np.column_stack((-sin, -cos))
+        planets = [b["name"] for b in system.bodies if b["kind"] == "planet" and b["name"] in PLANET_MASSES]
+        # Spawned, not forked: the parent holds a Tk interpreter and open database connections.
+        context = get_context("spawn")
+        bounds = np.linspace(0, count, self.workers + 1).astype(int).tolist()
+        self.processes = []
+        for rank, (lo, hi) in enumerate(zip(bounds, bounds[1:])):
+            integrator = BeltIntegrator(position[lo:hi], velocity[lo:hi], years, planets,
+                                        system.log_au, system.planet_world)
+            process = context.Process(target=run_worker, args=(self.block.name, self.layout, rank, lo, hi, integrator),
+                                      name=f"belt-{rank}", daemon=True)
+            process.start()
+            self.processes.append(process)
+        atexit.register(self.close)
+
+    def set_target(self, years):
+        if self.block is not None:
+            self.control[TARGET] = years
+
+    def read(self):
+        # The newest frame every worker has finished, or None before the first.
+        # Copied out seqlock-style: if the oldest frame moved on during the copy,
+        # a worker may have started overwriting that buffer, so copy again.
+        if self.block is None:
+            return None
+        for _ in range(3):
+            frame = int(self.frames.min())
+            if frame < 0:
+                return None
+            if frame == self.frame_number:
+                return self.frame
+            np.copyto(self.frame, self.positions[frame % 2])
+            if int(self.frames.min()) == frame:
+                self.frame_number = frame
+                self.years = float(self.times[frame % 2].min())
+                return self.frame
+        # Still racing: each body is from one of two consecutive frames, which
+        # draws fine; it is not kept as a complete frame.
+        self.torn += 1
+        self.frame_number = -1
+        return self.frame
+
+    def close(self):
+        if self.block is None:
+            return
+        self.control[STOP] = 1
+        for process in self.processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+        self.control = self.frames = self.times = self.positions = None
+        self.block.close()
+        self.block.unlink()
+        self.block = None
+        atexit.unregister(self.close)
@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+J2000_UNIX = 946728000.0
+DAYS_PER_YEAR = 365.25
+
+# Orbital elements at J2000: period (years), eccentricity, mean longitude and
+# longitude of perihelion (degrees).
+PLANET_ORBITS = {
+    "Mercury": {"period": 0.2408, "eccentricity": 0.2056, "mean_longitude": 252.25, "perihelion": 77.46},
+    "Venus": {"period": 0.6152, "eccentricity": 0.0068, "mean_longitude": 181.98, "perihelion": 131.53},
+    "Earth": {"period": 1.0, "eccentricity": 0.0167, "mean_longitude": 100.46, "perihelion": 102.94},
+    "Mars": {"period": 1.8809, "eccentricity": 0.0934, "mean_longitude": 355.45, "perihelion": 336.04},
+    "Jupiter": {"period": 11.862, "eccentricity": 0.0484, "mean_longitude": 34.40, "perihelion": 14.75},
+    "Saturn": {"period": 29.457, "eccentricity": 0.0539, "mean_longitude": 49.94, "perihelion": 92.43},
+    "Uranus": {"period": 84.011, "eccentricity": 0.0473, "mean_longitude": 313.23, "perihelion": 170.96},
+    "Neptune": {"period": 164.79, "eccentricity": 0.0086, "mean_longitude": 304.88, "perihelion": 44.97},
+}
+
+
+def years_since_j2000(now=None):
+    return ((now or time.time()) - J2000_UNIX) / 86400 / DAYS_PER_YEAR
+
+
+def solve_kepler(mean_anomaly, eccentricity, iterations=8):
+    # Newton's method on E - e sin E = M, vectorised over every sample at once.
+    eccentric = mean_anomaly + eccentricity * np.sin(mean_anomaly)
+    for _ in range(iterations):
+        eccentric -= ((eccentric - eccentricity * np.sin(eccentric) - mean_anomaly)
+                      / (1 - eccentricity * np.cos(eccentric)))
+    return eccentric
+
+
+class EphemerisTable:
+    # One table per body of unit-semi-major-axis positions sampled uniformly in
+    # mean anomaly, i.e. uniformly in time. Looking a position up is an index
+    # computation, so changing the time warp never adds trig to the frame loop.
+    def __init__(self, names, samples=2048, orbits=PLANET_ORBITS):
+        self.names = list(names)
+        self.samples = samples
+        elements = [orbits[name] for name in self.names]
+        self.periods = np.array([e["period"] for e in elements])
+        eccentricity = np.array([e["eccentricity"] for e in elements])[:, None]
+        perihelion = np.radians([e["perihelion"] for e in elements])[:, None]
+        mean_longitude = np.radians([e["mean_longitude"] for e in elements])
+        self.phase = ((mean_longitude - perihelion[:, 0]) / (2 * np.pi)) % 1.0
+        self.eccentricity = eccentricity[:, 0]
+
+        mean_anomaly = np.broadcast_to(2 * np.pi * np.arange(samples) / samples, (len(elements), samples))
+        eccentric = solve_kepler(mean_anomaly, eccentricity)
+        true_anomaly = 2 * np.arctan2(np.sqrt(1 + eccentricity) * np.sin(eccentric / 2),
+                                      np.sqrt(1 - eccentricity) * np.cos(eccentric / 2))
+        radius = 1 - eccentricity * np.cos(eccentric)
+        angle = true_anomaly + perihelion
+        self.table = np.empty((len(elements), samples, 2))
+        self.table[:, :, 0] = radius * np.cos(angle)
+        # Screen y grows downwards; flip it so orbits run anticlockwise.
+        self.table[:, :, 1] = -radius * np.sin(angle)
+        self.rows = np.arange(len(elements))
+
+    def unit_positions(self, years):
+        fraction = (years / self.periods + self.phase) % 1.0
+        index = (fraction * self.samples).astype(int) % self.samples
+        return self.table[self.rows, index]
+
+    def positions(self, years, radii, center):
+        return self.unit_positions(years) * np.asarray(radii)[:, None] + np.asarray(center)
+
+    def orbit_path(self, row, radius, center, points=120):
+        # Flattened polygon coordinates tracing the body's elliptical orbit.
+        step = max(1, self.samples // points)
+        path = self.table[row, ::step] * radius + np.asarray(center)
+        return path.ravel().tolist()
@@ -0,0 +1,131 @@
+import numpy as np
+
+# Hot exhaust cools from white-yellow through orange and red into grey smoke.
+EXHAUST_PALETTE = ["#FFFFCC", "#FFEE55", "#FFBB22", "#FF8800", "#FF5500",
+                   "#DD3300", "#993322", "#664444", "#444444", "#333333"]
+
+
+class ParticleSystem:
+    # Fixed pool of canvas ovals. Particle state lives in NumPy arrays and is
+    # advanced in one vectorised step; render() then touches only the items whose
+    # position, colour or visibility actually changed.
+    def __init__(self, canvas, capacity=1000, tag="effect", palette=EXHAUST_PALETTE,
+                 gravity=60.0, drag=1.5, rng=None):
+        self.canvas = canvas
+        self.capacity = capacity
+        self.tag = tag
+        self.palette = palette
+        self.gravity = gravity
+        self.drag = drag
+        self.rng = rng or np.random.default_rng()
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity)
+        self.life = np.ones(capacity)
+        self.size = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.shown = np.zeros(capacity, dtype=bool)
+        self.shade = np.full(capacity, -1)
+        self.items = []
+        self.stats = {"emitted": 0, "recycled": 0, "coords_calls": 0, "config_calls": 0}
+
+    @property
+    def live_count(self):
+        return int(self.alive.sum())
+
+    def _ensure_items(self):
+        if self.items and len(self.canvas.find_withtag(self.tag)) == self.capacity:
+            return
+        self.canvas.delete(self.tag)
+        self.items = [self.canvas.create_oval(0, 0, 0, 0, fill=self.palette[0], outline="",
+                                              state="hidden", tags=self.tag)
+                      for _ in range(self.capacity)]
+        self.shown[:] = False
+        self.shade[:] = -1
+
+    def emit(self, count, x, y, spread=12.0, speed=(120.0, 260.0), angle=(60.0, 120.0),
+             life=(0.5, 1.3), size=(2.0, 8.0)):
+        if count <= 0:
+            return
+        free = np.flatnonzero(~self.alive)
+        if len(free) < count:
+            # Out of free slots: recycle the live particles closest to the end of their life.
+            live = np.flatnonzero(self.alive)
+            taken = live[np.argsort(self.life[live] - self.age[live])[:count - len(free)]]
+            free = np.concatenate([free, taken])
+            self.stats["recycled"] += len(taken)
+        slots = free[:count]
+        n = len(slots)
+        rng = self.rng
+        theta = np.radians(rng.uniform(angle[0], angle[1], n))
+        magnitude = rng.uniform(speed[0], speed[1], n)
+        self.pos[slots, 0] = x + rng.uniform(-spread, spread, n)
+        self.pos[slots, 1] = y
+        self.vel[slots, 0] = np.cos(theta) * magnitude
+        self.vel[slots, 1] = np.sin(theta) * magnitude
+        self.age[slots] = 0.0
+        self.life[slots] = rng.uniform(life[0], life[1], n)
+        self.size[slots] = rng.uniform(size[0], size[1], n)
+        self.alive[slots] = True
+        self.stats["emitted"] += n
+
+    def reseed(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def restore(self, x, y, size, fade):
+        # Replace the live particles with recorded ones; fade is age / life.
+        n = min(len(x), self.capacity)
+        self.alive[:] = False
+        self.pos[:n, 0] = x[:n]
+        self.pos[:n, 1] = y[:n]
+        self.size[:n] = size[:n]
+        self.age[:n] = fade[:n]
+        self.life[:n] = 1.0
+        self.alive[:n] = True
+
+    def update(self, dt):
+        live = self.alive
+        if not live.any():
+            return
+        self.age[live] += dt
+        self.vel[live] *= max(0.0, 1.0 - self.drag * dt)
+        self.vel[live, 1] += self.gravity * dt
+        self.pos[live] += self.vel[live] * dt
+        self.alive &= self.age < self.life
+
+    def render(self):
+        self._ensure_items()
+        canvas = self.canvas
+        items = self.items
+
+        for i in np.flatnonzero(self.shown & ~self.alive):
+            canvas.itemconfig(items[i], state="hidden")
+            self.stats["config_calls"] += 1
+        live = np.flatnonzero(self.alive)
+        if len(live):
+            # Particles also grow as they cool into smoke.
+            fade = np.clip(self.age[live] / self.life[live], 0.0, 0.999)
+            shade = (fade * len(self.palette)).astype(int)
+            radius = self.size[live] * (0.5 + fade)
+            boxes = np.empty((len(live), 4))
+            boxes[:, 0] = self.pos[live, 0] - radius
+            boxes[:, 1] = self.pos[live, 1] - radius
+            boxes[:, 2] = self.pos[live, 0] + radius
+            boxes[:, 3] = self.pos[live, 1] + radius
+            changed = shade != self.shade[live]
+            newly_shown = ~self.shown[live]
+            for i, box, new_shade, recolour, show in zip(live.tolist(), boxes.tolist(), shade.tolist(),
+                                                          changed.tolist(), newly_shown.tolist()):
+                canvas.coords(items[i], *box)
+                if recolour or show:
+                    canvas.itemconfig(items[i], fill=self.palette[new_shade], state="normal")
+                    self.stats["config_calls"] += 1
+            self.stats["coords_calls"] += len(live)
+            self.shade[live] = shade
+        self.shown[:] = self.alive
+
+    def clear(self):
+        self.alive[:] = False
+        if self.items:
+            self.canvas.itemconfig(self.tag, state="hidden")
+        self.shown[:] = False
@@ -0,0 +1,128 @@
+import time
+import tkinter as tk
+from collections import Counter, defaultdict
+
+UNTAGGED = "(untagged)"
+
+
+def count_widgets(widget):
+    return sum(1 + count_widgets(child) for child in widget.winfo_children())
+
+
+def canvas_tag_counts(canvas):
+    counts = Counter()
+    for item in canvas.find_all():
+        tags = [tag for tag in canvas.gettags(item) if tag != "current"]
+        counts.update(tags or [UNTAGGED])
+    return counts
+
+
+class LeakTracker:
+    # Snapshots of canvas item counts (total and per tag) and live widget counts,
+    # grouped by label. Comparing snapshots that share a label (e.g. each visit to
+    # the same mode) makes steady-state differences between modes irrelevant: only
+    # counts that keep rising visit after visit are reported.
+    def __init__(self, root, canvases, window=3):
+        self.root = root
+        self.canvases = canvases
+        self.window = window
+        self.history = defaultdict(list)
+
+    def measure(self):
+        metrics = {"widgets": count_widgets(self.root)}
+        for name, canvas in self.canvases.items():
+            metrics[f"{name}.items"] = len(canvas.find_all())
+            metrics[f"{name}.children"] = len(canvas.winfo_children())
+            for tag, count in canvas_tag_counts(canvas).items():
+                metrics[f"{name}:{tag}"] = count
+        return metrics
+
+    def snapshot(self, label):
+        metrics = self.measure()
+        self.history[label].append(metrics)
+        return metrics
+
+    def leaks(self):
+        # {(label, metric): last `window` values} for every metric that grew on
+        # each of the last `window` - 1 snapshots taken under the same label.
+        found = {}
+        for label, snapshots in self.history.items():
+            recent = snapshots[-self.window:]
+            if len(recent) < self.window:
+                continue
+            for metric in recent[-1]:
+                values = [snap.get(metric, 0) for snap in recent]
+                if all(a < b for a, b in zip(values, values[1:])):
+                    found[(label, metric)] = values
+        return found
+
+    def reset(self):
+        self.history.clear()
+
+
+class PerfOverlay:
+    # Debug readout in the window's top-right corner: scheduler FPS and frame
+    # time, canvas items per tag, live widget count and any suspected leaks.
+    # Hidden by default; toggle() (bound to F3 by the app) shows and hides it.
+    def __init__(self, root, canvas, scheduler, tracker, interval_ms=500, top_tags=6):
+        self.root = root
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.tracker = tracker
+        self.interval_ms = interval_ms
+        self.top_tags = top_tags
+        self.label = None
+        self.visible = False
+        self._after_id = None
+        self._last_time = None
+        self._last_frames = 0
+
+    def toggle(self, event=None):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        if self.label is None or not self.label.winfo_exists():
+            self.label = tk.Label(self.root, font=("Consolas", 9), fg="#00FF66", bg="#000000",
+                                  justify=tk.LEFT, anchor="nw")
+        self.label.place(relx=1.0, x=-10, y=10, anchor="ne")
+        self.visible = True
+        self._last_time = time.perf_counter()
+        self._last_frames = self.scheduler.stats["frames"]
+        self.refresh()
+
+    def hide(self):
+        self.visible = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self.label is not None:
+            self.label.place_forget()
+
+    def text(self):
+        now = time.perf_counter()
+        frames = self.scheduler.stats["frames"]
+        elapsed = now - self._last_time if self._last_time else 0
+        fps = (frames - self._last_frames) / elapsed if elapsed > 0 else 0.0
+        self._last_time, self._last_frames = now, frames
+
+        counts = canvas_tag_counts(self.canvas)
+        lines = [
+            f"FPS {fps:5.1f}  frame {self.scheduler.stats['last_frame_ms']:5.2f} ms",
+            f"timelines {len(self.scheduler.timelines)}  dropped {self.scheduler.stats['dropped_steps']}",
+            f"items {len(self.canvas.find_all())}  widgets {count_widgets(self.root)}",
+        ]
+        for tag, count in counts.most_common(self.top_tags):
+            lines.append(f"  {tag:<18} {count:>5}")
+        for (label, metric), values in self.tracker.leaks().items():
+            lines.append(f"LEAK? {label} {metric}: {' -> '.join(map(str, values))}")
+        return "\n".join(lines)
+
+    def refresh(self):
+        self._after_id = None
+        if not self.visible:
+            return
+        self.label.config(text=self.text())
+        self._after_id = self.root.after(self.interval_ms, self.refresh)
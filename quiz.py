@@ -0,0 +1,103 @@
+import math
+import random
+from collections import defaultdict, deque
+
+# Adaptive quiz selection. Questions are bucketed by (topic, difficulty) once, so
+# choosing the next one looks at a handful of buckets however big the bank is.
+# Each topic carries an ability estimate on the difficulty scale (Elo-style: a
+# correct answer to a question harder than the estimate moves it up more than an
+# easy one). The next question comes from the topic asked least this round
+# (weakest first), at the difficulty nearest that topic's ability, preferring
+# questions the student has not seen. Missed questions come back a few turns later.
+
+START_ABILITY = 1.0
+LEARNING_RATE = 0.4
+REVIEW_GAP = 3  # questions asked before a missed one is repeated
+
+
+class QuestionBank:
+    def __init__(self, questions):
+        self.by_key = {}
+        self.buckets = defaultdict(list)
+        for question in questions:
+            self.by_key[question["key"]] = question
+            self.buckets[(question["topic"], question["difficulty"])].append(question)
+        self.topics = sorted({topic for topic, _ in self.buckets})
+        self.levels = defaultdict(list)
+        for topic, difficulty in sorted(self.buckets):
+            self.levels[topic].append(difficulty)
+
+    def __len__(self):
+        return len(self.by_key)
+
+
+def expected(ability, difficulty):
+    return 1.0 / (1.0 + math.exp(difficulty - ability))
+
+
+class AdaptiveQuiz:
+    def __init__(self, bank, history=(), rng=None):
+        self.bank = bank
+        self.rng = rng or random.Random()
+        self.ability = {topic: START_ABILITY for topic in bank.topics}
+        self.seen = set()
+        self.review = deque()  # (due at asked count, key)
+        self.pending = set()  # keys waiting in review
+        self.asked = 0
+        self.round_counts = defaultdict(int)
+        self.cursors = {}  # bucket -> [shuffled questions, next index]
+        # history: (question key, correct) from oldest to newest. Questions still
+        # missed at the end of it are due for review straight away.
+        for key, correct in history:
+            if key in bank.by_key:
+                self.record(bank.by_key[key], correct)
+        self.review = deque((0, key) for _, key in self.review)
+
+    def new_round(self):
+        self.round_counts.clear()
+
+    def _from_bucket(self, bucket):
+        # Walks the bucket in a shuffled order, skipping questions already seen
+        # (earlier sessions, reviews). Once it runs out the bucket is reshuffled
+        # and repeats are allowed, so a student stays at their level rather than
+        # being pushed to a neighbouring difficulty.
+        cursor = self.cursors.get(bucket)
+        if cursor is None or cursor[1] >= len(cursor[0]):
+            order = list(self.bank.buckets[bucket])
+            self.rng.shuffle(order)
+            cursor = self.cursors[bucket] = [order, 0, cursor is not None]
+        order, index, repeating = cursor
+        while not repeating and index < len(order) - 1 and order[index]["key"] in self.seen:
+            index += 1
+        cursor[1] = index + 1
+        return order[index]
+
+    def next_question(self):
+        if not self.bank:
+            return None
+        if self.review and self.review[0][0] <= self.asked:
+            key = self.review.popleft()[1]
+            self.pending.discard(key)
+            question = self.bank.by_key[key]
+        else:
+            question = self._pick()
+        self.asked += 1
+        self.round_counts[question["topic"]] += 1
+        return question
+
+    def _pick(self):
+        topic = min(self.bank.topics, key=lambda t: (self.round_counts[t], self.ability[t], self.rng.random()))
+        ability = self.ability[topic]
+        return self._from_bucket((topic, min(self.bank.levels[topic], key=lambda d: abs(d - ability))))
+
+    def record(self, question, correct):
+        topic = question["topic"]
+        self.ability[topic] += LEARNING_RATE * (correct - expected(self.ability[topic], question["difficulty"]))
+        key = question["key"]
+        self.seen.add(key)
+        if not correct and key not in self.pending:
+            self.pending.add(key)
+            self.review.append((self.asked + REVIEW_GAP, key))
+        elif correct and key in self.pending:
+            self.pending.discard(key)
+            self.review = deque(item for item in self.review if item[1] != key)
@@ -0,0 +1,197 @@
+import argparse
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+import numpy as np
+
+# Launch recordings: one frame per fixed simulation step, so a replay or a diff
+# lines up step for step. Layout (little-endian):
+#
+#     header   magic, timestep (float64), metadata length (uint32), metadata JSON
+#     frames   FRAME record, then `particles` PARTICLE records
+#     index    uint64 file offset of every frame
+#     footer   index offset (uint64), frame count (uint64), magic
+#
+# The writer only appends, and the index goes at the end. RecordingReader
+# memory-maps the file and views the index and each frame in place, so seeking
+# anywhere in a long recording touches only that frame's pages.
+#
+#     python recording.py launch.nsxr                        # summary
+#     python recording.py launch.nsxr --compare other.nsxr   # first diverging frame, largest differences
+
+MAGIC = b"NSXREC1\0"
+HEADER = struct.Struct("<8sdI")
+FOOTER = struct.Struct("<QQ8s")
+ASCENT, ORBIT = 1, 2  # frame phases
+FRAME = np.dtype([("phase", "u1"), ("stage", "u1"), ("index", "<u2"), ("offset", "<i4"), ("particles", "<u2")])
+# Positions in quarter pixels, clipped to about +-8191 px (past the edge of any
+# canvas, so clipped particles still replay off-screen); fade is age / life.
+PARTICLE = np.dtype([("x", "<i2"), ("y", "<i2"), ("size", "<f2"), ("fade", "<f2")])
+MIN_SPEED, MAX_SPEED = 0.25, 16.0
+
+
+def pack_particles(system):
+    live = np.flatnonzero(system.alive)
+    packed = np.empty(len(live), dtype=PARTICLE)
+    limits = np.iinfo(PARTICLE["x"])
+    packed["x"] = np.clip(np.round(system.pos[live, 0] * 4), limits.min, limits.max)
+    packed["y"] = np.clip(np.round(system.pos[live, 1] * 4), limits.min, limits.max)
+    packed["size"] = system.size[live]
+    packed["fade"] = system.age[live] / system.life[live]
+    return packed
+
+
+class RecordingWriter:
+    def __init__(self, path, timestep, meta):
+        self.path = path
+        self.file = open(path, "wb")
+        meta = json.dumps(meta).encode()
+        self.file.write(HEADER.pack(MAGIC, timestep, len(meta)) + meta)
+        self.position = HEADER.size + len(meta)
+        self.offsets = array("Q")
+        self.frame = np.zeros(1, dtype=FRAME)
+
+    def write(self, phase, stage, index, offset=None, particles=None):
+        # offset=None keeps the previous frame's craft offset.
+        frame = self.frame[0]
+        frame["phase"], frame["stage"], frame["index"] = phase, stage, index
+        if offset is not None:
+            frame["offset"] = offset
+        frame["particles"] = 0 if particles is None else len(particles)
+        self.offsets.append(self.position)
+        self.file.write(self.frame.tobytes())
+        self.position += FRAME.itemsize
+        if frame["particles"]:
+            self.file.write(particles.tobytes())
+            self.position += particles.nbytes
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.write(self.offsets.tobytes())
+        self.file.write(FOOTER.pack(self.position, len(self.offsets), MAGIC))
+        self.file.close()
+
+
+class RecordingReader:
+    # Arrays returned by frame() are views into the mapping; they are only
+    # valid until close().
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) < HEADER.size + FOOTER.size:
+            self.map.close()
+            raise ValueError(f"{path} is not a complete launch recording")
+        magic, self.timestep, meta_length = HEADER.unpack_from(self.map, 0)
+        index_at, count, end_magic = FOOTER.unpack_from(self.map, len(self.map) - FOOTER.size)
+        if magic != MAGIC or end_magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a complete launch recording")
+        self.meta = json.loads(self.map[HEADER.size:HEADER.size + meta_length])
+        self.index = np.frombuffer(self.map, dtype="<u8", count=count, offset=index_at)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def duration(self):
+        return len(self) * self.timestep
+
+    def frame(self, i):
+        at = int(self.index[i])
+        frame = np.frombuffer(self.map, dtype=FRAME, count=1, offset=at)[0]
+        particles = np.frombuffer(self.map, dtype=PARTICLE, count=int(frame["particles"]), offset=at + FRAME.itemsize)
+        return frame, particles
+
+    def close(self):
+        self.index = None
+        try:
+            self.map.close()
+        except BufferError:
+            pass  # frames still viewed elsewhere; the mapping goes with the last of them
+
+
+class ReplayClock:
+    # Playback position in recording seconds, advanced by wall time times a
+    # speed between MIN_SPEED and MAX_SPEED. Frames are looked up, never
+    # stepped through, so any speed or seek costs one frame read.
+    def __init__(self, reader, speed=1.0):
+        self.reader = reader
+        self.position = 0.0
+        self.speed = 1.0
+        self.set_speed(speed)
+
+    def set_speed(self, speed):
+        self.speed = min(MAX_SPEED, max(MIN_SPEED, speed))
+
+    def seek(self, seconds):
+        self.position = min(self.reader.duration, max(0.0, seconds))
+
+    def advance(self, dt):
+        self.seek(self.position + dt * self.speed)
+        return self.current
+
+    @property
+    def current(self):
+        return min(len(self.reader) - 1, int(self.position / self.reader.timestep))
+
+    @property
+    def finished(self):
+        return self.position >= self.reader.duration
+
+
+def compare(a, b):
+    # First frame whose header or particles differ, and the largest offset and
+    # particle position differences (pixels) over the common frames.
+    first, offset, position = None, 0, 0.0
+    for i in range(min(len(a), len(b))):
+        fa, pa = a.frame(i)
+        fb, pb = b.frame(i)
+        same = fa.tobytes() == fb.tobytes() and pa.tobytes() == pb.tobytes()
+        if same:
+            continue
+        if first is None:
+            first = i
+        offset = max(offset, abs(int(fa["offset"]) - int(fb["offset"])))
+        n = min(len(pa), len(pb))
+        if n:
+            dx = np.abs(pa["x"][:n].astype(int) - pb["x"][:n]).max() / 4
+            dy = np.abs(pa["y"][:n].astype(int) - pb["y"][:n]).max() / 4
+            position = max(position, dx, dy)
+    return {"frames": (len(a), len(b)), "first_difference": first, "max_offset_px": offset,
+            "max_particle_px": position}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise a launch recording or diff two of them frame by frame.")
+    parser.add_argument("path")
+    parser.add_argument("--compare", metavar="OTHER", help="report where OTHER first differs from PATH")
+    args = parser.parse_args()
+
+    try:
+        reader = RecordingReader(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    meta = ", ".join(f"{key}={value}" for key, value in reader.meta.items())
+    print(f"{args.path}: {len(reader)} frames, {reader.duration:.1f} s at {1 / reader.timestep:.0f} steps/s ({meta})")
+    counts = np.array([int(reader.frame(i)[0]["particles"]) for i in range(len(reader))])
+    if len(counts):
+        print(f"particles per frame: mean {counts.mean():.0f}, max {counts.max()}")
+    if args.compare:
+        other = RecordingReader(args.compare)
+        result = compare(reader, other)
+        if result["first_difference"] is None and len(reader) == len(other):
+            print(f"{args.compare}: identical")
+        else:
+            print(f"{args.compare}: {result}")
+        other.close()
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import csv
+import sys
+import time
+
+import database
+
+# Bulk account provisioning for classrooms:
+#
+#     python roster.py students.csv [--db nasa_explorer.db] [--batch-size 1000]
+#
+# The CSV needs `username` and `password` columns (any order, any case; other
+# columns are ignored). Existing usernames are left untouched and reported as
+# skipped.
+
+
+def read_roster(lines, problems):
+    reader = csv.DictReader(lines)
+    fields = {name.strip().lower(): name for name in reader.fieldnames or []}
+    if "username" not in fields or "password" not in fields:
+        raise ValueError("roster needs 'username' and 'password' columns")
+    for row in reader:
+        username = (row[fields["username"]] or "").strip()
+        password = row[fields["password"]] or ""
+        if not username or not password:
+            problems.append(f"line {reader.line_num}: missing username or password")
+            continue
+        yield username, password
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a CSV roster of student accounts.")
+    parser.add_argument("csv", help="roster file with username and password columns")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    database.DB_PATH = args.db
+    database.create_tables()
+    problems = []
+
+    def report(totals):
+        print(f"\r{totals['created']} created, {totals['skipped']} skipped", end="", file=sys.stderr)
+
+    started = time.perf_counter()
+    with open(args.csv, newline="", encoding="utf-8-sig") as f:
+        try:
+            totals = database.import_users(read_roster(f, problems), batch_size=args.batch_size, on_batch=report)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    elapsed = time.perf_counter() - started
+    print(file=sys.stderr)
+    database.close_pool()
+
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    print(f"Imported {totals['created']} accounts ({totals['skipped']} already existed, "
+          f"{len(problems)} invalid rows) in {totals['batches']} transactions, {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+class CraftNode:
+    def __init__(self, craft_id, tag, items, x, y):
+        self.craft_id = craft_id
+        self.tag = tag
+        self.items = items
+        self.x = x
+        self.y = y
+        self.scale = 1.0
+
+
+class SceneGraph:
+    # Retained-mode craft rendering: each craft's items are created once from its
+    # shape data, then shown, hidden, moved and scaled in place. Only the visible
+    # craft carries `active_tag`, so code animating that tag never touches the rest.
+    def __init__(self, canvas, shapes, on_hover=None, active_tag="spaceship"):
+        self.canvas = canvas
+        self.shapes = shapes
+        self.on_hover = on_hover
+        self.active_tag = active_tag
+        self.nodes = {}
+        self.visible = None
+        self.stats = {"built": 0, "shown": 0, "items_created": 0}
+
+    def _alive(self, node):
+        return node is not None and bool(self.canvas.find_withtag(node.tag))
+
+    def _build(self, craft_id, x, y):
+        tag = f"craft:{craft_id}"
+        self.canvas.delete(tag)
+        create = {
+            "polygon": self.canvas.create_polygon,
+            "rectangle": self.canvas.create_rectangle,
+            "oval": self.canvas.create_oval,
+            "line": self.canvas.create_line,
+        }
+        items = []
+        for part in self.shapes[craft_id]:
+            coords = []
+            for dx, dy in part["points"]:
+                coords.extend((x + dx, y + dy))
+            options = {key: part[key] for key in ("fill", "outline", "width") if key in part}
+            item = create[part["kind"]](*coords, tags=(tag,), state="hidden", **options)
+            if "tooltip" in part and self.on_hover:
+                self.canvas.tag_bind(item, "<Enter>", lambda e, tip=part["tooltip"]: self.on_hover(*tip))
+            items.append(item)
+        self.stats["built"] += 1
+        self.stats["items_created"] += len(items)
+        node = CraftNode(craft_id, tag, items, x, y)
+        self.nodes[craft_id] = node
+        return node
+
+    def show(self, craft_id, x, y, scale=1.0):
+        node = self.nodes.get(craft_id)
+        if not self._alive(node):
+            node = self._build(craft_id, x, y)
+        if self.visible is not None and self.visible != craft_id:
+            self.hide(self.visible)
+        self.transform(craft_id, x, y, scale)
+        self.canvas.itemconfig(node.tag, state="normal")
+        self.canvas.addtag_withtag(self.active_tag, node.tag)
+        self.visible = craft_id
+        self.stats["shown"] += 1
+        return node
+
+    def hide(self, craft_id):
+        node = self.nodes.get(craft_id)
+        if self._alive(node):
+            self.canvas.itemconfig(node.tag, state="hidden")
+            self.canvas.dtag(node.tag, self.active_tag)
+        if self.visible == craft_id:
+            self.visible = None
+
+    def transform(self, craft_id, x, y, scale=1.0):
+        node = self.nodes[craft_id]
+        if scale != node.scale:
+            factor = scale / node.scale
+            self.canvas.scale(node.tag, node.x, node.y, factor, factor)
+            node.scale = scale
+        if (x, y) != (node.x, node.y):
+            self.canvas.move(node.tag, x - node.x, y - node.y)
+            node.x, node.y = x, y
+
+    def move(self, dx, dy):
+        if self.visible is not None:
+            node = self.nodes[self.visible]
+            self.transform(self.visible, node.x + dx, node.y + dy, node.scale)
+
+    def clear(self):
+        for node in self.nodes.values():
+            self.canvas.delete(node.tag)
+        self.nodes = {}
+        self.visible = None
@@ -0,0 +1,480 @@
+import math
+
+import numpy as np
+
+from orbits import DAYS_PER_YEAR, PLANET_ORBITS, EphemerisTable
+
+# Approximate J2000 elements for the dwarf planets, in the same form as PLANET_ORBITS.
+DWARF_ORBITS = {
+    "Ceres": {"period": 4.60, "eccentricity": 0.0758, "mean_longitude": 160.0, "perihelion": 153.9},
+    "Pluto": {"period": 247.9, "eccentricity": 0.2488, "mean_longitude": 238.9, "perihelion": 224.1},
+    "Haumea": {"period": 284.0, "eccentricity": 0.1950, "mean_longitude": 220.0, "perihelion": 1.8},
+    "Makemake": {"period": 306.0, "eccentricity": 0.1610, "mean_longitude": 171.0, "perihelion": 16.6},
+    "Eris": {"period": 559.0, "eccentricity": 0.4400, "mean_longitude": 32.0, "perihelion": 187.5},
+}
+# (parent, name, period in days; negative for retrograde)
+MOONS = [
+    ("Earth", "Moon", 27.32),
+    ("Mars", "Phobos", 0.319), ("Mars", "Deimos", 1.263),
+    ("Jupiter", "Io", 1.769), ("Jupiter", "Europa", 3.551), ("Jupiter", "Ganymede", 7.155),
+    ("Jupiter", "Callisto", 16.69),
+    ("Saturn", "Enceladus", 1.370), ("Saturn", "Rhea", 4.518), ("Saturn", "Titan", 15.95),
+    ("Uranus", "Titania", 8.706), ("Uranus", "Oberon", 13.46),
+    ("Neptune", "Triton", -5.877),
+    ("Pluto", "Charon", 6.387),
+]
+# (kind, inner and outer semi-major axis in AU, colour)
+BELTS = [("asteroid", 2.1, 3.3, "#8C7B6B"), ("kuiper", 30.0, 50.0, "#6B8CA8")]
+
+SUN_RADIUS = 24  # world units; planets' "distance" values are world units too
+MOON_SPACING = 2.0  # world units between successive moon orbits
+DOT_LIMIT = 800  # belt bodies drawn one by one; above this, cells are aggregated
+AGGREGATE_SAMPLE = 20000  # most belt bodies positioned per frame when aggregating
+CELL_PX = 14  # screen grid cell for aggregation and hit-testing
+CLICK_PX = 6
+ZOOM_STEP = 1.25
+MIN_ZOOM, MAX_ZOOM = 0.5, 200.0  # relative to the fitted scale
+SHADES = ["#3A332C", "#5E5246", "#8C7B6B", "#B8A48E"]
+
+
+def world_radius(au, planet_log_au, planet_world):
+    # Piecewise linear in log(AU) through the planets, extended past Neptune
+    # with the Uranus-Neptune slope.
+    log_au = np.log(au)
+    slope = (planet_world[-1] - planet_world[-2]) / (planet_log_au[-1] - planet_log_au[-2])
+    inner = np.interp(log_au, planet_log_au, planet_world)
+    return np.where(log_au > planet_log_au[-1], planet_world[-1] + (log_au - planet_log_au[-1]) * slope, inner)
+
+
+class SolarSystem:
+    # Every body as flat NumPy arrays so a frame's positions are a few vector
+    # operations: planets and dwarf planets from an EphemerisTable, moons on
+    # circles around their parent, and belt bodies on circles around the Sun.
+    # World units follow the planets' "distance" column (compressed, not AU);
+    # other bodies are placed by interpolating log(AU) between the planets.
+    def __init__(self, planets, belt_counts=(4000, 1500), seed=7):
+        rng = np.random.default_rng(seed)
+        orbits = dict(PLANET_ORBITS, **DWARF_ORBITS)
+        planet_au = np.array([orbits[p["name"]]["period"] ** (2 / 3) for p in planets])
+        self.planet_world = np.array([SUN_RADIUS + 16 + p["distance"] - 50 for p in planets], dtype=float)
+        self.log_au = np.log(planet_au)
+
+        self.bodies = []  # major bodies: dicts with kind, name, size, color (and the planet dict)
+        for planet in planets:
+            self.bodies.append({"kind": "planet", "name": planet["name"], "size": max(4, planet["size"] * 0.45),
+                                "color": planet["color"], "planet": planet,
+                                "au": orbits[planet["name"]]["period"] ** (2 / 3)})
+        for name, elements in DWARF_ORBITS.items():
+            self.bodies.append({"kind": "dwarf", "name": name, "size": 3, "color": "#C8B8A0",
+                                "au": elements["period"] ** (2 / 3), "period": elements["period"]})
+        orbiting = [b["name"] for b in self.bodies]
+        self.ephemeris = EphemerisTable(orbiting, orbits=orbits)
+        self.orbit_world = np.array([self.world_radius(b["au"]) for b in self.bodies])
+
+        index = {name: i for i, name in enumerate(orbiting)}
+        counts = {}
+        self.moon_parent, self.moon_radius, self.moon_period = [], [], []
+        for parent, name, period in MOONS:
+            counts[parent] = counts.get(parent, 0) + 1
+            self.moon_parent.append(index[parent])
+            self.moon_radius.append(self.bodies[index[parent]]["size"] * 0.3 + MOON_SPACING * counts[parent])
+            self.moon_period.append(period / DAYS_PER_YEAR)
+            self.bodies.append({"kind": "moon", "name": name, "size": 2, "color": "#BBBBBB", "parent": parent,
+                                "period_days": abs(period)})
+        self.moon_parent = np.array(self.moon_parent)
+        self.moon_radius = np.array(self.moon_radius)
+        self.moon_period = np.array(self.moon_period)
+        self.moon_phase = rng.uniform(0, 2 * np.pi, len(MOONS))
+        self.orbiting = len(orbiting)
+
+        au, kinds = [], []
+        for kind, (_, inner, outer, _), count in zip(range(len(BELTS)), BELTS, belt_counts):
+            au.append(rng.uniform(inner, outer, count))
+            kinds.append(np.full(count, kind))
+        # Belt bodies are kept sorted by orbit radius, so the bodies that can reach
+        # a viewport (an annulus around the Sun) are one contiguous slice.
+        au = np.concatenate(au)
+        order = np.argsort(au)
+        self.belt_au = au[order]
+        self.belt_kind = np.concatenate(kinds)[order]  # index into BELTS
+        self.belt_world = self.world_radius(self.belt_au)
+        self.belt_period = self.belt_au ** 1.5
+        self.belt_omega = 2 * np.pi / self.belt_period
+        self.belt_phase = rng.uniform(0, 2 * np.pi, len(self.belt_au))
+
+    def world_radius(self, au):
+        return world_radius(au, self.log_au, self.planet_world)
+
+    def major_positions(self, years):
+        # (bodies, 2) world coordinates, Sun at the origin.
+        positions = np.empty((len(self.bodies), 2))
+        positions[:self.orbiting] = self.ephemeris.unit_positions(years) * self.orbit_world[:, None]
+        angle = self.moon_phase + 2 * np.pi * years / self.moon_period
+        positions[self.orbiting:] = positions[self.moon_parent] + self.moon_radius[:, None] * np.column_stack(
+            (np.cos(angle), -np.sin(angle)))
+        return positions
+
+    def belt_angles(self, years, index=slice(None)):
+        return self.belt_phase[index] + years * self.belt_omega[index]
+
+    def belt_positions(self, years, index=slice(None)):
+        angle = self.belt_angles(years, index)
+        return self.belt_world[index, None] * np.column_stack((np.cos(angle), -np.sin(angle)))
+
+
+class SpatialGrid:
+    # Uniform grid over 2-D points, built with one sort: points are ordered by
+    # cell key, and each occupied cell is a slice of that order, so finding the
+    # point under a click only measures distances within neighbouring cells.
+    def __init__(self, points, cell):
+        self.points = points
+        self.cell = cell
+        cells = np.floor(points / cell).astype(np.int64)
+        keys = self.key(cells[:, 0], cells[:, 1])
+        self.order = np.argsort(keys, kind="stable")
+        self.keys, self.starts, self.counts = np.unique(keys[self.order], return_index=True, return_counts=True)
+
+    @staticmethod
+    def key(cx, cy):
+        return cx * 1_000_003 + cy
+
+    def nearest(self, x, y, radius):
+        cx0, cx1 = math.floor((x - radius) / self.cell), math.floor((x + radius) / self.cell)
+        cy0, cy1 = math.floor((y - radius) / self.cell), math.floor((y + radius) / self.cell)
+        best, best_distance = None, radius
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                slot = np.searchsorted(self.keys, self.key(cx, cy))
+                if slot == len(self.keys) or self.keys[slot] != self.key(cx, cy):
+                    continue
+                members = self.order[self.starts[slot]:self.starts[slot] + self.counts[slot]]
+                distance = np.hypot(self.points[members, 0] - x, self.points[members, 1] - y)
+                i = int(np.argmin(distance))
+                if distance[i] <= best_distance:
+                    best, best_distance = int(members[i]), float(distance[i])
+        return best
+
+
+class ItemPool:
+    # Recycled canvas items, kept so that items[:shown] are visible and the rest
+    # hidden. place() moves the first n, configures fills only when they change
+    # and toggles state only for items crossing the shown boundary.
+    def __init__(self, canvas, create):
+        self.canvas = canvas
+        self.create = create
+        self.items = []
+        self.fills = []
+        self.shown = 0
+        self.created = 0
+
+    def place(self, boxes, fills=None):
+        n = len(boxes)
+        while len(self.items) < n:
+            self.items.append(self.create())
+            self.fills.append(None)
+            self.created += 1
+        coords = self.canvas.coords
+        for i, box in enumerate(boxes):
+            coords(self.items[i], *box)
+        if fills is not None:
+            for i, fill in enumerate(fills):
+                if self.fills[i] != fill:
+                    self.canvas.itemconfig(self.items[i], fill=fill)
+                    self.fills[i] = fill
+        for i in range(self.shown, n):
+            self.canvas.itemconfig(self.items[i], state="normal")
+        for i in range(n, self.shown):
+            self.canvas.itemconfig(self.items[i], state="hidden")
+        self.shown = n
+
+
+class SolarView:
+    # Pan/zoom view of a SolarSystem on `canvas`. Each frame:
+    # - positions come from NumPy, and the viewport is culled with one vector mask;
+    # - planets, dwarf planets and moons are individual items, with moons hidden
+    #   until they separate from their planet and labels hidden when they would
+    #   crowd (level of detail);
+    # - visible belt bodies are drawn as dots up to DOT_LIMIT. Above that, each
+    #   occupied CELL_PX screen cell becomes one aggregate sprite shaded by count;
+    # - all items are recycled, and redraws happen at most once per scheduler frame.
+    # Clicks are hit-tested through a SpatialGrid of the drawn belt positions
+    # instead of per-item bindings. With a `belt_source` (an nbody.BeltSimulation)
+    # belt positions come from its latest frame instead of circular orbits.
+    def __init__(self, canvas, system, scheduler, on_select=None, tag="solar", belt_source=None):
+        self.canvas = canvas
+        self.system = system
+        self.belt_source = belt_source
+        self.scheduler = scheduler
+        self.on_select = on_select
+        self.tag = tag
+        self.years = 0.0
+        self.width = self.height = 0
+        self.fit_scale = self.scale = 1.0
+        self.cam = np.zeros(2)  # world point at the canvas centre
+        self.ring_key = None
+        self.press = None
+        self.dirty = True
+        self.stats = {"renders": 0, "visible_belt": 0, "aggregates": 0, "dots": 0, "majors": 0, "labels": 0}
+
+        self.sun = canvas.create_oval(0, 0, 0, 0, fill="#FFCC00", outline="#FF9900", width=2, tags=tag)
+        self.sun_label = canvas.create_text(0, 0, text="Sun", fill="white", font=("Arial", 10), tags=tag)
+        self.rings = [canvas.create_polygon(0, 0, 0, 0, outline="#333366", fill="", dash=(2, 2), tags=tag)
+                      for _ in range(system.orbiting)]
+        self.ring_shown = [True] * system.orbiting
+        self.dots = ItemPool(canvas, lambda: canvas.create_rectangle(0, 0, 0, 0, outline="", tags=tag))
+        self.aggregates = ItemPool(canvas, lambda: canvas.create_oval(0, 0, 0, 0, outline="", tags=tag))
+        self.major_items = []
+        for body in system.bodies:
+            oval = canvas.create_oval(0, 0, 0, 0, fill=body["color"], outline="", tags=(body["name"], tag))
+            label = canvas.create_text(0, 0, text=body["name"], fill="white" if body["kind"] == "planet" else "#AAAAAA",
+                                       font=("Arial", 9 if body["kind"] == "planet" else 8), tags=tag)
+            self.major_items.append([oval, label, True, True])
+        self.major_screen = np.zeros((len(system.bodies), 2))
+        self.major_visible = np.zeros(len(system.bodies), dtype=bool)
+        self.belt_points = np.empty((0, 2))
+        self.belt_visible = np.empty(0, dtype=int)
+        self.grid = None
+        self.aggregated = False
+
+        self.bindings = {
+            "<ButtonPress-1>": self.on_press,
+            "<B1-Motion>": self.on_drag,
+            "<ButtonRelease-1>": self.on_release,
+            "<MouseWheel>": lambda e: self.zoom(e.x, e.y, ZOOM_STEP if e.delta > 0 else 1 / ZOOM_STEP),
+            "<Button-4>": lambda e: self.zoom(e.x, e.y, ZOOM_STEP),
+            "<Button-5>": lambda e: self.zoom(e.x, e.y, 1 / ZOOM_STEP),
+        }
+        for sequence, handler in self.bindings.items():
+            canvas.bind(sequence, handler)
+        self.resize(canvas.winfo_width(), canvas.winfo_height(), refit=True)
+        scheduler.add_frame_callback(self.frame)
+
+    def close(self):
+        self.scheduler.remove_frame_callback(self.frame)
+        for sequence in self.bindings:
+            self.canvas.unbind(sequence)
+
+    def resize(self, width, height, refit=False):
+        self.width, self.height = max(width, 100), max(height, 100)
+        fit = max(80, min(self.width, self.height) // 2 - 20) / (self.system.planet_world[-1] + 8)
+        if refit:
+            self.scale = fit
+        else:
+            self.scale *= fit / self.fit_scale
+        self.fit_scale = fit
+        self.dirty = True
+
+    def set_time(self, years):
+        self.years = years
+        if self.belt_source is not None:
+            self.belt_source.set_target(years)
+        self.dirty = True
+
+    def to_screen(self, world):
+        return (world - self.cam) * self.scale + (self.width / 2, self.height / 2)
+
+    def zoom(self, x, y, factor):
+        # Keep the world point under the cursor fixed.
+        anchor = self.cam + (np.array([x, y]) - (self.width / 2, self.height / 2)) / self.scale
+        self.scale = min(MAX_ZOOM * self.fit_scale, max(MIN_ZOOM * self.fit_scale, self.scale * factor))
+        self.cam = anchor - (np.array([x, y]) - (self.width / 2, self.height / 2)) / self.scale
+        self.dirty = True
+
+    def on_press(self, event):
+        self.press = self.last = (event.x, event.y)
+
+    def on_drag(self, event):
+        if self.press is None:
+            return
+        self.cam -= np.array([event.x - self.last[0], event.y - self.last[1]]) / self.scale
+        self.last = (event.x, event.y)
+        self.dirty = True
+
+    def on_release(self, event):
+        if self.press is not None and abs(event.x - self.press[0]) + abs(event.y - self.press[1]) <= 4:
+            self.click(event.x, event.y)
+        self.press = None
+
+    def click(self, x, y):
+        body = self.hit_test(x, y)
+        if body is None:
+            return None
+        if body["kind"] == "cluster":
+            self.zoom(x, y, 2.0)
+        elif self.on_select:
+            self.on_select(body)
+        return body
+
+    def hit_test(self, x, y):
+        best, best_distance = None, math.inf
+        for i in np.flatnonzero(self.major_visible):
+            distance = math.hypot(self.major_screen[i, 0] - x, self.major_screen[i, 1] - y)
+            if distance <= self.system.bodies[i]["size"] * self.size_factor() + CLICK_PX and distance < best_distance:
+                best, best_distance = self.system.bodies[i], distance
+        if best is not None or not len(self.belt_points):
+            return best
+        if self.grid is None:
+            # Built on the first click after a frame, not every frame.
+            self.grid = SpatialGrid(self.belt_points, CELL_PX)
+        found = self.grid.nearest(x, y, CLICK_PX)
+        if found is None:
+            return None
+        if self.aggregated:
+            return {"kind": "cluster"}
+        i = int(self.belt_visible[found])
+        kind = BELTS[self.system.belt_kind[i]][0]
+        return {"kind": kind, "name": f"{'Asteroid' if kind == 'asteroid' else 'Kuiper belt object'} {i + 1}",
+                "au": float(self.system.belt_au[i]), "period": float(self.system.belt_period[i])}
+
+    def size_factor(self):
+        return min(3.0, max(1.0, self.scale / self.fit_scale) ** 0.5)
+
+    def frame(self):
+        if self.dirty:
+            self.render()
+
+    def render(self):
+        self.dirty = False
+        canvas = self.canvas
+        sun = self.to_screen(np.zeros(2))
+        r = SUN_RADIUS * 0.6 * self.size_factor()
+        canvas.coords(self.sun, sun[0] - r, sun[1] - r, sun[0] + r, sun[1] + r)
+        canvas.coords(self.sun_label, sun[0], sun[1] - r - 10)
+        self._render_rings(sun)
+        self._render_majors()
+        self._render_belts()
+        self.stats["renders"] += 1
+
+    def _render_rings(self, sun):
+        # Orbit outlines only change with the camera, not with time.
+        key = (self.scale, self.cam[0], self.cam[1], self.width, self.height)
+        if key == self.ring_key:
+            return
+        self.ring_key = key
+        corners = np.array([[0, 0], [self.width, 0], [0, self.height], [self.width, self.height]]) - sun
+        far = np.hypot(corners[:, 0], corners[:, 1]).max()
+        near = 0 if 0 <= sun[0] <= self.width and 0 <= sun[1] <= self.height else \
+            np.hypot(np.clip(sun[0], 0, self.width) - sun[0], np.clip(sun[1], 0, self.height) - sun[1])
+        for row, item in enumerate(self.rings):
+            radius = self.system.orbit_world[row] * self.scale
+            # Off screen when the ring lies wholly outside the view or wholly around it.
+            shown = bool(radius * 1.5 >= near and radius * 0.5 <= far)
+            if shown:
+                canvas_coords = self.system.ephemeris.orbit_path(row, radius, sun, points=180)
+                self.canvas.coords(item, *canvas_coords)
+            if shown != self.ring_shown[row]:
+                self.canvas.itemconfig(item, state="normal" if shown else "hidden")
+                self.ring_shown[row] = shown
+
+    def _render_majors(self):
+        system = self.system
+        screen = self.to_screen(system.major_positions(self.years))
+        margin = 30
+        visible = ((screen[:, 0] > -margin) & (screen[:, 0] < self.width + margin)
+                   & (screen[:, 1] > -margin) & (screen[:, 1] < self.height + margin))
+        # Moons appear once their orbit is a few pixels wide, so they separate from the planet.
+        visible[system.orbiting:] &= system.moon_radius * self.scale >= 6
+        # Dwarf planet and moon labels only once zoomed in enough to leave room.
+        zoomed = self.scale / self.fit_scale
+        factor = self.size_factor()
+        labels = 0
+        occupied = set()
+        for i, body in enumerate(system.bodies):
+            oval, label, oval_shown, label_shown = self.major_items[i]
+            shown = bool(visible[i])
+            if shown:
+                x, y = screen[i]
+                size = body["size"] * factor
+                self.canvas.coords(oval, x - size, y - size, x + size, y + size)
+            want_label = shown and (body["kind"] == "planet" or (body["kind"] == "dwarf" and zoomed >= 2)
+                                    or (body["kind"] == "moon" and system.moon_radius[i - system.orbiting]
+                                        * self.scale >= 25))
+            if want_label:
+                # Coarse label culling: one label per 60x16 px screen cell.
+                cell = (int(x // 60), int((y - size - 8) // 16))
+                want_label = cell not in occupied
+                occupied.add(cell)
+            if want_label:
+                self.canvas.coords(label, x, y - size - 8)
+                labels += 1
+            if shown != oval_shown:
+                self.canvas.itemconfig(oval, state="normal" if shown else "hidden")
+                self.major_items[i][2] = shown
+            if want_label != label_shown:
+                self.canvas.itemconfig(label, state="normal" if want_label else "hidden")
+                self.major_items[i][3] = want_label
+        self.major_screen = screen
+        self.major_visible = visible
+        self.stats["majors"] = int(visible.sum())
+        self.stats["labels"] = labels
+
+    def belt_candidates(self):
+        # Indices of belt bodies that may be on screen: a radius slice from the
+        # sorted orbits, narrowed by angle (before any trig) when the Sun is off
+        # screen and the viewport only spans a wedge.
+        system = self.system
+        half = np.array([self.width / 2, self.height / 2]) / self.scale
+        lo, hi = self.cam - half, self.cam + half
+        nearest = np.clip(0.0, lo, hi)
+        corners = np.array([[lo[0], lo[1]], [hi[0], lo[1]], [lo[0], hi[1]], [hi[0], hi[1]]])
+        r_min, r_max = np.hypot(*nearest), np.hypot(corners[:, 0], corners[:, 1]).max()
+        start, stop = np.searchsorted(system.belt_world, [r_min, r_max], side="left")
+        index = np.arange(start, stop)
+        if r_min > 0 and len(index):
+            # World y is screen-down, so body angles are measured against -y.
+            angles = np.arctan2(-corners[:, 1], corners[:, 0])
+            middle = np.arctan2(-self.cam[1], self.cam[0])
+            spread = np.abs((angles - middle + np.pi) % (2 * np.pi) - np.pi).max()
+            offset = (system.belt_angles(self.years, index) - middle + np.pi) % (2 * np.pi) - np.pi
+            index = index[np.abs(offset) <= spread]
+        return index
+
+    def _render_belts(self):
+        simulated = self.belt_source.read() if self.belt_source is not None else None
+        if simulated is None:
+            candidates = self.belt_candidates()
+            # Past AGGREGATE_SAMPLE candidates the view is drawn as aggregates from an
+            # evenly strided sample, with counts scaled back up.
+            stride = max(1, -(-len(candidates) // AGGREGATE_SAMPLE))
+            candidates = candidates[::stride]
+            screen = self.to_screen(self.system.belt_positions(self.years, candidates))
+        else:
+            # Simulated orbits have no radius ordering to slice, so every body goes
+            # through the mask and the sample is taken from what is on screen.
+            screen = self.to_screen(simulated)
+        on_screen = np.flatnonzero((screen[:, 0] >= 0) & (screen[:, 0] < self.width)
+                                   & (screen[:, 1] >= 0) & (screen[:, 1] < self.height))
+        if simulated is None:
+            visible = candidates[on_screen]
+        else:
+            stride = max(1, -(-len(on_screen) // AGGREGATE_SAMPLE))
+            on_screen = visible = on_screen[::stride]
+        points = screen[on_screen]
+        self.belt_points, self.belt_visible, self.grid = points, visible, None
+        self.stats["visible_belt"] = len(points) * stride
+        if stride == 1 and len(points) <= DOT_LIMIT:
+            self.aggregated = False
+            colors = [color for _, _, _, color in BELTS]
+            s = 1.0 if self.scale / self.fit_scale < 8 else 2.0
+            self.dots.place([(x - s, y - s, x + s, y + s) for x, y in points.tolist()],
+                            [colors[k] for k in self.system.belt_kind[visible].tolist()])
+            self.aggregates.place([])
+            self.stats["dots"], self.stats["aggregates"] = len(points), 0
+            return
+        # Aggregate per screen cell. The screen is bounded, so cells index a dense
+        # array and counting is a bincount rather than a sort.
+        self.aggregated = True
+        rows = self.height // CELL_PX + 1
+        cells = (points[:, 0] // CELL_PX).astype(np.int64) * rows + (points[:, 1] // CELL_PX).astype(np.int64)
+        size = (self.width // CELL_PX + 1) * rows
+        counts = np.bincount(cells, minlength=size)
+        occupied = np.flatnonzero(counts)
+        counts = counts[occupied]
+        centroids = np.column_stack((np.bincount(cells, points[:, 0], size)[occupied],
+                                     np.bincount(cells, points[:, 1], size)[occupied])) / counts[:, None]
+        radius = np.minimum(CELL_PX / 2, 1.0 + np.sqrt(counts * stride) * 0.6)
+        shade = np.minimum(len(SHADES) - 1, np.log2(counts * stride).astype(int) // 2)
+        boxes = np.column_stack((centroids - radius[:, None], centroids + radius[:, None])).tolist()
+        self.aggregates.place(boxes, [SHADES[s] for s in shade.tolist()])
+        self.dots.place([])
+        self.stats["dots"], self.stats["aggregates"] = 0, len(boxes)
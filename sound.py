@@ -0,0 +1,162 @@
+import time
+
+import numpy as np
+
+SAMPLE_RATE = 22050
+
+
+def envelope(n, attack, release, rate):
+    # Linear attack and release ramps around a flat sustain, in samples.
+    env = np.ones(n)
+    a = min(n, int(attack * rate))
+    r = min(n - a, int(release * rate))
+    if a:
+        env[:a] = np.linspace(0.0, 1.0, a, endpoint=False)
+    if r:
+        env[n - r:] = np.linspace(1.0, 0.0, r)
+    return env
+
+
+def tone(freqs, duration, rate=SAMPLE_RATE, attack=0.005, release=0.05, harmonics=(1.0,)):
+    # Sum of sine partials; `freqs` may be a scalar or a per-sample sweep.
+    n = int(duration * rate)
+    freqs = np.broadcast_to(np.asarray(freqs, dtype=float), (n,))
+    phase = 2 * np.pi * np.cumsum(freqs) / rate
+    wave = sum(weight * np.sin(phase * (k + 1)) for k, weight in enumerate(harmonics))
+    return wave / sum(harmonics) * envelope(n, attack, release, rate)
+
+
+def noise(duration, rate=SAMPLE_RATE, cutoff=200.0, rng=None):
+    # White noise through a one-pole low-pass, done as an exponential moving
+    # average with a cumulative-sum trick so there is no per-sample Python loop.
+    rng = rng or np.random.default_rng(7)
+    n = int(duration * rate)
+    white = rng.uniform(-1.0, 1.0, n)
+    alpha = 1.0 - np.exp(-2 * np.pi * cutoff / rate)
+    kernel = alpha * (1 - alpha) ** np.arange(min(n, int(5 * rate / cutoff) + 1))
+    brown = np.convolve(white, kernel)[:n]
+    return brown / (np.abs(brown).max() or 1.0)
+
+
+def synth_beep(rate=SAMPLE_RATE):
+    return tone(880.0, 0.12, rate, harmonics=(1.0, 0.3))
+
+
+def synth_liftoff(rate=SAMPLE_RATE):
+    duration = 4.0
+    n = int(duration * rate)
+    t = np.arange(n) / rate
+    rumble = noise(duration, rate, cutoff=120.0) * (0.6 + 0.4 * np.sin(2 * np.pi * 7 * t) ** 2)
+    roar = noise(duration, rate, cutoff=900.0, rng=np.random.default_rng(11)) * 0.35
+    return (rumble + roar) * envelope(n, 0.4, 1.5, rate)
+
+
+def synth_staging(rate=SAMPLE_RATE):
+    thump = tone(np.linspace(140.0, 50.0, int(0.25 * rate)), 0.25, rate, release=0.2)
+    crack = noise(0.25, rate, cutoff=2500.0, rng=np.random.default_rng(3)) * envelope(int(0.25 * rate), 0.001, 0.2, rate)
+    return 0.8 * thump + 0.4 * crack
+
+
+def synth_chime(rate=SAMPLE_RATE):
+    n = int(0.9 * rate)
+    decay = np.exp(-np.arange(n) / rate * 4.0)
+    return (tone(660.0, 0.9, rate, harmonics=(1.0, 0.4, 0.2)) + 0.6 * tone(990.0, 0.9, rate)) * decay / 1.6
+
+
+def synth_fanfare(rate=SAMPLE_RATE):
+    notes = [523.25, 659.25, 783.99, 1046.5]
+    return np.concatenate([tone(f, 0.11 if i < 3 else 0.3, rate, harmonics=(1.0, 0.5, 0.25))
+                           for i, f in enumerate(notes)])
+
+
+def synth_ambience(rate=SAMPLE_RATE):
+    duration = 6.0
+    n = int(duration * rate)
+    t = np.arange(n) / rate
+    pad = sum(np.sin(2 * np.pi * f * t + np.sin(2 * np.pi * 0.1 * t * k)) for k, f in enumerate((55.0, 82.5, 110.0), 1))
+    return (pad / 3 * 0.5 + noise(duration, rate, cutoff=400.0) * 0.15) * envelope(n, 1.0, 1.0, rate)
+
+
+# name: (synthesiser, priority, volume). When every channel is busy a new sound
+# may only steal a channel playing something of equal or lower priority.
+SOUNDS = {
+    "beep": (synth_beep, 2, 0.5),
+    "launch": (synth_liftoff, 3, 0.9),
+    "staging": (synth_staging, 3, 0.8),
+    "planet": (synth_chime, 1, 0.6),
+    "quiz": (synth_fanfare, 2, 0.6),
+    "space": (synth_ambience, 0, 0.4),
+}
+
+
+def to_pcm(wave, channels):
+    # float [-1, 1] -> interleaved int16, duplicated across output channels.
+    pcm = (np.clip(wave, -1.0, 1.0) * 32767).astype(np.int16)
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1)
+    return np.ascontiguousarray(pcm)
+
+
+class SoundBank:
+    # Every clip is synthesised (or decoded from `files`) into a mixer Sound up
+    # front, and plays on a fixed pool of reserved channels. play() only picks a
+    # channel and starts it, so it never waits on I/O or builds audio data.
+    def __init__(self, mixer, channels=8, sounds=SOUNDS, files=None):
+        frequency, _, output_channels = mixer.get_init()
+        mixer.set_num_channels(channels)
+        mixer.set_reserved(channels)
+        self.mixer = mixer
+        self.channels = [mixer.Channel(i) for i in range(channels)]
+        self.priority = [-1] * channels
+        self.started = [0.0] * channels
+        self.sounds = {}
+        self.priorities = {}
+        for name, (synth, priority, volume) in sounds.items():
+            sound = mixer.Sound(buffer=to_pcm(synth(frequency), output_channels).tobytes())
+            sound.set_volume(volume)
+            self.sounds[name] = sound
+            self.priorities[name] = priority
+        for name, (path, priority) in (files or {}).items():
+            self.sounds[name] = mixer.Sound(path)
+            self.priorities[name] = priority
+        self.stats = {"played": 0, "stolen": 0, "dropped": 0}
+
+    def _pick_channel(self, priority):
+        # A free channel if there is one, else the oldest of the lowest-priority
+        # voices that `priority` is allowed to steal.
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i, False
+            if self.priority[i] <= priority and (
+                    victim is None or (self.priority[i], self.started[i]) < (self.priority[victim], self.started[victim])):
+                victim = i
+        return victim, True
+
+    def play(self, name, priority=None, loops=0):
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        if priority is None:
+            priority = self.priorities[name]
+        index, stealing = self._pick_channel(priority)
+        if index is None:
+            self.stats["dropped"] += 1
+            return None
+        channel = self.channels[index]
+        if stealing:
+            channel.stop()
+            self.stats["stolen"] += 1
+        channel.play(sound, loops=loops)
+        self.priority[index] = priority
+        self.started[index] = time.perf_counter()
+        self.stats["played"] += 1
+        return channel
+
+    def busy_count(self):
+        return sum(1 for channel in self.channels if channel.get_busy())
+
+    def stop(self, name=None):
+        for i, channel in enumerate(self.channels):
+            if name is None or channel.get_sound() is self.sounds.get(name):
+                channel.stop()
@@ -0,0 +1,125 @@
+# Declarative spacecraft artwork. Every part's points are offsets from the
+# craft's anchor (horizontal centre, launch-pad base); "tooltip" is the
+# (title, description) shown in the status bar when the part is hovered.
+
+SPACECRAFT_SHAPES = {
+    "shuttle": [
+        {"name": "body", "kind": "polygon",
+         "points": [(-50, 0), (50, 0), (70, -170), (-70, -170)],
+         "fill": "#D0D0D0", "outline": "white", "width": 2,
+         "tooltip": ("Orbiter", "Carries crew and cargo")},
+        {"name": "nose", "kind": "polygon",
+         "points": [(-70, -170), (70, -170), (0, -220)],
+         "fill": "white", "outline": "gray", "width": 2,
+         "tooltip": ("Cockpit", "Where astronauts control the shuttle")},
+        {"name": "wing1", "kind": "polygon",
+         "points": [(-70, 0), (-110, 40), (-70, 40)],
+         "fill": "#A0A0A0", "outline": "white", "width": 1,
+         "tooltip": ("Wing", "Provides lift during landing")},
+        {"name": "wing2", "kind": "polygon",
+         "points": [(50, 0), (90, 40), (50, 40)],
+         "fill": "#A0A0A0", "outline": "white", "width": 1},
+        {"name": "tail", "kind": "polygon",
+         "points": [(-30, -220), (30, -220), (40, -250), (-40, -250)],
+         "fill": "gray", "outline": "white", "width": 1,
+         "tooltip": ("Vertical Stabilizer", "Keeps shuttle stable during flight")},
+        {"name": "engine1", "kind": "oval",
+         "points": [(-30, 0), (-10, 20)],
+         "fill": "#FF8800", "outline": "red",
+         "tooltip": ("Main Engine", "Burns liquid hydrogen and oxygen")},
+        {"name": "engine2", "kind": "oval",
+         "points": [(10, 0), (30, 20)],
+         "fill": "#FF8800", "outline": "red",
+         "tooltip": ("Main Engine", "Each produces 400,000 lbs of thrust")},
+    ],
+    "artemis": [
+        {"name": "core", "kind": "rectangle",
+         "points": [(-10, -200), (10, 0)],
+         "fill": "white", "outline": "orange", "width": 3,
+         "tooltip": ("Core Stage", "Holds liquid hydrogen and oxygen fuel")},
+        {"name": "booster1", "kind": "rectangle",
+         "points": [(-40, -190), (-20, -10)],
+         "fill": "silver", "outline": "gray", "width": 2,
+         "tooltip": ("Solid Rocket Booster", "Provides extra thrust at liftoff")},
+        {"name": "booster2", "kind": "rectangle",
+         "points": [(20, -190), (40, -10)],
+         "fill": "silver", "outline": "gray", "width": 2},
+        {"name": "capsule", "kind": "polygon",
+         "points": [(-40, -200), (40, -200), (0, -240)],
+         "fill": "#99CCFF", "outline": "gray", "width": 2,
+         "tooltip": ("Orion Capsule", "Carries astronauts to the Moon")},
+        {"name": "engine", "kind": "oval",
+         "points": [(-10, 0), (10, 20)],
+         "fill": "#FF5500",
+         "tooltip": ("RS-25 Engine", "Reused from Space Shuttle program")},
+    ],
+    "saturn": [
+        {"name": "stage1", "kind": "rectangle",
+         "points": [(-20, 0), (20, -100)],
+         "fill": "white", "outline": "black", "width": 2,
+         "tooltip": ("First Stage", "5 F-1 engines burning kerosene")},
+        {"name": "stage2", "kind": "rectangle",
+         "points": [(-15, -100), (15, -160)],
+         "fill": "white", "outline": "black", "width": 2,
+         "tooltip": ("Second Stage", "5 J-2 engines burning liquid hydrogen")},
+        {"name": "stage3", "kind": "rectangle",
+         "points": [(-10, -160), (10, -200)],
+         "fill": "white", "outline": "black", "width": 2,
+         "tooltip": ("Third Stage", "Single J-2 engine for trans-lunar injection")},
+        {"name": "module", "kind": "polygon",
+         "points": [(-10, -200), (10, -200), (0, -230)],
+         "fill": "silver", "outline": "gray", "width": 1,
+         "tooltip": ("Command Module", "Housed astronauts during lunar missions")},
+        {"name": "engine1", "kind": "oval",
+         "points": [(-15, 0), (-5, 10)],
+         "fill": "orange"},
+        {"name": "engine2", "kind": "oval",
+         "points": [(5, 0), (15, 10)],
+         "fill": "orange"},
+    ],
+    "falcon": [
+        {"name": "core", "kind": "rectangle",
+         "points": [(-10, 0), (10, -170)],
+         "fill": "white", "outline": "black", "width": 2,
+         "tooltip": ("Core Stage", "Powered by Merlin engines, lands vertically")},
+        {"name": "booster1", "kind": "rectangle",
+         "points": [(-50, 0), (-30, -140)],
+         "fill": "white", "outline": "black", "width": 2,
+         "tooltip": ("Booster", "Reusable side booster, returns to launch site")},
+        {"name": "booster2", "kind": "rectangle",
+         "points": [(30, 0), (50, -140)],
+         "fill": "white", "outline": "black", "width": 2},
+        {"name": "fairing", "kind": "polygon",
+         "points": [(-10, -170), (10, -170), (0, -220)],
+         "fill": "lightgray", "outline": "black", "width": 1,
+         "tooltip": ("Payload Fairing", "Protects satellites during launch")},
+        {"name": "fin1", "kind": "polygon",
+         "points": [(-50, -140), (-60, -130), (-50, -130)],
+         "fill": "gray",
+         "tooltip": ("Grid Fin", "Steers booster during descent")},
+        {"name": "fin2", "kind": "polygon",
+         "points": [(50, -140), (60, -130), (50, -130)],
+         "fill": "gray"},
+    ],
+    "voyager": [
+        {"name": "bus", "kind": "rectangle",
+         "points": [(-10, -50), (10, -20)],
+         "fill": "gold", "outline": "gray",
+         "tooltip": ("Spacecraft Bus", "Holds scientific instruments and computers")},
+        {"name": "dish", "kind": "oval",
+         "points": [(-15, -70), (15, -40)],
+         "fill": "silver", "outline": "gray",
+         "tooltip": ("High-Gain Antenna", "Communicates with Earth across billions of miles")},
+        {"name": "boom", "kind": "rectangle",
+         "points": [(-1, -20), (1, 20)],
+         "fill": "gray",
+         "tooltip": ("Magnetometer Boom", "Measures magnetic fields in space")},
+        {"name": "inst1", "kind": "rectangle",
+         "points": [(-20, -30), (-10, -25)],
+         "fill": "darkgray",
+         "tooltip": ("Cosmic Ray Detector", "Studies high-energy particles from space")},
+        {"name": "inst2", "kind": "rectangle",
+         "points": [(10, -30), (20, -25)],
+         "fill": "darkgray"},
+    ],
+}
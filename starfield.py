@@ -0,0 +1,102 @@
+import random
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageTk
+
+STAR_COLORS = [(255, 255, 255), (255, 255, 204), (204, 255, 255)]
+
+# (share of the stars, min size, max size, brightness, parallax factor)
+LAYERS = [
+    (0.55, 0.6, 1.2, 0.55, 0.15),
+    (0.30, 0.8, 1.8, 0.80, 0.40),
+    (0.15, 1.2, 2.6, 1.00, 1.00),
+]
+
+
+def render_layer(width, height, count, min_size, max_size, brightness, seed):
+    image = Image.new("RGBA", (max(1, width), max(1, height)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    rng = random.Random(seed)
+    for _ in range(count):
+        x = rng.uniform(0, width)
+        y = rng.uniform(0, height)
+        size = rng.uniform(min_size, max_size)
+        r, g, b = rng.choice(STAR_COLORS)
+        alpha = int(255 * brightness * rng.uniform(0.6, 1.0))
+        draw.ellipse((x, y, x + size, y + size), fill=(r, g, b, alpha))
+    return image
+
+
+class StarfieldCache:
+    # Rendered layers keyed by (width, height, density, layer), least recently
+    # used first so the oldest sizes fall out once `max_entries` is reached.
+    def __init__(self, max_entries=12):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, width, height, density, layer):
+        key = (width, height, density, layer)
+        photo = self.entries.get(key)
+        if photo is not None:
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return photo
+        self.stats["misses"] += 1
+        share, min_size, max_size, brightness, _ = LAYERS[layer]
+        image = render_layer(width, height, int(density * share), min_size, max_size, brightness,
+                             seed=hash(key))
+        photo = ImageTk.PhotoImage(image)
+        self.entries[key] = photo
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return photo
+
+
+class Starfield:
+    # A few pre-rendered star layers shown as image items. Each layer has two
+    # stacked tiles so scrolling only moves existing items and wraps around.
+    def __init__(self, canvas, density=200, cache=None, tag="stars"):
+        self.canvas = canvas
+        self.density = density
+        self.cache = cache or StarfieldCache()
+        self.tag = tag
+        self.size = (0, 0)
+        self.tiles = []
+        self.photos = []
+        self.offsets = [0.0] * len(LAYERS)
+
+    def _items_alive(self):
+        return bool(self.tiles) and len(self.canvas.find_withtag(self.tag)) == 2 * len(LAYERS)
+
+    def show(self, width, height):
+        if (width, height) == self.size and self._items_alive():
+            return
+        if not self._items_alive():
+            self.canvas.delete(self.tag)
+            self.tiles = [(self.canvas.create_image(0, 0, anchor="nw", tags=self.tag),
+                           self.canvas.create_image(0, 0, anchor="nw", tags=self.tag))
+                          for _ in LAYERS]
+        self.size = (width, height)
+        self.photos = [self.cache.get(width, height, self.density, layer) for layer in range(len(LAYERS))]
+        self.offsets = [0.0] * len(LAYERS)
+        for (top, bottom), photo in zip(self.tiles, self.photos):
+            self.canvas.itemconfig(top, image=photo)
+            self.canvas.itemconfig(bottom, image=photo)
+        self._place()
+        self.canvas.tag_lower(self.tag)
+
+    def scroll(self, dy):
+        height = self.size[1]
+        if height <= 1 or not self.tiles:
+            return
+        for layer, (_, _, _, _, factor) in enumerate(LAYERS):
+            self.offsets[layer] = (self.offsets[layer] + dy * factor) % height
+        self._place()
+
+    def _place(self):
+        height = self.size[1]
+        for (top, bottom), offset in zip(self.tiles, self.offsets):
+            self.canvas.coords(top, 0, offset)
+            self.canvas.coords(bottom, 0, offset - height)
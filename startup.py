@@ -0,0 +1,71 @@
+import json
+import platform
+import sys
+import time
+
+# Imported first thing in main.py, so this is as close to process start as
+# Python code gets.
+STARTED = time.perf_counter()
+
+
+class StartupProfiler:
+    # Named checkpoints from process start to first paint. Each phase is the
+    # time since the previous mark; phases marked `exclude` (waiting for the
+    # user to log in) are shown but left out of the total.
+    def __init__(self, started=STARTED):
+        self.started = started
+        self.marks = []
+        self.excluded = set()
+        self.echo = False
+        self.log_path = None
+        self.finished = False
+
+    def mark(self, phase, exclude=False):
+        self.marks.append((phase, time.perf_counter()))
+        if exclude:
+            self.excluded.add(phase)
+
+    def phases(self):
+        result = []
+        last = self.started
+        for phase, at in self.marks:
+            result.append((phase, (at - last) * 1000))
+            last = at
+        return result
+
+    def total_ms(self):
+        return sum(ms for phase, ms in self.phases() if phase not in self.excluded)
+
+    def report(self):
+        lines = ["Startup timing:"]
+        for phase, ms in self.phases():
+            note = "  (not counted)" if phase in self.excluded else ""
+            lines.append(f"  {phase:<16} {ms:>8.1f} ms{note}")
+        lines.append(f"  {'total':<16} {self.total_ms():>8.1f} ms")
+        return "\n".join(lines)
+
+    def record(self):
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "python": platform.python_version(),
+            "phases": {phase: round(ms, 2) for phase, ms in self.phases()},
+            "excluded": sorted(self.excluded),
+            "total_ms": round(self.total_ms(), 2),
+        }
+
+    def finish(self):
+        # Called once the main window has painted; prints and/or appends one
+        # JSON line per run so cold starts can be compared release over release.
+        if self.finished:
+            return
+        self.finished = True
+        if self.echo:
+            print(self.report(), file=sys.stderr)
+        if self.log_path:
+            with open(self.log_path, "a") as f:
+                f.write(json.dumps(self.record()) + "\n")
+
+
+PROFILER = StartupProfiler()
+mark = PROFILER.mark
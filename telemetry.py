@@ -0,0 +1,238 @@
+import argparse
+import atexit
+import glob
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timedelta
+
+import database
+
+# Session telemetry: what kids look at and launch. emit() is a single
+# deque.append of a tuple on the Tk thread (deque appends are atomic, so no
+# lock); a daemon thread drains the ring buffer every `interval` seconds and
+# hands whole batches to the sinks. When the buffer is full the oldest events
+# are overwritten and counted as dropped.
+#
+# Reports for one day, from the database or from a directory of JSONL logs:
+#
+#     python telemetry.py --day 2026-10-18 [--db nasa_explorer.db | --dir logs] [--top 10] [--export day.jsonl]
+
+# Compact JSON; strings take the encoder's C fast path.
+encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class SQLiteSink:
+    def __init__(self, pool=None):
+        self.pool = pool
+
+    def write(self, session, user_id, events):
+        rows = [(ts, session, user_id, kind, subject, None if detail is None else json.dumps(detail))
+                for ts, kind, subject, detail in events]
+        database.record_events(rows, pool=self.pool)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    # One compact JSON object per line in events-YYYY-MM-DD.N.jsonl; a new part
+    # starts at midnight (local time) or once a part reaches `max_bytes`.
+    def __init__(self, directory, max_bytes=16 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._file = None
+        self._day = None
+        self._day_start = self._day_end = 0.0
+        self._part = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, day, part):
+        return os.path.join(self.directory, f"events-{day}.{part}.jsonl")
+
+    def _open(self, day):
+        if self._file is not None:
+            self._file.close()
+        if day != self._day:
+            self._day = day
+            self._part = 0
+            while os.path.exists(self._path(day, self._part + 1)):
+                self._part += 1
+        path = self._path(day, self._part)
+        if os.path.exists(path) and os.path.getsize(path) >= self.max_bytes:
+            self._part += 1
+            path = self._path(day, self._part)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, session, user_id, events):
+        # Formatted by hand: a dict plus json.dumps per event costs several times more.
+        prefix = f'"s":{encode(session)},"u":{encode(user_id)},'
+        lines = []
+        for ts, kind, subject, detail in events:
+            if self._file is None or not self._day_start <= ts < self._day_end:
+                self._flush_lines(lines)
+                lines = []
+                start = datetime.fromtimestamp(ts).replace(hour=0, minute=0, second=0, microsecond=0)
+                self._day_start = start.timestamp()
+                self._day_end = (start + timedelta(days=1)).timestamp()
+                self._open(start.strftime("%Y-%m-%d"))
+            line = f'{{"t":{ts:.3f},{prefix}"k":{encode(kind)},"x":{encode(subject)}'
+            lines.append(line + ("}" if detail is None else f',"d":{encode(detail)}}}'))
+        self._flush_lines(lines)
+        if self._file is not None and self._file.tell() >= self.max_bytes:
+            self._part += 1
+            self._open(self._day)
+
+    def _flush_lines(self, lines):
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class EventBus:
+    def __init__(self, sinks, user_id=None, capacity=65536, interval=2.0):
+        self.sinks = sinks
+        self.user_id = user_id
+        self.session = uuid.uuid4().hex[:12]
+        self.interval = interval
+        self._buffer = deque(maxlen=capacity)
+        self._emitted = 0
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self.stats = {"flushed": 0, "flushes": 0, "failed_flushes": 0, "last_flush_ms": 0.0}
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, kind, subject=None, detail=None):
+        self._emitted += 1
+        self._buffer.append((time.time(), kind, subject, detail))
+
+    @property
+    def dropped(self):
+        return max(0, self._emitted - self.stats["flushed"] - len(self._buffer))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            batch = []
+            popleft = self._buffer.popleft
+            try:
+                while True:
+                    batch.append(popleft())
+            except IndexError:
+                pass
+            if not batch:
+                return
+            started = time.perf_counter()
+            for sink in self.sinks:
+                try:
+                    sink.write(self.session, self.user_id, batch)
+                except (OSError, database.sqlite3.Error) as e:
+                    self.stats["failed_flushes"] += 1
+                    print(f"Telemetry flush to {type(sink).__name__} failed: {e}", file=sys.stderr)
+            self.stats["flushed"] += len(batch)
+            self.stats["flushes"] += 1
+            self.stats["last_flush_ms"] = (time.perf_counter() - started) * 1000
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 1)
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+        atexit.unregister(self.close)
+
+
+def read_day(day, directory=None, pool=None):
+    # Yields (ts, session, user_id, kind, subject, detail) for one local day.
+    if directory is not None:
+        for path in sorted(glob.glob(os.path.join(directory, f"events-{day}.*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        r = json.loads(line)
+                        yield r["t"], r["s"], r["u"], r["k"], r["x"], r.get("d")
+        return
+    start = datetime.strptime(day, "%Y-%m-%d")
+    for ts, session, user_id, kind, subject, detail in database.load_events(
+            start.timestamp(), (start + timedelta(days=1)).timestamp(), pool=pool):
+        yield ts, session, user_id, kind, subject, None if detail is None else json.loads(detail)
+
+
+def summarize(events, top=10):
+    kinds = Counter()
+    subjects = defaultdict(Counter)
+    hours = Counter()
+    sessions = set()
+    users = set()
+    for ts, session, user_id, kind, subject, _ in events:
+        kinds[kind] += 1
+        if subject is not None:
+            subjects[kind][subject] += 1
+        hours[time.localtime(ts).tm_hour] += 1
+        sessions.add(session)
+        users.add(user_id)
+    return {
+        "events": sum(kinds.values()),
+        "sessions": len(sessions),
+        "users": len(users - {None}),
+        "kinds": dict(kinds.most_common()),
+        "top_subjects": {kind: counter.most_common(top) for kind, counter in subjects.items()},
+        "by_hour": dict(sorted(hours.items())),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise or export one day of session telemetry.")
+    parser.add_argument("--day", default=time.strftime("%Y-%m-%d"), help="local date, YYYY-MM-DD (default today)")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--dir", help="read JSONL logs from this directory instead of the database")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--export", metavar="PATH", help="also write the day's events to PATH as JSON lines")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    database.DB_PATH = args.db
+    try:
+        events = list(read_day(args.day, directory=args.dir))
+    except database.sqlite3.OperationalError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    database.close_pool()
+    if args.export:
+        with open(args.export, "w", encoding="utf-8") as f:
+            for ts, session, user_id, kind, subject, detail in events:
+                record = {"t": ts, "s": session, "u": user_id, "k": kind, "x": subject}
+                if detail is not None:
+                    record["d"] = detail
+                f.write(encode(record) + "\n")
+
+    summary = summarize(events, args.top)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{args.day}: {summary['events']} events, {summary['sessions']} sessions, {summary['users']} users")
+    for kind, count in summary["kinds"].items():
+        print(f"\n{kind} ({count})")
+        for subject, hits in summary["top_subjects"].get(kind, []):
+            print(f"  {hits:>7}  {subject}")
+    print("\nby hour: " + "  ".join(f"{hour:02d}h {count}" for hour, count in summary["by_hour"].items()))
+
+
+if __name__ == "__main__":
+    main()
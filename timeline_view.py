@@ -0,0 +1,337 @@
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+
+MIN_DAYS_PER_PX = 0.01  # about a week across the canvas
+MAX_DAYS_PER_PX = 100.0  # a couple of centuries
+LAST_DAY = date.max.toordinal()  # the view stays within years 1-9999, which date can represent
+ZOOM_STEP = 1.25  # per mouse wheel notch
+ZOOM_EASE = 0.35  # fraction of the remaining zoom covered each frame
+MARKER_LIMIT = 400  # beyond this many missions in view, draw a density histogram
+BIN_PX = 6
+LABEL_ROWS = 4
+TICK_PX = 90  # minimum spacing between axis ticks
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+# (unit, step) from finest to coarsest, with a typical length in days.
+TICK_STEPS = [("day", 1, 1), ("day", 7, 7), ("month", 1, 30.4), ("month", 3, 91.3), ("month", 6, 182.6),
+              ("year", 1, 365.25), ("year", 2, 730.5), ("year", 5, 1826), ("year", 10, 3652),
+              ("year", 20, 7305), ("year", 50, 18262), ("year", 100, 36525)]
+
+
+class IntervalIndex:
+    # Static index of (start, end, value) intervals in days. Intervals are grouped
+    # by length class: class k holds those shorter than 2**k days, sorted by start.
+    # Anything in class k that overlaps [lo, hi] must start in [lo - 2**k, hi], so a
+    # query is one bisect range per class plus an end check on the few candidates.
+    def __init__(self, intervals):
+        grouped = defaultdict(list)
+        for start, end, value in intervals:
+            grouped[int(end - start).bit_length()].append((start, end, value))
+        self.classes = []
+        for k in sorted(grouped):
+            rows = sorted(grouped[k], key=lambda row: row[0])
+            self.classes.append((2 ** k, [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]))
+        self.size = sum(len(starts) for _, starts, _, _ in self.classes)
+
+    def __len__(self):
+        return self.size
+
+    def query(self, lo, hi):
+        found = []
+        for span, starts, ends, values in self.classes:
+            for i in range(bisect_left(starts, lo - span), bisect_right(starts, hi)):
+                if ends[i] >= lo:
+                    found.append((starts[i], ends[i], values[i]))
+        found.sort(key=lambda row: row[0])
+        return found
+
+    def count(self, lo, hi):
+        # Upper bound on query(lo, hi) without touching the intervals themselves.
+        return sum(bisect_right(starts, hi) - bisect_left(starts, lo - span) for span, starts, _, _ in self.classes)
+
+    def count_starts(self, lo, hi):
+        return sum(bisect_left(starts, hi) - bisect_left(starts, lo) for _, starts, _, _ in self.classes)
+
+
+def mission_interval(mission, today=None):
+    start = date.fromisoformat(mission["date"]).toordinal()
+    if mission.get("end"):
+        end = date.fromisoformat(mission["end"]).toordinal()
+    elif mission.get("ongoing"):
+        end = (today or date.today()).toordinal()
+    else:
+        end = start
+    return start, end, mission
+
+
+def tick_days(unit, step, lo, hi):
+    # Ordinal days of every tick boundary between lo and hi.
+    first = date.fromordinal(min(LAST_DAY, max(1, int(lo))))
+    if unit == "day":
+        day = int(lo) // step * step
+        while day <= min(hi, LAST_DAY):
+            yield day, date.fromordinal(max(1, day))
+            day += step
+        return
+    if unit == "month":
+        index = (first.year * 12 + first.month - 1) // step * step
+        while index // 12 <= 9999:
+            d = date(index // 12, index % 12 + 1, 1)
+            if d.toordinal() > hi:
+                return
+            yield d.toordinal(), d
+            index += step
+        return
+    year = max(1, first.year // step * step)
+    while year <= 9999:
+        d = date(year, 1, 1)
+        if d.toordinal() > hi:
+            return
+        yield d.toordinal(), d
+        year += step
+
+
+def tick_label(unit, d):
+    if unit == "year":
+        return str(d.year)
+    if unit == "month":
+        return f"{MONTHS[d.month - 1]} {d.year}"
+    return f"{d.day} {MONTHS[d.month - 1]} {d.year}"
+
+
+class TimelineView:
+    # A pannable, zoomable mission timeline. Only missions overlapping the visible
+    # date range are looked up (through IntervalIndex) and drawn, on a pool of
+    # recycled canvas items: a view of 20 missions costs the same in a catalog of
+    # 7 or 100,000. Labels are placed greedily in a few rows and dropped when they
+    # would overlap (level of detail), and a crowded view collapses into a density
+    # histogram. Redraws are coalesced into at most one per scheduler frame.
+    def __init__(self, canvas, missions, scheduler, on_select=None, marker_limit=MARKER_LIMIT):
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.on_select = on_select
+        self.marker_limit = marker_limit
+        intervals = [mission_interval(m) for m in missions]
+        self.index = IntervalIndex(intervals)
+        self.first = min((s for s, _, _ in intervals), default=date.today().toordinal())
+        self.last = max((e for _, e, _ in intervals), default=self.first)
+        self.days_per_px = self.target_days_per_px = None
+        self.start = 0.0
+        self.anchor_x = 0
+        self.drag_x = None
+        self.press_x = None
+        # Recycled item slots, each with the state last sent to the canvas.
+        self.markers = []  # [bar, label, mission, label text, bar shown, label shown]
+        self.ticks = []  # [line, text, label text, line shown, text shown]
+        self.bins = []  # [rect, shown]
+        self.registered = False
+        self.dirty = False
+        self.stats = {"renders": 0, "drawn": 0, "labels": 0, "items_created": 0, "histogram": False}
+        self.axis = canvas.create_line(0, 0, 0, 0, fill="white", width=2)
+        self.stats["items_created"] += 1
+
+        canvas.bind("<Configure>", lambda e: self.request())
+        canvas.bind("<ButtonPress-1>", self.on_press)
+        canvas.bind("<B1-Motion>", self.on_drag)
+        canvas.bind("<ButtonRelease-1>", self.on_release)
+        canvas.bind("<MouseWheel>", lambda e: self.zoom(e.x, 1 / ZOOM_STEP if e.delta > 0 else ZOOM_STEP))
+        canvas.bind("<Button-4>", lambda e: self.zoom(e.x, 1 / ZOOM_STEP))
+        canvas.bind("<Button-5>", lambda e: self.zoom(e.x, ZOOM_STEP))
+        self.request()
+
+    def size(self):
+        return max(self.canvas.winfo_width(), 200), max(self.canvas.winfo_height(), 120)
+
+    def fit(self):
+        width, _ = self.size()
+        span = max(self.last - self.first, 365)
+        self.days_per_px = self.target_days_per_px = min(MAX_DAYS_PER_PX, max(MIN_DAYS_PER_PX, span / (width - 120)))
+        self.start = self.first - 60 * self.days_per_px
+
+    def clamp(self):
+        width, _ = self.size()
+        self.start = max(1.0, min(self.start, LAST_DAY - width * self.days_per_px))
+
+    def visible_range(self):
+        width, _ = self.size()
+        return self.start, self.start + width * self.days_per_px
+
+    def request(self):
+        self.dirty = True
+        if not self.registered:
+            self.registered = True
+            self.scheduler.add_frame_callback(self.frame)
+
+    def close(self):
+        self.scheduler.remove_frame_callback(self.frame)
+        self.registered = False
+
+    def on_press(self, event):
+        self.drag_x = self.press_x = event.x
+
+    def on_drag(self, event):
+        if self.drag_x is None or self.days_per_px is None:
+            return
+        self.start -= (event.x - self.drag_x) * self.days_per_px
+        self.clamp()
+        self.drag_x = event.x
+        self.request()
+
+    def on_release(self, event):
+        self.drag_x = None
+
+    def zoom(self, x, factor):
+        if self.days_per_px is None:
+            return
+        self.anchor_x = x
+        self.target_days_per_px = min(MAX_DAYS_PER_PX, max(MIN_DAYS_PER_PX, self.target_days_per_px * factor))
+        self.request()
+
+    def pan(self, pixels):
+        if self.days_per_px is not None:
+            self.start += pixels * self.days_per_px
+            self.clamp()
+            self.request()
+
+    def frame(self):
+        if self.days_per_px is None:
+            self.fit()
+        zooming = self.target_days_per_px != self.days_per_px
+        if zooming:
+            # Ease in log space, keeping the date under the cursor fixed.
+            day = self.start + self.anchor_x * self.days_per_px
+            ratio = math.log(self.target_days_per_px / self.days_per_px)
+            if abs(ratio) < 0.01:
+                self.days_per_px = self.target_days_per_px
+            else:
+                self.days_per_px *= math.exp(ratio * ZOOM_EASE)
+            self.start = day - self.anchor_x * self.days_per_px
+            self.clamp()
+            self.dirty = True
+        if self.dirty:
+            self.render()
+        if not zooming:
+            self.close()
+
+    def render(self):
+        self.dirty = False
+        width, height = self.size()
+        axis_y = height * 2 // 3
+        lo, hi = self.visible_range()
+        self.canvas.coords(self.axis, 0, axis_y, width, axis_y)
+        self._draw_ticks(lo, hi, axis_y)
+        if self.index.count(lo, hi) > self.marker_limit:
+            self.stats["histogram"] = True
+            drawn = self._draw_bins(lo, width, axis_y)
+            self._hide_markers(0)
+        else:
+            self.stats["histogram"] = False
+            drawn = self._draw_markers(self.index.query(lo, hi), lo, width, axis_y)
+            self._hide_bins(0)
+        self.stats["renders"] += 1
+        self.stats["drawn"] = drawn
+
+    def _state(self, slot, item, flag, shown):
+        # Recycled items keep their last state; only changes reach the canvas.
+        if slot[flag] != shown:
+            self.canvas.itemconfig(slot[item], state="normal" if shown else "hidden")
+            slot[flag] = shown
+
+    def _draw_ticks(self, lo, hi, axis_y):
+        unit, step, _ = next((s for s in TICK_STEPS if s[2] / self.days_per_px >= TICK_PX), TICK_STEPS[-1])
+        count = 0
+        for day, d in tick_days(unit, step, lo, hi):
+            x = (day - lo) / self.days_per_px
+            if count == len(self.ticks):
+                line = self.canvas.create_line(0, 0, 0, 0, fill="#555577")
+                text = self.canvas.create_text(0, 0, fill="gray", font=("Arial", 9), anchor="n")
+                self.ticks.append([line, text, None, True, True])
+                self.stats["items_created"] += 2
+            slot = self.ticks[count]
+            self.canvas.coords(slot[0], x, axis_y - 4, x, axis_y + 8)
+            self.canvas.coords(slot[1], x, axis_y + 10)
+            label = tick_label(unit, d)
+            if slot[2] != label:
+                self.canvas.itemconfig(slot[1], text=label)
+                slot[2] = label
+            self._state(slot, 0, 3, True)
+            self._state(slot, 1, 4, True)
+            count += 1
+        for slot in self.ticks[count:]:
+            self._state(slot, 0, 3, False)
+            self._state(slot, 1, 4, False)
+
+    def _draw_markers(self, found, lo, width, axis_y):
+        row_end = [-math.inf] * LABEL_ROWS
+        labels = 0
+        for i, (start, end, mission) in enumerate(found):
+            x0 = max(-10, (start - lo) / self.days_per_px)
+            x1 = min(width + 10, max(x0 + 8, (end - lo) / self.days_per_px))
+            if i == len(self.markers):
+                self._add_marker(i)
+            slot = self.markers[i]
+            slot[2] = mission
+            self.canvas.coords(slot[0], x0, axis_y - 6, x1, axis_y + 6)
+            self._state(slot, 0, 4, True)
+            # Greedy label placement: the first row with room, else no label.
+            text = mission["title"]
+            half = len(text) * 3.5 + 6
+            cx = max(x0 + 4, half)
+            row = next((r for r in range(LABEL_ROWS) if row_end[r] < cx - half), None)
+            if row is None:
+                self._state(slot, 1, 5, False)
+                continue
+            row_end[row] = cx + half
+            self.canvas.coords(slot[1], cx, axis_y - 20 - row * 22)
+            if slot[3] != text:
+                self.canvas.itemconfig(slot[1], text=text)
+                slot[3] = text
+            self._state(slot, 1, 5, True)
+            labels += 1
+        self._hide_markers(len(found))
+        self.stats["labels"] = labels
+        return len(found)
+
+    def _hide_markers(self, first):
+        for slot in self.markers[first:]:
+            slot[2] = None
+            self._state(slot, 0, 4, False)
+            self._state(slot, 1, 5, False)
+
+    def _add_marker(self, i):
+        bar = self.canvas.create_rectangle(0, 0, 0, 0, fill="#444466", outline="#9999CC")
+        label = self.canvas.create_text(0, 0, fill="white", font=("Arial", 10), state="hidden")
+        for item in (bar, label):
+            self.canvas.tag_bind(item, "<ButtonRelease-1>", lambda e, i=i: self.select(i, e))
+        self.markers.append([bar, label, None, None, True, False])
+        self.stats["items_created"] += 2
+
+    def select(self, i, event):
+        # A release after dragging the view is a pan, not a click on the mission.
+        if self.press_x is not None and abs(event.x - self.press_x) > 4:
+            return
+        mission = self.markers[i][2]
+        if mission is not None and self.on_select:
+            self.on_select(mission)
+
+    def _draw_bins(self, lo, width, axis_y):
+        counts = []
+        for x in range(0, width, BIN_PX):
+            counts.append(self.index.count_starts(lo + x * self.days_per_px, lo + (x + BIN_PX) * self.days_per_px))
+        peak = max(counts) or 1
+        for i, count in enumerate(counts):
+            if i == len(self.bins):
+                self.bins.append([self.canvas.create_rectangle(0, 0, 0, 0, fill="#6666AA", outline=""), True])
+                self.stats["items_created"] += 1
+            slot = self.bins[i]
+            height = 0 if count == 0 else 2 + count / peak * (axis_y - 40)
+            self.canvas.coords(slot[0], i * BIN_PX, axis_y - height, (i + 1) * BIN_PX - 1, axis_y)
+            self._state(slot, 0, 1, True)
+        self._hide_bins(len(counts))
+        return sum(counts)
+
+    def _hide_bins(self, first):
+        for slot in self.bins[first:]:
+            self._state(slot, 0, 1, False)
@@ -0,0 +1,182 @@
+import numpy as np
+
+G0 = 9.80665
+MU_EARTH = 3.986004418e14
+R_EARTH = 6.371e6
+RHO_SEA_LEVEL = 1.225
+SCALE_HEIGHT = 8500.0
+
+# Approximate stack data keyed by spacecraft id: per stage propellant and dry
+# mass (kg), thrust (N) and specific impulse (s); payload is whatever rides on
+# top of the last stage. Voyager flew on a Titan IIIE-Centaur.
+VEHICLES = {
+    "shuttle": {
+        "stages": [
+            {"propellant": 1100000, "dry": 180000, "thrust": 30.2e6, "isp": 265},
+            {"propellant": 630000, "dry": 26500, "thrust": 5.4e6, "isp": 452},
+        ],
+        "payload": 100000, "drag_area": 60.0, "drag_coefficient": 0.5,
+    },
+    "artemis": {
+        "stages": [
+            {"propellant": 1522000, "dry": 200000, "thrust": 39.1e6, "isp": 280},
+            {"propellant": 727000, "dry": 85000, "thrust": 7.4e6, "isp": 452},
+            {"propellant": 27000, "dry": 3500, "thrust": 110e3, "isp": 462},
+        ],
+        "payload": 27000, "drag_area": 80.0, "drag_coefficient": 0.5,
+    },
+    "saturn": {
+        "stages": [
+            {"propellant": 2077000, "dry": 131000, "thrust": 35.1e6, "isp": 263},
+            {"propellant": 444000, "dry": 36000, "thrust": 5.1e6, "isp": 421},
+            {"propellant": 109000, "dry": 10000, "thrust": 1.0e6, "isp": 421},
+        ],
+        "payload": 45000, "drag_area": 80.0, "drag_coefficient": 0.5,
+    },
+    "falcon": {
+        "stages": [
+            {"propellant": 1233000, "dry": 66600, "thrust": 22.8e6, "isp": 283},
+            {"propellant": 107500, "dry": 4000, "thrust": 981e3, "isp": 348},
+        ],
+        "payload": 16000, "drag_area": 32.0, "drag_coefficient": 0.45,
+    },
+    "voyager": {
+        "stages": [
+            {"propellant": 392000, "dry": 66000, "thrust": 10.7e6, "isp": 265},
+            {"propellant": 117000, "dry": 7000, "thrust": 2.3e6, "isp": 302},
+            {"propellant": 24000, "dry": 3000, "thrust": 0.45e6, "isp": 316},
+            {"propellant": 13600, "dry": 2600, "thrust": 133e3, "isp": 444},
+        ],
+        "payload": 3800, "drag_area": 10.0, "drag_coefficient": 0.5,
+    },
+}
+
+MAX_CLIMB_RATE = 1200.0
+CLIMB_TIME_CONSTANT = 90.0
+STEERING_TIME_CONSTANT = 20.0
+
+# Deeper missions carry extra injection hardware and aim for a lower parking orbit.
+MISSION_PROFILES = {
+    "Earth Orbit": {"extra_payload": 0, "parking_altitude": 400e3},
+    "Moon Mission": {"extra_payload": 4000, "parking_altitude": 185e3},
+    "Mars Expedition": {"extra_payload": 6000, "parking_altitude": 200e3},
+    "Jupiter Flyby": {"extra_payload": 8000, "parking_altitude": 200e3},
+    "Deep Space": {"extra_payload": 10000, "parking_altitude": 250e3},
+}
+
+
+class VehicleBatch:
+    # Stage tables for many vehicles padded to a common stage count, so one
+    # integration step advances the whole batch.
+    def __init__(self, vehicles, profiles):
+        n = len(vehicles)
+        stages = max(len(v["stages"]) for v in vehicles)
+        self.count = n
+        self.stage_count = np.array([len(v["stages"]) for v in vehicles])
+        self.propellant = np.zeros((n, stages))
+        self.dry = np.zeros((n, stages))
+        self.thrust = np.zeros((n, stages))
+        self.mdot = np.zeros((n, stages))
+        for i, vehicle in enumerate(vehicles):
+            for j, stage in enumerate(vehicle["stages"]):
+                self.propellant[i, j] = stage["propellant"]
+                self.dry[i, j] = stage["dry"]
+                self.thrust[i, j] = stage["thrust"]
+                self.mdot[i, j] = stage["thrust"] / (stage["isp"] * G0)
+        payload = np.array([v["payload"] + p["extra_payload"] for v, p in zip(vehicles, profiles)], dtype=float)
+        # Mass carried above each stage: payload plus every later stage, full.
+        full = self.propellant + self.dry
+        self.above = payload[:, None] + np.cumsum(full[:, ::-1], axis=1)[:, ::-1] - full
+        self.cda = np.array([v["drag_area"] * v["drag_coefficient"] for v in vehicles])
+        self.target_altitude = np.array([p["parking_altitude"] for p in profiles])
+        self.max_thrust = self.thrust.max(axis=1)
+
+
+def simulate_ascent(vehicles, profiles, dt=2.0, duration=600.0, max_g=4.0):
+    # Classic RK4 over a whole batch of vehicles at once, in planar polar
+    # coordinates around a spherical, non-rotating Earth: inverse-square gravity,
+    # an exponential atmosphere, staging when a stage runs dry and a throttle
+    # cap at `max_g`. Returns a dict of (steps, vehicles) arrays sampled every
+    # `dt` seconds plus each vehicle's burnout time.
+    batch = VehicleBatch(vehicles, profiles)
+    n = batch.count
+    rows = np.arange(n)
+    stage = np.zeros(n, dtype=int)
+    state = np.zeros((5, n))
+    state[0] = R_EARTH
+    state[4] = batch.propellant[:, 0]
+
+    def derivatives(state, thrust, mdot, base_mass):
+        r, _, vr, vt, propellant = state
+        burning = propellant > 0
+        mass = base_mass + np.maximum(propellant, 0)
+        altitude = r - R_EARTH
+        throttle = np.minimum(1.0, max_g * G0 * mass / np.maximum(thrust, 1.0))
+        force = np.where(burning, thrust * throttle, 0.0)
+        speed = np.hypot(vr, vt)
+        # Guidance: steer for a climb rate that tapers to zero at the parking
+        # altitude and spend whatever thrust is left on horizontal speed.
+        climb_rate = np.clip((batch.target_altitude - altitude) / CLIMB_TIME_CONSTANT, -MAX_CLIMB_RATE, MAX_CLIMB_RATE)
+        gravity = MU_EARTH / (r * r) - vt * vt / r
+        needed = gravity + (climb_rate - vr) / STEERING_TIME_CONSTANT
+        pitch = np.arcsin(np.clip(needed * mass / np.maximum(force, 1.0), 0.0, 1.0))
+        pitch = np.where(altitude < 1000.0, np.pi / 2, pitch)
+        density = RHO_SEA_LEVEL * np.exp(-np.maximum(altitude, 0.0) / SCALE_HEIGHT)
+        drag = 0.5 * density * speed * batch.cda
+        ar = (force * np.sin(pitch) - drag * vr) / mass - MU_EARTH / (r * r) + vt * vt / r
+        at = (force * np.cos(pitch) - drag * vt) / mass - vr * vt / r
+        return np.stack([vr, vt / r, ar, at, -np.where(burning, mdot * throttle, 0.0)])
+
+    steps = int(duration / dt)
+    record = {key: np.zeros((steps + 1, n)) for key in
+              ("time", "altitude", "downrange", "speed", "thrust", "gravity", "mass", "stage")}
+    burnout = np.full(n, duration)
+
+    for step in range(steps + 1):
+        active = stage < batch.stage_count
+        safe_stage = np.minimum(stage, batch.stage_count - 1)
+        thrust = np.where(active, batch.thrust[rows, safe_stage], 0.0)
+        mdot = np.where(active, batch.mdot[rows, safe_stage], 0.0)
+        base_mass = np.where(active, batch.above[rows, safe_stage] + batch.dry[rows, safe_stage],
+                             batch.above[rows, -1])
+
+        r, phi, vr, vt, propellant = state
+        force_now = np.where(active & (propellant > 0), thrust, 0.0)
+        record["time"][step] = step * dt
+        record["altitude"][step] = r - R_EARTH
+        record["downrange"][step] = phi * R_EARTH
+        record["speed"][step] = np.hypot(vr, vt)
+        record["thrust"][step] = force_now / batch.max_thrust
+        record["gravity"][step] = MU_EARTH / (r * r)
+        record["mass"][step] = base_mass + np.maximum(propellant, 0)
+        record["stage"][step] = stage
+        if step == steps:
+            break
+
+        k1 = derivatives(state, thrust, mdot, base_mass)
+        k2 = derivatives(state + 0.5 * dt * k1, thrust, mdot, base_mass)
+        k3 = derivatives(state + 0.5 * dt * k2, thrust, mdot, base_mass)
+        k4 = derivatives(state + dt * k3, thrust, mdot, base_mass)
+        state = state + dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        grounded = state[0] < R_EARTH
+        state[0] = np.where(grounded, R_EARTH, state[0])
+        state[2] = np.where(grounded, np.maximum(state[2], 0.0), state[2])
+
+        spent = active & (state[4] <= 0)
+        if spent.any():
+            stage = stage + spent
+            next_stage = np.minimum(stage, batch.stage_count - 1)
+            refill = spent & (stage < batch.stage_count)
+            state[4] = np.where(refill, batch.propellant[rows, next_stage], state[4])
+            finished = spent & (stage >= batch.stage_count)
+            burnout = np.where(finished & (burnout == duration), (step + 1) * dt, burnout)
+
+    record["burnout"] = burnout
+    return record
+
+
+def simulate_mission(ship_id, mission, dt=2.0, duration=600.0):
+    # Single-vehicle convenience wrapper returning 1-D arrays.
+    record = simulate_ascent([VEHICLES[ship_id]], [MISSION_PROFILES[mission]], dt=dt, duration=duration)
+    return {key: value[..., 0] if value.ndim == 2 else value[0] for key, value in record.items()}
@@ -0,0 +1,73 @@
+import threading
+
+IDLE_POLL_MS = 100  # how soon a post from another thread is noticed while no frames are running
+
+
+class UIUpdateBus:
+    # Widget option writes, posted from any thread and applied on the Tk thread
+    # once per frame. Pending writes are keyed by (widget, option), so only the
+    # latest value of each property survives to the frame, and a write that
+    # matches what was last applied never reaches Tk. Posts from the Tk thread
+    # schedule a drain on the FrameScheduler; posts from other threads only touch
+    # the locked dict and are picked up by a slow after() poll, since Tk calls
+    # are not safe off the Tk thread. Widgets written through the bus should not
+    # also be configured directly, or the last-applied cache goes stale.
+    def __init__(self, root, scheduler):
+        self.root = root
+        self.scheduler = scheduler
+        self.tk_thread = threading.get_ident()
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.applied = {}
+        self.scheduled = False
+        self.stats = {"posted": 0, "coalesced": 0, "unchanged": 0, "applied": 0, "drains": 0}
+        self.poll_job = root.after(IDLE_POLL_MS, self.poll)
+
+    def post(self, widget, **options):
+        with self.lock:
+            for option, value in options.items():
+                if (widget, option) in self.pending:
+                    self.stats["coalesced"] += 1
+                self.pending[widget, option] = value
+            self.stats["posted"] += len(options)
+            if self.scheduled or threading.get_ident() != self.tk_thread:
+                return
+            self.scheduled = True
+        self.scheduler.add_frame_callback(self.drain)
+
+    def poll(self):
+        with self.lock:
+            wake = bool(self.pending) and not self.scheduled
+            self.scheduled = self.scheduled or wake
+        if wake:
+            self.scheduler.add_frame_callback(self.drain)
+        self.poll_job = self.root.after(IDLE_POLL_MS, self.poll)
+
+    def drain(self):
+        self.scheduler.remove_frame_callback(self.drain)
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.scheduled = False
+        changes = {}
+        for (widget, option), value in pending.items():
+            if self.applied.get((widget, option), self) == value:
+                self.stats["unchanged"] += 1
+                continue
+            self.applied[widget, option] = value
+            changes.setdefault(widget, {})[option] = value
+        for widget, options in changes.items():
+            # One configure per widget, however many options changed.
+            widget.config(**options)
+            self.stats["applied"] += len(options)
+        self.stats["drains"] += 1
+
+    def flush(self):
+        # Apply pending writes now; Tk thread only.
+        if self.pending:
+            self.drain()
+
+    def close(self):
+        self.root.after_cancel(self.poll_job)
+        self.scheduler.remove_frame_callback(self.drain)
+        with self.lock:
+            self.pending.clear()